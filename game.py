@@ -2,7 +2,11 @@ import pygame
 import random
 import math
 import os
+import threading
 import numpy as np
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from enum import IntEnum
 
 # Initialize Pygame
 pygame.init()
@@ -44,6 +48,49 @@ ROAD_X = (SCREEN_WIDTH - ROAD_WIDTH) // 2
 FINISH_LINE_DISTANCE = 50000  # 50 KM track for balanced gameplay
 LANE_WIDTH = ROAD_WIDTH // 3
 
+# Lane center X positions, indexed by lane (0, 1, 2)
+# Immutable tuple shared by every AI solver - plain int index, no per-instance list
+LANE_POSITIONS = (
+    ROAD_X + LANE_WIDTH // 2,
+    ROAD_X + LANE_WIDTH + LANE_WIDTH // 2,
+    ROAD_X + 2 * LANE_WIDTH + LANE_WIDTH // 2
+)
+
+# (lane, low x, high x) for each lane - an x strictly inside the span is in that lane,
+# precomputed so the lane lookup is a chained compare instead of abs() per lane
+LANE_SPANS = tuple(
+    (lane, lane_x - LANE_WIDTH // 2, lane_x + LANE_WIDTH // 2)
+    for lane, lane_x in enumerate(LANE_POSITIONS)
+)
+
+# Infinity sentinel for the AI min/max scans and alpha-beta bounds (one module constant, no float('inf') per call)
+INF = float('inf')
+
+# Default-font Font objects keyed by point size - loading a Font parses the font file,
+# so every HUD / menu text shares one instance per size instead of building it per frame
+fonts = {}
+
+def get_font(size):
+    """pygame default font at the given size (cached)"""
+    font = fonts.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        fonts[size] = font
+    return font
+
+# Rendered text Surfaces keyed by (size, text, color) - only for fixed labels and small
+# bounded value sets (e.g. km/h readouts), never for free-running numbers like distances
+text_surfaces = {}
+
+def get_text(size, text, color):
+    """Antialiased default-font rendering of text (cached)"""
+    key = (size, text, color)
+    surface = text_surfaces.get(key)
+    if surface is None:
+        surface = get_font(size).render(text, True, color).convert_alpha()
+        text_surfaces[key] = surface
+    return surface
+
 # ============= PROFESSIONAL LAYERED AUDIO SYSTEM =============
 class AudioManager:
     """
@@ -83,6 +130,8 @@ class AudioManager:
         self.siren_playing = False
         self.current_speed_ratio = 0.0
         self.police_distance = 1000
+        self.music_generation = 0  # Bumped on every music change; stale cross-fade threads check it and give up
+        self.music_lock = threading.Lock()  # Held across a generation check/bump and the mixer calls that go with it
         
         # Generate procedural sounds (fallback if no audio files)
         self._generate_procedural_sounds()
@@ -378,50 +427,58 @@ class AudioManager:
             self.channels['skid'].play(self.sounds['skid'])
             self.channels['skid'].set_volume(0.4 * self.sfx_volume * self.master_volume)
     
+    def _crossfade_music(self, fade_ms, filename, volume, loops, message):
+        """Fade out the current track, then start filename once the fade is done (off the main thread)"""
+        with self.music_lock:
+            self.music_generation += 1
+            generation = self.music_generation
+            pygame.mixer.music.fadeout(fade_ms)
+        
+        def switch():
+            pygame.time.wait(fade_ms + 100)
+            music_file = os.path.join(self.sounds_dir, filename)
+            if not os.path.exists(music_file):
+                return
+            with self.music_lock:
+                if generation != self.music_generation:
+                    return  # Another track was requested (or music stopped) while this one was fading in
+                try:
+                    pygame.mixer.music.load(music_file)
+                except pygame.error as e:
+                    print(f"✗ Failed to load {filename}: {e}")
+                    return
+                pygame.mixer.music.set_volume(volume)
+                pygame.mixer.music.play(loops)
+            print(message)
+        
+        threading.Thread(target=switch, daemon=True).start()
+    
     def play_menu_music(self):
         """Play menu theme music"""
         music_file = os.path.join(self.sounds_dir, 'menu_theme.mp3')
-        if os.path.exists(music_file):
+        with self.music_lock:
+            self.music_generation += 1
+            if not os.path.exists(music_file):
+                return
             pygame.mixer.music.load(music_file)
             pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
             pygame.mixer.music.play(-1)
-            print("🎵 Menu music playing")
+        print("🎵 Menu music playing")
     
     def play_game_music(self):
         """Play in-game racing music"""
-        pygame.mixer.music.fadeout(1200)
-        pygame.time.wait(1300)
-        
-        music_file = os.path.join(self.sounds_dir, 'driving_music.mp3')
-        if os.path.exists(music_file):
-            pygame.mixer.music.load(music_file)
-            pygame.mixer.music.set_volume(self.music_volume * self.master_volume * 0.7)
-            pygame.mixer.music.play(-1)
-            print("🎵 Game music playing")
+        self._crossfade_music(1200, 'driving_music.mp3', self.music_volume * self.master_volume * 0.7, -1,
+                              "🎵 Game music playing")
     
     def play_win_music(self):
         """Play victory music"""
-        pygame.mixer.music.fadeout(1000)
-        pygame.time.wait(1100)
-        
-        music_file = os.path.join(self.sounds_dir, 'win_theme.mp3')
-        if os.path.exists(music_file):
-            pygame.mixer.music.load(music_file)
-            pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-            pygame.mixer.music.play()
-            print("🎵 Win music playing")
+        self._crossfade_music(1000, 'win_theme.mp3', self.music_volume * self.master_volume, 0,
+                              "🎵 Win music playing")
     
     def play_lose_music(self):
         """Play defeat music"""
-        pygame.mixer.music.fadeout(1000)
-        pygame.time.wait(1100)
-        
-        music_file = os.path.join(self.sounds_dir, 'lose_theme.mp3')
-        if os.path.exists(music_file):
-            pygame.mixer.music.load(music_file)
-            pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-            pygame.mixer.music.play()
-            print("🎵 Lose music playing")
+        self._crossfade_music(1000, 'lose_theme.mp3', self.music_volume * self.master_volume, 0,
+                              "🎵 Lose music playing")
     
     def stop_all_sounds(self):
         """Stop all sound effects and music"""
@@ -430,7 +487,9 @@ class AudioManager:
         if self.siren_playing:
             self.channels['police_siren'].stop()
             self.siren_playing = False
-        pygame.mixer.music.stop()
+        with self.music_lock:
+            self.music_generation += 1
+            pygame.mixer.music.stop()
 
 # Create global audio manager
 try:
@@ -453,11 +512,7 @@ class FuzzyLogicController:
     """
     
     def __init__(self):
-        self.lane_positions = [
-            ROAD_X + LANE_WIDTH // 2,
-            ROAD_X + LANE_WIDTH + LANE_WIDTH // 2,
-            ROAD_X + 2 * LANE_WIDTH + LANE_WIDTH // 2
-        ]
+        self.lane_positions = LANE_POSITIONS
     
     # ============= MEMBERSHIP FUNCTIONS =============
     
@@ -820,11 +875,15 @@ class FuzzyLogicController:
         min_traffic_distance = 10000
         obstacles_in_lane = 0
         closest_obstacle_speed = 2.0  # Assume slow traffic if unknown
+        lane_has_traffic = [False, False, False]  # For road clearance below
         
+        # ONE pass over traffic: current lane stats + which lanes have traffic ahead
+        vehicle_distance = vehicle.distance
         for car in traffic_cars:
-            if car.lane == current_lane:
-                dist = car.distance - vehicle.distance
-                if 0 < dist < look_ahead:
+            dist = car.distance - vehicle_distance
+            if 0 < dist < look_ahead:
+                lane_has_traffic[car.lane] = True
+                if car.lane == current_lane:
                     obstacles_in_lane += 1
                     if dist < min_traffic_distance:
                         min_traffic_distance = dist
@@ -847,17 +906,7 @@ class FuzzyLogicController:
         opponent_distance = abs(opponent.distance - vehicle.distance) if opponent else 10000
         
         # Count clear lanes for road clearance assessment
-        clear_lanes = 0
-        for lane_idx in range(3):
-            has_traffic = False
-            for car in traffic_cars:
-                if car.lane == lane_idx:
-                    dist = car.distance - vehicle.distance
-                    if 0 < dist < look_ahead:
-                        has_traffic = True
-                        break
-            if not has_traffic:
-                clear_lanes += 1
+        clear_lanes = lane_has_traffic.count(False)
         
         # FUZZIFICATION
         distance_fuzzy = self.fuzzify_distance_to_traffic(min_traffic_distance)
@@ -1007,11 +1056,7 @@ class CSPDecisionMaker:
     """
     
     def __init__(self):
-        self.lane_positions = [
-            ROAD_X + LANE_WIDTH // 2,
-            ROAD_X + LANE_WIDTH + LANE_WIDTH // 2,
-            ROAD_X + 2 * LANE_WIDTH + LANE_WIDTH // 2
-        ]
+        self.lane_positions = LANE_POSITIONS
     
     def solve_lane_decision(self, vehicle, traffic_cars, powerups, opponent=None, 
                            ghost_mode=False, is_police=False):
@@ -1281,9 +1326,9 @@ class CSPDecisionMaker:
     
     def _get_current_lane(self, x_position):
         """Determine which lane a given x position is in"""
-        for i, lane_x in enumerate(self.lane_positions):
-            if abs(x_position - lane_x) < LANE_WIDTH // 2:
-                return i
+        for lane, low_x, high_x in LANE_SPANS:
+            if low_x < x_position < high_x:
+                return lane
         # Default to center lane if unclear
         return 1
 
@@ -1327,11 +1372,7 @@ class AStarPathfinder:
                 - Euclidean: √((Δx)² + (Δdistance)²) (better for direct pursuit)
         """
         self.heuristic_type = heuristic_type
-        self.lane_positions = [
-            ROAD_X + LANE_WIDTH // 2,
-            ROAD_X + LANE_WIDTH + LANE_WIDTH // 2,
-            ROAD_X + 2 * LANE_WIDTH + LANE_WIDTH // 2
-        ]
+        self.lane_positions = LANE_POSITIONS
     
     def manhattan_distance(self, current_lane, current_distance, goal_lane, goal_distance):
         """
@@ -1373,29 +1414,33 @@ class AStarPathfinder:
                 return i
         return 1  # Default to center lane
     
-    def find_clearest_lane(self, current_distance, traffic_cars, look_ahead=600):
+    def find_clearest_lane(self, current_distance, traffic_cars, look_ahead=600, traffic_by_lane=None):
         """
         Find the lane with least traffic ahead.
         Returns (lane_index, traffic_count, min_distance_to_traffic)
+        traffic_by_lane: optional per-frame group_by_lane() of traffic_cars (built here if None)
         """
-        lane_info = []
+        if traffic_by_lane is None:
+            traffic_by_lane = group_by_lane(traffic_cars)
         
-        for lane_idx in range(3):
+        best = None
+        for lane_idx, lane_cars in enumerate(traffic_by_lane):
             traffic_count = 0
-            min_distance = float('inf')
+            min_distance = INF
             
-            for car in traffic_cars:
-                if car.lane == lane_idx:
-                    distance_to_car = car.distance - current_distance
-                    if 0 < distance_to_car < look_ahead:
-                        traffic_count += 1
-                        min_distance = min(min_distance, distance_to_car)
+            for car in lane_cars:
+                distance_to_car = car.distance - current_distance
+                if 0 < distance_to_car < look_ahead:
+                    traffic_count += 1
+                    if distance_to_car < min_distance:
+                        min_distance = distance_to_car
             
-            lane_info.append((lane_idx, traffic_count, min_distance))
+            # Clearest = fewer cars, then greater minimum distance (first lane wins a tie)
+            if (best is None or traffic_count < best[1] or
+                    (traffic_count == best[1] and min_distance > best[2])):
+                best = (lane_idx, traffic_count, min_distance)
         
-        # Sort by: fewer cars, then greater minimum distance
-        lane_info.sort(key=lambda x: (x[1], -x[2]))
-        return lane_info[0]  # Return clearest lane
+        return best  # Return clearest lane
     
     def is_position_safe(self, lane, distance, traffic_cars, opponent=None, ghost_mode=False, vehicle_speed=0):
         """
@@ -1667,12 +1712,95 @@ class AStarPathfinder:
         
         return neighbors
 
+# 1D spatial hash along the track: objects grouped by distance bucket
+# Built once per frame so range queries only touch nearby buckets
+SPATIAL_BUCKET_SIZE = 500
+
+# Car-vs-traffic crash radius in the main loop, and the finer buckets used to find crash candidates
+TRAFFIC_CONTACT_RADIUS = 55
+CONTACT_BUCKET_SIZE = 120
+
+def build_distance_buckets(objects, bucket_size=SPATIAL_BUCKET_SIZE):
+    """Group objects (anything with a .distance) into fixed-size distance buckets"""
+    buckets = {}
+    for obj in objects:
+        buckets.setdefault(int(obj.distance // bucket_size), []).append(obj)
+    return buckets
+
+def query_distance_buckets(buckets, center, radius, bucket_size=SPATIAL_BUCKET_SIZE):
+    """Yield objects from every bucket overlapping [center - radius, center + radius]"""
+    first = int((center - radius) // bucket_size)
+    last = int((center + radius) // bucket_size)
+    for bucket in range(first, last + 1):
+        yield from buckets.get(bucket, ())
+
+def touches_traffic(vehicle, contact_buckets):
+    """True if any traffic car is within TRAFFIC_CONTACT_RADIUS of vehicle (same squared test as the crash pass)"""
+    radius_sq = TRAFFIC_CONTACT_RADIUS * TRAFFIC_CONTACT_RADIUS
+    for car in query_distance_buckets(contact_buckets, vehicle.distance, TRAFFIC_CONTACT_RADIUS, CONTACT_BUCKET_SIZE):
+        dx = vehicle.x - car.x
+        dd = vehicle.distance - car.distance
+        if dx * dx + dd * dd < radius_sq:
+            return True
+    return False
+
+def group_by_lane(objects):
+    """Split objects (anything with a .lane) into per-lane lists (index = lane), keeping their order"""
+    lanes = ([], [], [])
+    for obj in objects:
+        lanes[obj.lane].append(obj)
+    return lanes
+
+# Closest-car-ahead queries bisect a lane's sorted distances instead of scanning its cars
+def build_lane_distances(traffic_by_lane):
+    """Traffic distances per lane (index = lane), each sorted ascending"""
+    return tuple(sorted(car.distance for car in lane_cars) for lane_cars in traffic_by_lane)
+
+def nearest_ahead_gap(sorted_distances, distance):
+    """Gap from distance to the closest car strictly ahead in one lane's sorted distances (INF if none)"""
+    idx = bisect_right(sorted_distances, distance)
+    if idx < len(sorted_distances):
+        return sorted_distances[idx] - distance
+    return INF
+
+def count_ahead(sorted_distances, distance, window):
+    """Number of cars in one lane's sorted distances strictly between distance and distance + window"""
+    return bisect_left(sorted_distances, distance + window) - bisect_right(sorted_distances, distance)
+
+def danger_at(lane_cars, distance, window=80):
+    """True if any car in lane_cars (one lane of traffic_by_lane) sits within window of distance"""
+    for car in lane_cars:
+        if -window < car.distance - distance < window:
+            return True
+    return False
+
+def build_powerup_table(powerups):
+    """Uncollected power-ups split by owner, indexed by for_police: (thief_powerups, police_powerups)"""
+    thief_powerups = []
+    police_powerups = []
+    for p in powerups:
+        if not p.collected:
+            if p.for_police:
+                police_powerups.append(p)
+            else:
+                thief_powerups.append(p)
+    return (thief_powerups, police_powerups)
+
+def closest_lane(lanes, current_lane):
+    """Lane from lanes nearest to current_lane (first one wins a tie)"""
+    return min(lanes, key=lambda lane: abs(lane - current_lane))
+
 # Minimax Algorithm with Alpha-Beta Pruning for Adversarial Decision Making
+
 class GameState:
     """
     Represents a snapshot of the game state for Minimax evaluation.
     Lightweight structure for efficient tree search.
     """
+    # Fixed attribute layout: one node is allocated per simulated move, so skip the per-instance dict
+    __slots__ = ('police_lane', 'police_distance', 'thief_lane', 'thief_distance',
+                 'police_speed', 'thief_speed', 'traffic', 'powerups')
+    
     def __init__(self, police_lane, police_distance, thief_lane, thief_distance,
                  police_speed, thief_speed, traffic_snapshot, powerups_snapshot):
         self.police_lane = police_lane
@@ -1681,20 +1809,23 @@ class GameState:
         self.thief_distance = thief_distance
         self.police_speed = police_speed
         self.thief_speed = thief_speed
-        self.traffic = traffic_snapshot  # List of (lane, distance) for nearby traffic
-        self.powerups = powerups_snapshot  # List of (lane, distance, type, for_police)
+        # Snapshots are immutable tuples of ints, shared by every node in the search tree
+        self.traffic = traffic_snapshot  # Tuple of (lane, distance) for nearby traffic
+        self.powerups = powerups_snapshot  # Tuple of (lane, distance, type, for_police)
         
     def copy(self):
-        """Create a deep copy for simulation"""
+        """Create a copy for simulation (snapshots are never mutated, so they are shared)"""
         return GameState(
             self.police_lane, self.police_distance,
             self.thief_lane, self.thief_distance,
             self.police_speed, self.thief_speed,
-            self.traffic.copy(), self.powerups.copy()
+            self.traffic, self.powerups
         )
 
 class MinimaxAction:
     """Represents a possible action in the game tree"""
+    __slots__ = ('lane', 'speed_change', 'collect_powerup')
+    
     def __init__(self, lane, speed_change, collect_powerup=False):
         self.lane = lane  # Target lane (0, 1, 2)
         self.speed_change = speed_change  # 'accelerate', 'maintain', 'brake'
@@ -1710,13 +1841,43 @@ class MinimaxDecisionMaker:
     """
     
     def __init__(self):
-        self.lane_positions = [
-            ROAD_X + LANE_WIDTH // 2,
-            ROAD_X + LANE_WIDTH + LANE_WIDTH // 2,
-            ROAD_X + 2 * LANE_WIDTH + LANE_WIDTH // 2
-        ]
+        self.lane_positions = LANE_POSITIONS
         self.max_depth = 3  # Search depth (3 ply = 3 moves ahead)
         self.nodes_evaluated = 0  # For performance tracking
+        
+        # Transposition table: quantized state key -> best action (LRU, bounded)
+        # Consecutive frames produce near-identical states, so reuse the search result
+        self.transposition_table = OrderedDict()
+        self.max_table_size = 512
+        self.cache_hits = 0  # For performance tracking
+    
+    def get_cached_best_move(self, state_key, current_state, is_police, max_time_ms=15):
+        """
+        Memoized get_best_move(): returns the stored action for state_key if present,
+        otherwise runs the full search and remembers the result.
+        
+        Args:
+            state_key: Hashable quantized description of the position (must include is_police)
+            current_state: Current GameState (only used on a cache miss)
+            is_police: True if police's turn, False if thief's turn
+            max_time_ms: Maximum computation time on a cache miss
+        """
+        table = self.transposition_table
+        best_action = table.get(state_key)
+        if best_action is not None:
+            table.move_to_end(state_key)  # Mark as recently used
+            self.cache_hits += 1
+            return best_action
+        
+        best_action = self.get_best_move(current_state, is_police, max_time_ms)
+        table[state_key] = best_action
+        if len(table) > self.max_table_size:
+            table.popitem(last=False)  # Evict least recently used
+        return best_action
+    
+    def clear_cache(self):
+        """Drop all memoized moves (call when the situation changes abruptly)"""
+        self.transposition_table.clear()
     
     def get_best_move(self, current_state, is_police, max_time_ms=15):
         """
@@ -1735,9 +1896,9 @@ class MinimaxDecisionMaker:
         self.max_time = max_time_ms
         
         best_action = None
-        best_value = float('-inf') if is_police else float('inf')
-        alpha = float('-inf')
-        beta = float('inf')
+        best_value = -INF if is_police else INF
+        alpha = -INF
+        beta = INF
         
         # Generate all possible actions
         possible_actions = self._generate_actions(current_state, is_police)
@@ -1793,7 +1954,7 @@ class MinimaxDecisionMaker:
         
         if maximizing_player:
             # Police's turn (maximize score)
-            max_eval = float('-inf')
+            max_eval = -INF
             possible_actions = self._generate_actions(state, is_police=True)
             
             for action in possible_actions:
@@ -1809,7 +1970,7 @@ class MinimaxDecisionMaker:
         
         else:
             # Thief's turn (minimize score)
-            min_eval = float('inf')
+            min_eval = INF
             possible_actions = self._generate_actions(state, is_police=False)
             
             for action in possible_actions:
@@ -1864,29 +2025,33 @@ class MinimaxDecisionMaker:
         score += speed_diff * 50  # Bonus if police faster
         
         # TRAFFIC FACTOR: IMPROVED collision avoidance
-        # Check immediate traffic danger for police (critical!)
+        # Single pass over traffic: police danger counts, thief blockers and police lane clearance
+        police_lane = state.police_lane
+        police_distance = state.police_distance
+        thief_lane = state.thief_lane
+        thief_distance = state.thief_distance
         police_immediate_traffic = 0
         police_near_traffic = 0
+        thief_traffic_ahead = 0
+        police_lane_clear = True
         for traffic_lane, traffic_dist in state.traffic:
-            if traffic_lane == state.police_lane:
-                dist_to_traffic = traffic_dist - state.police_distance
+            if traffic_lane == police_lane:
+                dist_to_traffic = traffic_dist - police_distance
                 if 0 < dist_to_traffic < 150:
                     police_immediate_traffic += 1  # CRITICAL: collision imminent
                 elif 0 < dist_to_traffic < 300:
                     police_near_traffic += 1  # Close traffic
+                if -400 < dist_to_traffic < 400:
+                    police_lane_clear = False
+            if traffic_lane == thief_lane:
+                if 0 < traffic_dist - thief_distance < 300:
+                    thief_traffic_ahead += 1
         
         # MASSIVE penalties for traffic collisions
         score -= police_immediate_traffic * 800  # Must avoid collision!
         score -= police_near_traffic * 200  # Avoid close traffic
         
         # Thief trapped by traffic is good for police
-        thief_traffic_ahead = 0
-        for traffic_lane, traffic_dist in state.traffic:
-            if traffic_lane == state.thief_lane:
-                dist_to_traffic = traffic_dist - state.thief_distance
-                if 0 < dist_to_traffic < 300:
-                    thief_traffic_ahead += 1
-        
         score += thief_traffic_ahead * 80  # Bonus for blocking thief
         
         # POWER-UP FACTOR: Strategic power-up positioning
@@ -1898,7 +2063,7 @@ class MinimaxDecisionMaker:
                 dist_to_police = abs(pw_dist - state.police_distance)
                 if dist_to_police < 200:
                     # Police can get useful power-up
-                    if pw_type in ['turbo', 'emp']:
+                    if pw_type in ('turbo', 'emp'):
                         score += 200 - dist_to_police  # High value powers
                     else:
                         score += 100 - dist_to_police
@@ -1906,7 +2071,7 @@ class MinimaxDecisionMaker:
                 # Thief power-up evaluation (bad for police)
                 dist_to_thief = abs(pw_dist - state.thief_distance)
                 if dist_to_thief < 200:
-                    if pw_type in ['freeze', 'boost', 'ghost']:
+                    if pw_type in ('freeze', 'boost', 'ghost'):
                         score -= 250 - dist_to_thief  # Dangerous for police
                     else:
                         score -= 120 - dist_to_thief
@@ -1917,15 +2082,7 @@ class MinimaxDecisionMaker:
             # Endgame urgency
             score -= (5000 - distance_to_finish) * 2
         
-        # LANE CLEARANCE BONUS: Reward being in clear lanes
-        police_lane_clear = True
-        for traffic_lane, traffic_dist in state.traffic:
-            if traffic_lane == state.police_lane:
-                dist_to_traffic = abs(traffic_dist - state.police_distance)
-                if dist_to_traffic < 400:
-                    police_lane_clear = False
-                    break
-        
+        # LANE CLEARANCE BONUS: Reward being in clear lanes (computed in the traffic pass)
         if police_lane_clear:
             score += 150  # Bonus for clear lane
         
@@ -2065,7 +2222,33 @@ class MinimaxDecisionMaker:
 # Particle system
 particles = []
 
+# A particle lives 30 frames and only falls (vy 1..4, +0.2 per frame), ~210px at most,
+# so one spawned further than this above the screen never shows up
+PARTICLE_FALL_MARGIN = 260
+
+def rand_int(lo, hi, _random=random.random):
+    """Uniform int in [lo, hi] like random.randint, minus its argument checks (per-frame effect jitter)"""
+    return lo + int(_random() * (hi - lo + 1))
+
+# Faded particle circles keyed by (color, size, life) - particle colors are a fixed handful,
+# sizes 2-5 and life 1-30, so this stays small and no particle builds a Surface per frame
+particle_sprites = {}
+
+def get_particle_sprite(color, size, life):
+    """Faded particle circle for (color, size, life) (cached)"""
+    key = (color, size, life)
+    sprite = particle_sprites.get(key)
+    if sprite is None:
+        alpha = int(255 * (life / 30))
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(sprite, (*color, alpha), (size, size), size)
+        particle_sprites[key] = sprite
+    return sprite
+
 class Particle:
+    # Fixed attribute layout: crashes and boosts spawn hundreds of these
+    __slots__ = ('x', 'y', 'vx', 'vy', 'color', 'life', 'size')
+    
     def __init__(self, x, y, color):
         self.x = x
         self.y = y
@@ -2073,7 +2256,7 @@ class Particle:
         self.vy = random.uniform(1, 4)
         self.color = color
         self.life = 30
-        self.size = random.randint(2, 5)
+        self.size = rand_int(2, 5)
         
     def update(self):
         self.x += self.vx
@@ -2081,16 +2264,55 @@ class Particle:
         self.life -= 1
         self.vy += 0.2
         
+    def sprite_blit(self):
+        """(sprite, position) pair for a batched screen.blits() call"""
+        size = self.size
+        return get_particle_sprite(self.color, size, self.life), (int(self.x - size), int(self.y - size))
+    
     def draw(self, screen):
         if self.life > 0:
-            alpha = int(255 * (self.life / 30))
-            color_with_alpha = (*self.color, alpha)
-            s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, color_with_alpha, (self.size, self.size), self.size)
-            screen.blit(s, (int(self.x - self.size), int(self.y - self.size)))
+            screen.blit(*self.sprite_blit())
+
+# Per-particle color palettes for emit_burst (module-level so a burst doesn't build a list)
+ROADBLOCK_HIT_COLORS = (RED, ORANGE, YELLOW)
+CRASH_COLORS = (ORANGE, YELLOW, RED)
+
+def emit_burst(x, y, color, count, spread, spread_y=None):
+    """Spawn count particles scattered within +/-spread px (x) and +/-spread_y px (y, default spread) of (x, y)
+    
+    color is one RGB tuple, or a tuple of them to pick from per particle. Offsets and picks are drawn in numpy batches.
+    """
+    if spread_y is None:
+        spread_y = spread
+    dxs = np.random.randint(-spread, spread + 1, count).tolist()
+    dys = np.random.randint(-spread_y, spread_y + 1, count).tolist()
+    if isinstance(color[0], tuple):
+        colors = [color[pick] for pick in np.random.randint(0, len(color), count).tolist()]
+    else:
+        colors = (color,) * count
+    particles.extend(Particle(x + dx, y + dy, particle_color) for dx, dy, particle_color in zip(dxs, dys, colors))
 
 class PowerUp:
     """Collectible power-ups on the road"""
+    
+    # Power-up priority values (higher = more valuable)
+    # Balanced to favor defensive & positioning powers over game-breaking ones
+    priority = {
+        'boost': 1.2,      # Moderate priority - speed advantage
+        'shield': 1.4,     # High priority - crash protection
+        'ghost': 1.5,      # Highest priority - mistake forgiveness
+        'freeze': 1.0,     # Base priority - temporary hindrance
+        'turbo': 1.2,      # Moderate priority - speed advantage
+        'spike': 1.1,      # Low-moderate priority - slow effect
+        'emp': 1.3,        # High priority - speed + steering hindrance
+        'magnet': 1.4,     # High priority - positioning control
+        'roadblock': 1.0   # Base priority - situational use
+    }
+    
+    # Fixed attribute layout: the AI scans every power-up each frame, so skip the per-instance dict
+    __slots__ = ('lane', 'distance', 'power_type', 'for_police', 'width', 'height',
+                 'collected', 'rotation', 'types', 'priority_value')
+    
     def __init__(self, lane, distance, power_type, for_police=False):
         self.lane = lane
         self.distance = distance
@@ -2116,23 +2338,12 @@ class PowerUp:
             'magnet': {'color': (150, 150, 255), 'icon': '🧲', 'name': 'Magnetic Pull'}
         }
         
-        # Power-up priority values (higher = more valuable)
-        # Balanced to favor defensive & positioning powers over game-breaking ones
-        self.priority = {
-            'boost': 1.2,      # Moderate priority - speed advantage
-            'shield': 1.4,     # High priority - crash protection
-            'ghost': 1.5,      # Highest priority - mistake forgiveness
-            'freeze': 1.0,     # Base priority - temporary hindrance
-            'turbo': 1.2,      # Moderate priority - speed advantage
-            'spike': 1.1,      # Low-moderate priority - slow effect
-            'emp': 1.3,        # High priority - speed + steering hindrance
-            'magnet': 1.4,     # High priority - positioning control
-            'roadblock': 1.0   # Base priority - situational use
-        }
+        # Priority never changes for a power-up, so look it up once at spawn
+        self.priority_value = self.priority.get(power_type, 1.0)
     
     def get_priority_value(self):
         """Get the priority value for this power-up type"""
-        return self.priority.get(self.power_type, 1.0)
+        return self.priority_value
     
     def update(self, camera_offset):
         """Update power-up animation"""
@@ -2197,7 +2408,7 @@ class PowerUp:
                 pygame.draw.polygon(screen, props['color'], inner_points)
                 
                 # Add "POLICE" label below
-                font_label = pygame.font.Font(None, 22)
+                font_label = get_font(22)
                 label_text = font_label.render("POLICE", True, (255, 255, 255))
                 label_bg = pygame.Surface((label_text.get_width() + 8, label_text.get_height() + 4), pygame.SRCALPHA)
                 pygame.draw.rect(label_bg, (0, 100, 200, 220), label_bg.get_rect(), border_radius=3)  # Blue label
@@ -2213,7 +2424,7 @@ class PowerUp:
                 pygame.draw.circle(screen, props['color'], (int(lane_x), int(final_y)), size//2 - 8)
                 
                 # Add "THIEF" label below
-                font_label = pygame.font.Font(None, 22)
+                font_label = get_font(22)
                 label_text = font_label.render("THIEF", True, (255, 255, 255))
                 label_bg = pygame.Surface((label_text.get_width() + 8, label_text.get_height() + 4), pygame.SRCALPHA)
                 pygame.draw.rect(label_bg, (200, 0, 0, 220), label_bg.get_rect(), border_radius=3)  # Red label
@@ -2221,7 +2432,7 @@ class PowerUp:
                 screen.blit(label_text, (int(lane_x - label_text.get_width()//2), int(final_y + size//2 + 10)))
             
             # Draw icon (LARGER)
-            font_icon = pygame.font.Font(None, 42)
+            font_icon = get_font(42)
             icon_text = font_icon.render(props['icon'], True, WHITE)
             icon_rect = icon_text.get_rect(center=(int(lane_x), int(final_y)))
             screen.blit(icon_text, icon_rect)
@@ -2247,20 +2458,204 @@ class PowerUp:
         lane_x = ROAD_X + self.lane * LANE_WIDTH + LANE_WIDTH // 2
         screen_y = SCREEN_HEIGHT // 2 - (self.distance - camera_offset)
         
-        # Simple circle collision
-        dist = math.sqrt((player_x - lane_x)**2 + (player_y - screen_y)**2)
-        if dist < (self.width//2 + player_width//2):
+        # Simple circle collision (squared distances, no sqrt)
+        dx = player_x - lane_x
+        dy = player_y - screen_y
+        reach = self.width//2 + player_width//2
+        if dx * dx + dy * dy < reach * reach:
             self.collected = True
             return True
         return False
 
+# Safety urgency levels reported by predictive_safety_check (ordered, compare with < / >=)
+
+class Urgency(IntEnum):
+    NONE = 0
+    LOW = 1
+    MODERATE = 2
+    HIGH = 3
+    CRITICAL = 4
+
+# Emergency brake tiers: (brake_rate multiplier, minimum speed ratio)
+# Indexed by tier: 0 = critical, 1 = strong, 2 = moderate
+EMERGENCY_BRAKE_TIERS = (
+    (2.0, 0.25),
+    (1.5, 0.40),
+    (1.0, 0.55)
+)
+
+# Fuzzy speed tiers: (is_brake, rate multiplier, minimum speed ratio), None = maintain
+# Indexed by tier: 0 = hard brake, 1 = light brake, 2 = maintain, 3 = light accel, 4 = hard accel
+FUZZY_SPEED_TIERS = (
+    (True, 1.5, 0.35),
+    (True, 0.8, 0.55),
+    None,
+    (False, 0.8, 0.0),
+    (False, 1.4, 0.0)
+)
+
+# Thief high alert (police within 400): less braking, more boost
+FUZZY_ESCAPE_SPEED_TIERS = (
+    (True, 1.0, 0.50),
+    (True, 0.5, 0.65),
+    None,
+    (False, 1.2, 0.0),
+    (False, 1.6, 0.0)
+)
+
+# Fuzzy cruise target (no speed action, not escaping) as a ratio of max speed by clear road ahead
+# Indexed by tier: 0 = <= 250, 1 = <= 400, 2 = <= 600, 3 = further
+FUZZY_CRUISE_SPEED_RATIOS = (0.70, 0.85, 0.95, 1.0)
+
+# Fuzzy power-up collection bonus by distance ahead
+# Indexed by tier: 0 = < 150, 1 = < 300, 2 = < 450, 3 = further
+POWERUP_DISTANCE_BONUS = (60, 40, 25, 15)
+
+# A* obstacle braking: (brake_rate multiplier, minimum speed ratio) by distance to closest obstacle
+# Indexed by tier: 0 = < 120 (emergency), 1 = < 200, 2 = < 300, 3 = < 450, 4 = further
+ASTAR_OBSTACLE_BRAKE_TIERS = (
+    (2.5, 0.3),
+    (1.8, 0.5),
+    (1.2, 0.65),
+    (0.7, 0.80),
+    (0.3, 0.90)
+)
+
+# Safety-influenced braking: (brake_rate multiplier, minimum speed ratio), None = no brake
+# Indexed by tier: 0 = no brake, 1 = light (> 0), 2 = moderate (> 0.3), 3 = strong (> 0.6)
+SAFETY_INFLUENCE_BRAKE_TIERS = (
+    None,
+    (0.4, 0.75),
+    (0.8, 0.60),
+    (1.3, 0.40)
+)
+
+# A* police catch zones (thief < 150 ahead): (thief speed multiplier, max speed ratio cap,
+# brake_rate multiplier, acceleration_rate multiplier or None = never accelerate, snap up to target)
+# Indexed by zone: 0 = < 50 (catch), 1 = < 100 (match speed), 2 = < 150 (slow approach)
+POLICE_CATCH_ZONES = (
+    (0.7, 0.5, 1.5, None),
+    (1.0, 0.85, 1.0, 0.5),
+    (1.1, 0.9, 0.7, 0.8)
+)
+
+# Power-up categories used by the AI power-up scoring
+DEFENSIVE_POWERS = frozenset(('freeze', 'shield', 'ghost'))  # Thief survival powers
+ESCAPE_POWERS = frozenset(('boost', 'turbo'))  # Thief speed powers
+HIGH_VALUE_POWERS = frozenset(('ghost', 'shield', 'emp', 'magnet'))
+CATCH_POWERS = frozenset(('emp', 'spike', 'magnet'))  # Police, thief very close
+PURSUIT_POWERS = frozenset(('emp', 'turbo', 'magnet'))  # Police, thief in range
+
+# Glow layer Surfaces keyed by (side, rgba color, radius, outline width), built on first use
+# Shield/ghost radii are whole pixels and headlight/siren glows are fixed, so the set stays small
+glow_surfaces = {}
+
+def get_glow_surface(side, color, radius, width=0):
+    """Transparent side x side Surface with a circle of radius centered in it (cached)"""
+    key = (side, color, radius, width)
+    surface = glow_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface((side, side), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (side // 2, side // 2), radius, width)
+        surface = surface.convert_alpha()
+        glow_surfaces[key] = surface
+    return surface
+
+# Wheel sprites (dark tyre + lighter hub) keyed by (tyre radius, hub radius), built on first use
+wheel_sprites = {}
+
+def get_wheel_sprite(radius, hub_radius):
+    """Transparent Surface with a wheel centered at (radius, radius) - blit at center - radius (cached)"""
+    key = (radius, hub_radius)
+    sprite = wheel_sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (40, 40, 40), (radius, radius), radius)
+        pygame.draw.circle(sprite, (80, 80, 80), (radius, radius), hub_radius)
+        sprite = sprite.convert_alpha()
+        wheel_sprites[key] = sprite
+    return sprite
+
+# Translucent rounded panels (windshields, HUD backdrops) and drop shadows, keyed by
+# shape + size + color, built on first use - these used to be identical per-frame allocations
+translucent_surfaces = {}
+
+def get_rounded_panel(width, height, color, border_radius):
+    """Rounded translucent rectangle filling a width x height Surface (cached)"""
+    key = ('panel', width, height, color, border_radius)
+    surface = translucent_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=border_radius)
+        surface = surface.convert_alpha()
+        translucent_surfaces[key] = surface
+    return surface
+
+def get_shadow_surface(width, height, color):
+    """Translucent ellipse filling a width x height Surface (cached)"""
+    key = ('shadow', width, height, color)
+    surface = translucent_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.ellipse(surface, color, surface.get_rect())
+        surface = surface.convert_alpha()
+        translucent_surfaces[key] = surface
+    return surface
+
+# Lightened / darkened colors keyed by (color, +/-amount) - only a handful of colors ever get shaded
+lightened_colors = {}
+
+def lighten(color, amount):
+    """color with amount added to every channel, capped at 255 (cached)"""
+    key = (color, amount)
+    result = lightened_colors.get(key)
+    if result is None:
+        result = tuple(min(c + amount, 255) for c in color)
+        lightened_colors[key] = result
+    return result
+
+def darken(color, amount):
+    """color with amount taken off every channel, floored at 0 (cached alongside lighten)"""
+    key = (color, -amount)
+    result = lightened_colors.get(key)
+    if result is None:
+        result = tuple(max(0, c - amount) for c in color)
+        lightened_colors[key] = result
+    return result
+
+# Rotated crash body Surfaces keyed by (color, width, height, angle), built on first use
+# crash_spin is +/-15 and crash_timer counts 60..1, so a crash only ever needs ~120 angles
+crash_frames = {}
+
+def get_crash_frame(color, width, height, angle):
+    """Vehicle body rectangle on a 20px transparent margin, rotated by angle (cached)"""
+    key = (color, width, height, angle)
+    frame = crash_frames.get(key)
+    if frame is None:
+        temp_surface = pygame.Surface((width + 40, height + 40), pygame.SRCALPHA)
+        pygame.draw.rect(temp_surface, color, (20, 20, width, height), border_radius=10)
+        frame = pygame.transform.rotate(temp_surface, angle).convert_alpha()
+        crash_frames[key] = frame
+    return frame
+
+# Pre-rolled crash spark offsets/radii, walked as a ring buffer instead of 9 randint calls per frame
+SPARK_POOL_SIZE = 1024
+SPARK_OFFSETS = np.random.randint(-20, 21, size=(SPARK_POOL_SIZE, 2)).tolist()
+SPARK_RADII = np.random.randint(2, 6, size=SPARK_POOL_SIZE).tolist()
+
 class Vehicle:
+    # FuzzyLogicController for lane lookups in the CSP / minimax / A* safety layer
+    # Stateless, so one lazily created instance is shared by every vehicle
+    _shared_fuzzy = None
+    
     def __init__(self, x, y, color, is_player=False, is_police=False):
         self.x = x
         self.y = y
         self.color = color
         self.width = 50
         self.height = 90
+        self.half_width = self.width // 2  # Size never changes, so halve once for draw()
+        self.half_height = self.height // 2
         self.speed = 0
         
         # SPEED LIMIT: 200 km/h maximum for both characters
@@ -2299,6 +2694,36 @@ class Vehicle:
         self.crashed = False
         self.crash_timer = 0
         self.crash_spin = 0
+        self.spark_index = 0  # position in the SPARK_OFFSETS ring
+        
+        # Reusable result dict for predictive_safety_check (mutated in place every call)
+        self._safety_scratch = {
+            'danger_detected': False,
+            'time_to_collision': INF,
+            'current_lane': 1,
+            'current_lane_safe': True,
+            'current_lane_risk': 0,
+            'safe_lanes': [],
+            'lane_analysis': None,
+            'recommended_action': {
+                'brake_intensity': 0.0,
+                'should_change_lane': False,
+                'target_lanes': [],
+                'urgency': Urgency.NONE
+            },
+            'prediction_frames': 0,
+            'predicted_distance': 0
+        }
+        
+        # AI tick counter (bumped once per priority_decision_hierarchy call)
+        # Safety scan runs every 2nd tick, minimax re-plans every 3rd tick (both every tick in high danger)
+        self._ai_tick = 0
+        self._safety_tick = -1  # Tick of the last real predictive_safety_check
+        self._minimax_tick = -3  # Tick of the last minimax search
+        self._minimax_action = None  # Action reused between minimax searches
+        self._minimax_danger = False  # Safety danger flag the memoized minimax plans were made under
+        self._fuzzy_plan_tick = -4  # Tick of the last fuzzy lane / power-up planning pass
+        self._fuzzy_plan = None  # Planned (target_x, steering_speed) moves reused between passes
     
     def check_sharp_steering(self):
         """Detect sharp steering and play skid sound"""
@@ -2322,14 +2747,19 @@ class Vehicle:
     
     def enforce_speed_limit(self):
         """Enforce the absolute 200 km/h speed limit"""
-        if self.speed > self.ABSOLUTE_MAX_SPEED:
-            self.speed = self.ABSOLUTE_MAX_SPEED
-        # Also enforce max_speed (which can be modified by power-ups)
-        if self.speed > self.max_speed:
-            self.speed = self.max_speed
+        # Also enforce max_speed (which can be modified by power-ups) - one compare against the lower cap
+        speed_cap = self.max_speed
+        if speed_cap > self.ABSOLUTE_MAX_SPEED:
+            speed_cap = self.ABSOLUTE_MAX_SPEED
+        if self.speed > speed_cap:
+            self.speed = speed_cap
         self.crash_timer = 0
         self.crash_spin = 0
     
+    def _adjust_speed(self, delta, floor_ratio=0.0):
+        """Change speed by delta, clamped to [max_speed * floor_ratio, max_speed]"""
+        self.speed = min(max(self.speed + delta, self.max_speed * floor_ratio), self.max_speed)
+    
     def crash(self):
         """Handle vehicle crash"""
         self.crashed = True
@@ -2357,10 +2787,11 @@ class Vehicle:
         Returns:
             bool: True if lane is safe, False if traffic detected
         """
+        my_distance = self.distance
         for car in traffic_cars:
             if car.lane == target_lane:
                 # Calculate relative distance to traffic car
-                relative_distance = car.distance - self.distance
+                relative_distance = car.distance - my_distance
                 
                 # Check if traffic is in our lookahead range
                 if 0 < relative_distance < lookahead:
@@ -2378,7 +2809,7 @@ class Vehicle:
         Args:
             powers: List of available power-ups
             traffic_cars: List of traffic cars for safety check
-            lane_positions: Dictionary mapping lane index to X position
+            lane_positions: Tuple of lane center X positions indexed by lane
             
         Returns:
             PowerUp object or None if no good option exists
@@ -2405,7 +2836,7 @@ class Vehicle:
                 continue
             
             # Get power-up priority value (1.0 to 1.5)
-            value = p.get_priority_value()
+            value = p.priority_value
             
             # Closeness factor (closer = better)
             closeness = 1.0 / (dist + 1)
@@ -2424,7 +2855,9 @@ class Vehicle:
         return best_power
     
     def priority_decision_hierarchy(self, traffic_cars, powerups, opponent, ghost_mode,
-                                   fuzzy_controller, minimax_solver, astar_pathfinder):
+                                   fuzzy_controller, minimax_solver, astar_pathfinder,
+                                   traffic_buckets=None, powerup_buckets=None, powerup_table=None,
+                                   traffic_by_lane=None, lane_distances=None):
         """
         ======================================================================
         PRIORITY DECISION HIERARCHY - ENHANCED WITH POWER COLLECTION
@@ -2447,14 +2880,30 @@ class Vehicle:
         Power collection only happens when safe.
         ======================================================================
         """
+        # Road boundaries as locals (avoid repeated global lookups in the hot path)
+        left_bound = ROAD_X + 35
+        right_bound = ROAD_X + ROAD_WIDTH - 35
+        
         if self.crashed:
             return
         
+        self._ai_tick += 1
+        
+        # Only this vehicle's uncollected power-ups matter to micro-steering, fuzzy and A*
+        # (minimax still gets the full list - it scores the opponent's power-ups too)
+        if powerup_table is None:
+            powerup_table = build_powerup_table(powerups)
+        own_powerups = powerup_table[self.is_police]
+        if traffic_by_lane is None:
+            traffic_by_lane = group_by_lane(traffic_cars)
+        if lane_distances is None:
+            lane_distances = build_lane_distances(traffic_by_lane)
+        
         # ===== PRIORITY 1: SAFETY LAYER (ALWAYS RUNS FIRST) =====
-        safety_check = self.predictive_safety_check(traffic_cars, fuzzy_controller)
+        safety_check = self._scheduled_safety_check(traffic_cars, fuzzy_controller)
         
         # If CRITICAL danger, safety takes FULL CONTROL (no blending)
-        if safety_check['recommended_action']['urgency'] == 'critical':
+        if safety_check['recommended_action']['urgency'] == Urgency.CRITICAL:
             # Emergency override - 100% safety control
             self._execute_safety_override(safety_check, fuzzy_controller)
             return
@@ -2464,10 +2913,10 @@ class Vehicle:
         urgency = safety_check['recommended_action']['urgency']
         target_power = None
         
-        if urgency not in ['high', 'critical']:
+        if urgency < Urgency.HIGH:
             # Safe enough to consider power collection
             lane_positions = fuzzy_controller.lane_positions
-            target_power = self.choose_best_power(powerups, traffic_cars, lane_positions)
+            target_power = self.choose_best_power(own_powerups, traffic_cars, lane_positions)
             
             if target_power is not None:
                 # Apply MICRO-STEERING toward power-up (smooth movement)
@@ -2479,11 +2928,11 @@ class Vehicle:
                 
                 # Apply smooth steering with road boundaries
                 self.x += steering_delta
-                self.x = max(ROAD_X + 35, min(ROAD_X + ROAD_WIDTH - 35, self.x))
+                self.x = max(left_bound, min(right_bound, self.x))
         
         # ===== PRIORITY 3: GATHER RECOMMENDATIONS FROM ALL SYSTEMS =====
         current_lane = fuzzy_controller.get_lane_from_x(self.x)
-        distance_to_opponent = abs(opponent.distance - self.distance) if opponent else float('inf')
+        distance_to_opponent = abs(opponent.distance - self.distance) if opponent else INF
         
         # Get recommendations (but don't execute yet)
         recommendations = {
@@ -2506,7 +2955,7 @@ class Vehicle:
         urgency = safety_check['recommended_action']['urgency']
         
         # WEIGHT CALCULATION: Adaptive based on danger level and opponent distance
-        if urgency in ['high', 'moderate']:
+        if Urgency.MODERATE <= urgency <= Urgency.HIGH:
             # HIGH DANGER: Safety + Fuzzy dominate (smooth evasion)
             weights['safety'] = 0.60  # Safety has strong influence
             weights['fuzzy'] = 0.30   # Fuzzy for smooth execution
@@ -2539,7 +2988,7 @@ class Vehicle:
         primary_system = max(weights, key=weights.get)
         
         # Execute primary system with awareness of others
-        # Note: We removed the "urgency == 'high'" override because the individual
+        # Note: We removed the "urgency == Urgency.HIGH" override because the individual
         # AI algorithms already have safety checks built in (from STEP 1)
         # This prevents unnecessary slowdown
         
@@ -2553,97 +3002,119 @@ class Vehicle:
         elif primary_system == 'fuzzy':
             # Fuzzy-primary mode with safety awareness (already built-in)
             self.ai_decision_fuzzy(
-                traffic_cars, powerups, opponent, ghost_mode, fuzzy_controller
+                traffic_cars, own_powerups, opponent, ghost_mode, fuzzy_controller,
+                traffic_by_lane, lane_distances
             )
         
         elif primary_system == 'minimax':
             # Minimax-primary mode with safety awareness
             self.ai_decision_minimax(
-                traffic_cars, powerups, opponent, ghost_mode, minimax_solver
+                traffic_cars, powerups, opponent, ghost_mode, minimax_solver,
+                traffic_buckets, powerup_buckets, traffic_by_lane, lane_distances
             )
         
         elif primary_system == 'astar':
             # A*-primary mode with safety awareness
             self.ai_decision_astar(
-                traffic_cars, powerups, opponent, ghost_mode, astar_pathfinder
+                traffic_cars, own_powerups, opponent, ghost_mode, astar_pathfinder,
+                traffic_by_lane, lane_distances
             )
         
         # ===== POST-DECISION SAFETY CHECK (LIGHT MONITORING ONLY) =====
         # The algorithms already handle safety, this is just a final check
         # Only apply if CRITICAL danger is detected AND algorithm didn't handle it
-        if urgency == 'critical' and safety_check['recommended_action']['brake_intensity'] > 0.9:
+        if urgency == Urgency.CRITICAL and safety_check['recommended_action']['brake_intensity'] > 0.9:
             # Only in extreme cases, apply minimal corrective braking
             # Check if speed is still too high for the danger level
-            if self.speed > self.max_speed * 0.70:
+            max_speed = self.max_speed
+            if self.speed > max_speed * 0.70:
                 brake_amount = safety_check['recommended_action']['brake_intensity'] * 0.2
                 self.speed = max(self.speed - self.brake_rate * brake_amount, 
-                               self.max_speed * 0.60)
+                               max_speed * 0.60)
     
     def _execute_safety_override(self, safety_check, fuzzy_controller):
         """Execute emergency safety override with maximum priority"""
+        # Road boundaries as locals (avoid repeated global lookups in the hot path)
+        left_bound = ROAD_X + 35
+        right_bound = ROAD_X + ROAD_WIDTH - 35
+        
         current_lane = fuzzy_controller.get_lane_from_x(self.x)
         
         # Apply emergency braking
         brake_intensity = safety_check['recommended_action']['brake_intensity']
-        self.speed = max(self.speed - self.brake_rate * 2.0, self.max_speed * 0.25)
+        self._adjust_speed(-self.brake_rate * 2.0, 0.25)
         
         # Execute emergency lane change if recommended
         if safety_check['recommended_action']['should_change_lane']:
             safe_lanes = safety_check['safe_lanes']
-            target_lane = min(safe_lanes, key=lambda lane: abs(lane - current_lane))
+            target_lane = closest_lane(safe_lanes, current_lane)
             target_x = fuzzy_controller.lane_positions[target_lane]
             
             if abs(target_x - self.x) > 5:
                 steering_speed = 14  # Maximum emergency
                 if target_x < self.x:
-                    self.x = max(ROAD_X + 35, self.x - steering_speed)
+                    self.x = max(left_bound, self.x - steering_speed)
                 else:
-                    self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                    self.x = min(right_bound, self.x + steering_speed)
         
         self.enforce_speed_limit()
     
     def _execute_safety_influenced_decision(self, safety_check, fuzzy_controller, weights):
         """Execute decision with strong safety influence"""
+        # Road boundaries as locals (avoid repeated global lookups in the hot path)
+        left_bound = ROAD_X + 35
+        right_bound = ROAD_X + ROAD_WIDTH - 35
+        
         current_lane = fuzzy_controller.get_lane_from_x(self.x)
         
         # Apply proportional braking based on safety recommendation
         brake_intensity = safety_check['recommended_action']['brake_intensity']
         
-        if brake_intensity > 0.6:
-            # Strong brake
-            self.speed = max(self.speed - self.brake_rate * 1.3, self.max_speed * 0.40)
-        elif brake_intensity > 0.3:
-            # Moderate brake
-            self.speed = max(self.speed - self.brake_rate * 0.8, self.max_speed * 0.60)
-        elif brake_intensity > 0:
-            # Light brake
-            self.speed = max(self.speed - self.brake_rate * 0.4, self.max_speed * 0.75)
+        # Stronger recommendation = harder brake (see SAFETY_INFLUENCE_BRAKE_TIERS)
+        brake_tier = SAFETY_INFLUENCE_BRAKE_TIERS[(brake_intensity > 0) + (brake_intensity > 0.3) +
+                                                  (brake_intensity > 0.6)]
+        if brake_tier is not None:
+            brake_mult, floor_ratio = brake_tier
+            self._adjust_speed(-self.brake_rate * brake_mult, floor_ratio)
         
         # Execute lane change if strongly recommended
         if safety_check['recommended_action']['should_change_lane']:
             safe_lanes = safety_check['safe_lanes']
             
             if safe_lanes:
-                target_lane = min(safe_lanes, key=lambda lane: abs(lane - current_lane))
+                target_lane = closest_lane(safe_lanes, current_lane)
                 target_x = fuzzy_controller.lane_positions[target_lane]
                 
                 if abs(target_x - self.x) > 5:
                     # Steering speed proportional to urgency
                     urgency = safety_check['recommended_action']['urgency']
-                    if urgency == 'high':
+                    if urgency == Urgency.HIGH:
                         steering_speed = 12
-                    elif urgency == 'moderate':
+                    elif urgency == Urgency.MODERATE:
                         steering_speed = 9
                     else:
                         steering_speed = 7
                     
                     if target_x < self.x:
-                        self.x = max(ROAD_X + 35, self.x - steering_speed)
+                        self.x = max(left_bound, self.x - steering_speed)
                     else:
-                        self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                        self.x = min(right_bound, self.x + steering_speed)
         
         self.enforce_speed_limit()
     
+    def _scheduled_safety_check(self, traffic_cars, fuzzy_controller):
+        """
+        predictive_safety_check() at 30 Hz: runs on odd AI ticks, or every tick while
+        urgency is HIGH or worse, at most once per tick. Otherwise the last result
+        (still in the scratch dict) is reused.
+        """
+        tick = self._ai_tick
+        if self._safety_tick != tick and (
+                tick % 2 == 1 or self._safety_scratch['recommended_action']['urgency'] >= Urgency.HIGH):
+            self._safety_tick = tick
+            return self.predictive_safety_check(traffic_cars, fuzzy_controller)
+        return self._safety_scratch
+    
     def predictive_safety_check(self, traffic_cars, fuzzy_controller):
         """
         ======================================================================
@@ -2658,10 +3129,15 @@ class Vehicle:
         - current_lane_safe: bool (can stay in current lane?)
         - safe_lanes: list (which lanes are safe to move to?)
         - recommended_action: dict (what to do immediately)
+        
+        NOTE: The returned dict is this vehicle's scratch dict, overwritten by
+        the next call. Copy it if it must outlive that call.
         ======================================================================
         """
         # Get current lane
         current_lane = fuzzy_controller.get_lane_from_x(self.x)
+        my_distance = self.distance  # Locals for the per-car loops below
+        my_speed = self.speed
         
         # Dynamic prediction window based on speed
         # Faster speed = look further ahead
@@ -2685,39 +3161,79 @@ class Vehicle:
         
         # Analyze each lane comprehensively
         lane_analysis = {
-            0: {'obstacles': [], 'min_distance': float('inf'), 'is_safe': True, 'risk_score': 0},
-            1: {'obstacles': [], 'min_distance': float('inf'), 'is_safe': True, 'risk_score': 0},
-            2: {'obstacles': [], 'min_distance': float('inf'), 'is_safe': True, 'risk_score': 0}
+            0: {'obstacles': [], 'min_distance': INF, 'is_safe': True, 'risk_score': 0},
+            1: {'obstacles': [], 'min_distance': INF, 'is_safe': True, 'risk_score': 0},
+            2: {'obstacles': [], 'min_distance': INF, 'is_safe': True, 'risk_score': 0}
         }
         
+        # Cheap gate: if no car sits in [-100, prediction horizon] nothing below can fire
+        # (the side-collision window is always shorter than the prediction horizon)
+        horizon = predicted_distance - my_distance + 200
+        traffic_in_range = False
+        for car in traffic_cars:
+            if -100 < car.distance - my_distance < horizon:
+                traffic_in_range = True
+                break
+        
+        if not traffic_in_range:
+            # ALL CLEAR: every lane safe, no action needed
+            safe_lanes = [0, 1, 2]
+            result = self._safety_scratch
+            recommended_action = result['recommended_action']
+            recommended_action['brake_intensity'] = 0.0
+            recommended_action['should_change_lane'] = False
+            recommended_action['target_lanes'] = safe_lanes
+            recommended_action['urgency'] = Urgency.NONE
+            result['danger_detected'] = False
+            result['time_to_collision'] = INF
+            result['current_lane'] = current_lane
+            result['current_lane_safe'] = True
+            result['current_lane_risk'] = 0
+            result['safe_lanes'] = safe_lanes
+            result['lane_analysis'] = lane_analysis
+            result['prediction_frames'] = prediction_frames
+            result['predicted_distance'] = predicted_distance
+            return result
+        
+        # Side-by-side window for lane changes (checked in the same scan below)
+        side_window = distance_traveled_during_change + 100
+        
         # Scan all traffic for threats
         for car in traffic_cars:
             # Calculate relative position
-            relative_distance = car.distance - self.distance
+            car_distance = car.distance
+            car_lane = car.lane
+            relative_distance = car_distance - my_distance
+            
+            # Check for side collision risk when changing lanes
+            # Side-by-side or very close = cannot change to this lane
+            if car_lane != current_lane and -100 < relative_distance < side_window:
+                lane_analysis[car_lane]['risk_score'] += 2000
+                lane_analysis[car_lane]['is_safe'] = False
             
             # Only check obstacles ahead within prediction window
-            if 0 < relative_distance < predicted_distance - self.distance + 200:
+            if 0 < relative_distance < horizon:
                 
                 # Get traffic car speed (if available)
                 traffic_speed = car.speed if hasattr(car, 'speed') else 3.0
                 
                 # Calculate RELATIVE SPEED (key for accurate prediction!)
-                relative_speed = self.speed - traffic_speed
+                relative_speed = my_speed - traffic_speed
                 
                 # Time to collision calculation
                 if relative_speed > 0.1:  # We're catching up
                     time_to_collision = relative_distance / relative_speed
                 else:
-                    time_to_collision = float('inf')  # Moving apart or same speed
+                    time_to_collision = INF  # Moving apart or same speed
                 
                 # Predict where obstacle will be when we reach it
                 frames_to_reach = time_to_collision
-                obstacle_future_distance = car.distance + (traffic_speed * frames_to_reach)
-                vehicle_future_distance = self.distance + (self.speed * frames_to_reach)
+                obstacle_future_distance = car_distance + (traffic_speed * frames_to_reach)
+                vehicle_future_distance = my_distance + (my_speed * frames_to_reach)
                 predicted_gap = obstacle_future_distance - vehicle_future_distance
                 
                 # Add to lane analysis
-                lane_data = lane_analysis[car.lane]
+                lane_data = lane_analysis[car_lane]
                 lane_data['obstacles'].append({
                     'current_distance': relative_distance,
                     'predicted_gap': predicted_gap,
@@ -2748,17 +3264,6 @@ class Vehicle:
                 elif relative_distance < warning_distance:
                     lane_data['risk_score'] += 300
         
-        # Check for side collision risk when changing lanes
-        for target_lane in range(3):
-            if target_lane != current_lane:
-                for car in traffic_cars:
-                    if car.lane == target_lane:
-                        relative_distance = car.distance - self.distance
-                        # Side-by-side or very close = cannot change to this lane
-                        if -100 < relative_distance < distance_traveled_during_change + 100:
-                            lane_analysis[target_lane]['risk_score'] += 2000
-                            lane_analysis[target_lane]['is_safe'] = False
-        
         # Determine current lane safety
         current_lane_info = lane_analysis[current_lane]
         danger_detected = not current_lane_info['is_safe']
@@ -2772,104 +3277,103 @@ class Vehicle:
             safe_lanes = [safest_lane]
         
         # Calculate time to collision in current lane
-        min_ttc = float('inf')
+        min_ttc = INF
         for obstacle in current_lane_info['obstacles']:
             if obstacle['time_to_collision'] < min_ttc:
                 min_ttc = obstacle['time_to_collision']
         
-        # Determine recommended action
-        recommended_action = {
-            'brake_intensity': 0.0,  # 0.0 to 1.0
-            'should_change_lane': False,
-            'target_lanes': safe_lanes,
-            'urgency': 'none'  # 'critical', 'high', 'moderate', 'low', 'none'
-        }
+        # Determine recommended action (reset the pooled dict in place)
+        result = self._safety_scratch
+        recommended_action = result['recommended_action']
+        recommended_action['brake_intensity'] = 0.0  # 0.0 to 1.0
+        recommended_action['should_change_lane'] = False
+        recommended_action['target_lanes'] = safe_lanes
+        recommended_action['urgency'] = Urgency.NONE  # Urgency.NONE .. Urgency.CRITICAL
         
         if danger_detected:
             if current_lane_info['min_distance'] < critical_distance:
                 # CRITICAL: Immediate action required
-                recommended_action['urgency'] = 'critical'
+                recommended_action['urgency'] = Urgency.CRITICAL
                 recommended_action['brake_intensity'] = 1.0  # Maximum braking
                 if current_lane not in safe_lanes:
                     recommended_action['should_change_lane'] = True
             
             elif current_lane_info['min_distance'] < warning_distance:
                 # HIGH: Act now to prevent collision
-                recommended_action['urgency'] = 'high'
+                recommended_action['urgency'] = Urgency.HIGH
                 recommended_action['brake_intensity'] = 0.7
                 if len(safe_lanes) > 0 and current_lane not in safe_lanes:
                     recommended_action['should_change_lane'] = True
             
             else:
                 # MODERATE: Prepare for evasion
-                recommended_action['urgency'] = 'moderate'
+                recommended_action['urgency'] = Urgency.MODERATE
                 recommended_action['brake_intensity'] = 0.4
                 if current_lane not in safe_lanes:
                     recommended_action['should_change_lane'] = True
         
         elif current_lane_info['min_distance'] < safe_distance:
             # LOW: Monitor situation, slight caution
-            recommended_action['urgency'] = 'low'
+            recommended_action['urgency'] = Urgency.LOW
             recommended_action['brake_intensity'] = 0.2
         
         # Return comprehensive safety analysis
-        return {
-            'danger_detected': danger_detected,
-            'time_to_collision': min_ttc,
-            'current_lane': current_lane,
-            'current_lane_safe': current_lane_info['is_safe'],
-            'current_lane_risk': current_lane_info['risk_score'],
-            'safe_lanes': safe_lanes,
-            'lane_analysis': lane_analysis,
-            'recommended_action': recommended_action,
-            'prediction_frames': prediction_frames,
-            'predicted_distance': predicted_distance
-        }
+        result['danger_detected'] = danger_detected
+        result['time_to_collision'] = min_ttc
+        result['current_lane'] = current_lane
+        result['current_lane_safe'] = current_lane_info['is_safe']
+        result['current_lane_risk'] = current_lane_info['risk_score']
+        result['safe_lanes'] = safe_lanes
+        result['lane_analysis'] = lane_analysis
+        result['prediction_frames'] = prediction_frames
+        result['predicted_distance'] = predicted_distance
+        return result
     
     def ai_decision_csp(self, traffic_cars, powerups, opponent, ghost_mode, csp_solver):
         """
         Advanced AI decision making using CSP algorithm.
         Considers multiple constraints simultaneously for optimal decision.
         """
+        # Road boundaries as locals (avoid repeated global lookups in the hot path)
+        left_bound = ROAD_X + 35
+        right_bound = ROAD_X + ROAD_WIDTH - 35
+        
         if self.crashed:
             return
         
         # ======================================================================
         # PRIORITY 1: RUN PREDICTIVE SAFETY LAYER FIRST
         # ======================================================================
-        from game import FuzzyLogicController
-        fuzzy_temp = FuzzyLogicController() if not hasattr(self, '_fuzzy_temp') else self._fuzzy_temp
-        if not hasattr(self, '_fuzzy_temp'):
-            self._fuzzy_temp = fuzzy_temp
+        if Vehicle._shared_fuzzy is None:
+            Vehicle._shared_fuzzy = FuzzyLogicController()
+        fuzzy_temp = Vehicle._shared_fuzzy
         
         safety_check = self.predictive_safety_check(traffic_cars, fuzzy_temp)
         current_lane = csp_solver.get_lane_from_x(self.x)
         
         # If CRITICAL or HIGH danger detected, OVERRIDE CSP with safety actions
-        if safety_check['recommended_action']['urgency'] in ['critical', 'high']:
+        if safety_check['recommended_action']['urgency'] >= Urgency.HIGH:
             # EMERGENCY MODE: Safety takes absolute priority
             
             # Apply emergency braking
             brake_intensity = safety_check['recommended_action']['brake_intensity']
-            if brake_intensity > 0.8:
-                self.speed = max(self.speed - self.brake_rate * 2.0, self.max_speed * 0.25)
-            elif brake_intensity > 0.5:
-                self.speed = max(self.speed - self.brake_rate * 1.5, self.max_speed * 0.40)
-            else:
-                self.speed = max(self.speed - self.brake_rate * 1.0, self.max_speed * 0.55)
+            # Tier 0 = critical (> 0.8), 1 = strong (> 0.5), 2 = moderate
+            tier = (brake_intensity <= 0.8) + (brake_intensity <= 0.5)
+            brake_mult, floor_ratio = EMERGENCY_BRAKE_TIERS[tier]
+            self._adjust_speed(-self.brake_rate * brake_mult, floor_ratio)
             
             # Execute emergency lane change if recommended
             if safety_check['recommended_action']['should_change_lane']:
                 safe_lanes = safety_check['safe_lanes']
-                target_lane = min(safe_lanes, key=lambda lane: abs(lane - current_lane))
+                target_lane = closest_lane(safe_lanes, current_lane)
                 target_x = csp_solver.lane_positions[target_lane]
                 
                 if abs(target_x - self.x) > 5:
                     steering_speed = 14
                     if target_x < self.x:
-                        self.x = max(ROAD_X + 35, self.x - steering_speed)
+                        self.x = max(left_bound, self.x - steering_speed)
                     else:
-                        self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                        self.x = min(right_bound, self.x + steering_speed)
             
             self.enforce_speed_limit()
             return
@@ -2898,22 +3402,24 @@ class Vehicle:
             steering_speed = 4 if self.speed > 6 else 5
             
             if target_x < self.x:
-                self.x = max(ROAD_X + 35, self.x - steering_speed)
+                self.x = max(left_bound, self.x - steering_speed)
             else:
-                self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                self.x = min(right_bound, self.x + steering_speed)
         
         # Execute speed action
         if not self.crashed:
             if speed_action == 'accelerate':
-                self.speed = min(self.speed + 0.2, self.max_speed)
+                self._adjust_speed(0.2)
             elif speed_action == 'maintain':
                 # Maintain at FULL max speed - no reduction
                 if self.speed < self.max_speed - 0.1:
-                    self.speed = min(self.speed + 0.08, self.max_speed)
+                    self._adjust_speed(0.08)
             elif speed_action == 'brake':
-                self.speed = max(self.speed - 0.3, self.max_speed * 0.5)
+                self._adjust_speed(-0.3, 0.5)
     
-    def ai_decision_minimax(self, traffic_cars, powerups, opponent, ghost_mode, minimax_solver):
+    def ai_decision_minimax(self, traffic_cars, powerups, opponent, ghost_mode, minimax_solver,
+                            traffic_buckets=None, powerup_buckets=None, traffic_by_lane=None,
+                            lane_distances=None):
         """
         Advanced AI decision making using Minimax with Alpha-Beta pruning.
         Anticipates opponent's moves and plans counter-strategies.
@@ -2924,7 +3430,16 @@ class Vehicle:
             opponent: Opponent vehicle
             ghost_mode: If True, can pass through traffic
             minimax_solver: MinimaxDecisionMaker instance
+            traffic_buckets: Optional per-frame distance buckets of traffic (see build_distance_buckets)
+            powerup_buckets: Optional per-frame distance buckets of power-ups
+            traffic_by_lane: Optional per-frame group_by_lane(traffic_cars) (built here if None)
+            lane_distances: Optional per-frame build_lane_distances(traffic_by_lane) (built here if None)
         """
+        # Road boundaries as locals (avoid repeated global lookups in the hot path)
+        left_bound = ROAD_X + 35
+        right_bound = ROAD_X + ROAD_WIDTH - 35
+        lane_positions = minimax_solver.lane_positions  # Tuple indexed by lane
+        
         if self.crashed:
             return
         
@@ -2932,42 +3447,41 @@ class Vehicle:
         # PRIORITY 1: RUN PREDICTIVE SAFETY LAYER FIRST
         # ======================================================================
         # Need fuzzy_controller for lane detection
-        from game import FuzzyLogicController  # Import if needed
-        fuzzy_temp = FuzzyLogicController() if not hasattr(self, '_fuzzy_temp') else self._fuzzy_temp
-        if not hasattr(self, '_fuzzy_temp'):
-            self._fuzzy_temp = fuzzy_temp
+        if Vehicle._shared_fuzzy is None:
+            Vehicle._shared_fuzzy = FuzzyLogicController()
+        fuzzy_temp = Vehicle._shared_fuzzy
         
-        safety_check = self.predictive_safety_check(traffic_cars, fuzzy_temp)
+        safety_check = self._scheduled_safety_check(traffic_cars, fuzzy_temp)
         current_lane = minimax_solver.get_lane_from_x(self.x)
         
         # If CRITICAL danger detected, OVERRIDE minimax with safety actions
-        if safety_check['recommended_action']['urgency'] == 'critical':
+        if safety_check['recommended_action']['urgency'] == Urgency.CRITICAL:
             # EMERGENCY MODE: Safety takes absolute priority
             
             # Apply emergency braking
             brake_intensity = safety_check['recommended_action']['brake_intensity']
-            self.speed = max(self.speed - self.brake_rate * 2.0, self.max_speed * 0.25)
+            self._adjust_speed(-self.brake_rate * 2.0, 0.25)
             
             # Execute emergency lane change if recommended
             if safety_check['recommended_action']['should_change_lane']:
                 safe_lanes = safety_check['safe_lanes']
-                target_lane = min(safe_lanes, key=lambda lane: abs(lane - current_lane))
-                target_x = minimax_solver.lane_positions[target_lane]
+                target_lane = closest_lane(safe_lanes, current_lane)
+                target_x = lane_positions[target_lane]
                 
                 if abs(target_x - self.x) > 5:
                     steering_speed = 14
                     if target_x < self.x:
-                        self.x = max(ROAD_X + 35, self.x - steering_speed)
+                        self.x = max(left_bound, self.x - steering_speed)
                     else:
-                        self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                        self.x = min(right_bound, self.x + steering_speed)
             
             self.enforce_speed_limit()
             return
         
         # Apply caution if HIGH danger (but let minimax continue with awareness)
-        if safety_check['recommended_action']['urgency'] == 'high':
+        if safety_check['recommended_action']['urgency'] == Urgency.HIGH:
             # Reduce speed proactively
-            self.speed = max(self.speed - self.brake_rate * 0.8, self.max_speed * 0.50)
+            self._adjust_speed(-self.brake_rate * 0.8, 0.50)
         
         # ======================================================================
         # PRIORITY 2: CONTINUE WITH NORMAL MINIMAX LOGIC
@@ -2976,25 +3490,34 @@ class Vehicle:
         # Create current game state snapshot
         opponent_lane = minimax_solver.get_lane_from_x(opponent.x) if opponent else 1
         
+        # Candidate objects: only the distance buckets around us if a spatial hash was supplied
+        nearby_traffic = traffic_cars
+        nearby_powerups = powerups
+        if traffic_buckets is not None:
+            nearby_traffic = query_distance_buckets(traffic_buckets, self.distance, 1000)
+        if powerup_buckets is not None:
+            nearby_powerups = query_distance_buckets(powerup_buckets, self.distance, 1000)
+        
         # Take snapshot of nearby traffic (within 1000 units)
+        # Distances quantized to whole units - minimax only needs coarse positions
         traffic_snapshot = []
-        for car in traffic_cars:
-            dist_to_car = abs(car.distance - self.distance)
-            if dist_to_car < 1000:
-                traffic_snapshot.append((car.lane, car.distance))
+        for car in nearby_traffic:
+            if -1000 < car.distance - self.distance < 1000:
+                traffic_snapshot.append((car.lane, int(car.distance)))
+        traffic_snapshot = tuple(traffic_snapshot)
         
         # Take snapshot of nearby power-ups (within 1000 units)
         powerup_snapshot = []
-        for powerup in powerups:
+        for powerup in nearby_powerups:
             if not powerup.collected:
-                dist_to_powerup = abs(powerup.distance - self.distance)
-                if dist_to_powerup < 1000:
+                if -1000 < powerup.distance - self.distance < 1000:
                     powerup_snapshot.append((
                         powerup.lane,
-                        powerup.distance,
+                        int(powerup.distance),
                         powerup.power_type,
                         powerup.for_police
                     ))
+        powerup_snapshot = tuple(powerup_snapshot)
         
         # Create game state - FIXED: Correct police/thief assignment
         if self.is_police:
@@ -3022,26 +3545,49 @@ class Vehicle:
                 powerups_snapshot=powerup_snapshot
             )
         
-        # Get best move from Minimax
-        best_action = minimax_solver.get_best_move(game_state, self.is_police, max_time_ms=15)
+        # Danger appearing/clearing invalidates every memoized plan
+        danger_detected = safety_check['danger_detected']
+        if danger_detected != self._minimax_danger:
+            minimax_solver.clear_cache()
+            self._minimax_action = None
+        self._minimax_danger = danger_detected
+        
+        # Re-plan every 3rd tick (20 Hz); in HIGH danger or after invalidation, every tick
+        tick = self._ai_tick
+        if (self._minimax_action is None or tick - self._minimax_tick >= 3
+                or safety_check['recommended_action']['urgency'] >= Urgency.HIGH):
+            # Quantized state key: lanes, 50-unit distance cells, 0.25 speed steps, nearby traffic
+            state_key = (
+                self.is_police,
+                current_lane, opponent_lane,
+                int(self.distance) // 50, int(opponent.distance) // 50,
+                int(self.speed * 4), int(opponent.speed * 4),
+                tuple((lane, dist // 50) for lane, dist in traffic_snapshot[:8]),
+                len(powerup_snapshot)
+            )
+            
+            # Get best move from Minimax (reused from the transposition table when possible)
+            self._minimax_action = minimax_solver.get_cached_best_move(
+                state_key, game_state, self.is_police, max_time_ms=15)
+            self._minimax_tick = tick
+        best_action = self._minimax_action
         
         # Execute the action
         if best_action:
             # Convert lane to x position
-            target_x = minimax_solver.lane_positions[best_action.lane]
+            target_x = lane_positions[best_action.lane]
             
             # IMPROVED: More aggressive steering for faster lane changes
             distance_to_target = abs(target_x - self.x)
             
             if distance_to_target > 5:
                 # Check if there's traffic ahead - steer faster to avoid
-                traffic_ahead_close = False
-                for car in traffic_cars:
-                    car_lane = minimax_solver.get_lane_from_x(car.x)
-                    if car_lane == current_lane:
-                        if 0 < car.distance - self.distance < 200:
-                            traffic_ahead_close = True
-                            break
+                # Traffic sits on lane centers, so only the current lane's cars need checking
+                if lane_distances is None:
+                    if traffic_by_lane is None:
+                        traffic_by_lane = group_by_lane(traffic_cars)
+                    lane_distances = build_lane_distances(traffic_by_lane)
+                traffic_ahead_close = nearest_ahead_gap(lane_distances[current_lane], self.distance) < 200
                 
                 # Faster steering when avoiding traffic or at high speed - BOTH EQUALLY FAST!
                 if not self.is_police:
@@ -3062,9 +3608,9 @@ class Vehicle:
                         steering_speed = 7  # INCREASED from 5 - Normal
                 
                 if target_x < self.x:
-                    self.x = max(ROAD_X + 35, self.x - steering_speed)
+                    self.x = max(left_bound, self.x - steering_speed)
                 else:
-                    self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                    self.x = min(right_bound, self.x + steering_speed)
             
             # Execute speed action with INDEPENDENT acceleration rates
             if not self.crashed:
@@ -3075,45 +3621,46 @@ class Vehicle:
                         # THIEF PANIC MODE: Police very close - maximum aggression!
                         if best_action.speed_change != 'brake':
                             # Override to FULL SPEED acceleration
-                            self.speed = min(self.speed + self.acceleration_rate * 1.5, self.max_speed)
+                            self._adjust_speed(self.acceleration_rate * 1.5)
                         else:
                             # Even when braking, do it minimally to maintain speed
-                            self.speed = max(self.speed - self.brake_rate * 0.6, self.max_speed * 0.70)
+                            self._adjust_speed(-self.brake_rate * 0.6, 0.70)
                     elif distance_to_police < 400:
                         # THIEF ALERT MODE: Police approaching - high aggression
                         if best_action.speed_change == 'accelerate':
-                            self.speed = min(self.speed + self.acceleration_rate * 1.4, self.max_speed)
+                            self._adjust_speed(self.acceleration_rate * 1.4)
                         elif best_action.speed_change == 'maintain':
                             # Push hard to max speed
-                            self.speed = min(self.speed + self.acceleration_rate * 1.2, self.max_speed)
+                            self._adjust_speed(self.acceleration_rate * 1.2)
                         elif best_action.speed_change == 'brake':
                             # Light braking only
-                            self.speed = max(self.speed - self.brake_rate * 0.7, self.max_speed * 0.65)
+                            self._adjust_speed(-self.brake_rate * 0.7, 0.65)
                     else:
                         # Normal execution when police is far
                         if best_action.speed_change == 'accelerate':
                             accel_mult = 1.3
-                            self.speed = min(self.speed + self.acceleration_rate * accel_mult, self.max_speed)
+                            self._adjust_speed(self.acceleration_rate * accel_mult)
                         elif best_action.speed_change == 'maintain':
                             if self.speed < self.max_speed - 0.1:
-                                self.speed = min(self.speed + self.acceleration_rate * 1.0, self.max_speed)
+                                self._adjust_speed(self.acceleration_rate * 1.0)
                         elif best_action.speed_change == 'brake':
-                            self.speed = max(self.speed - self.brake_rate, self.max_speed * 0.5)
+                            self._adjust_speed(-self.brake_rate, 0.5)
                 else:
                     # POLICE execution (unchanged) or no opponent
                     if best_action.speed_change == 'accelerate':
                         accel_mult = 1.3
-                        self.speed = min(self.speed + self.acceleration_rate * accel_mult, self.max_speed)
+                        self._adjust_speed(self.acceleration_rate * accel_mult)
                     elif best_action.speed_change == 'maintain':
                         if self.speed < self.max_speed - 0.1:
-                            self.speed = min(self.speed + self.acceleration_rate * 1.0, self.max_speed)
+                            self._adjust_speed(self.acceleration_rate * 1.0)
                     elif best_action.speed_change == 'brake':
-                        self.speed = max(self.speed - self.brake_rate, self.max_speed * 0.5)
+                        self._adjust_speed(-self.brake_rate, 0.5)
         
         # ENFORCE 200 km/h SPEED LIMIT
         self.enforce_speed_limit()
     
-    def ai_decision_fuzzy(self, traffic_cars, powerups, opponent, ghost_mode, fuzzy_controller):
+    def ai_decision_fuzzy(self, traffic_cars, powerups, opponent, ghost_mode, fuzzy_controller,
+                          traffic_by_lane=None, lane_distances=None):
         """
         Advanced AI decision making using Fuzzy Logic.
         Provides human-like gradual decision making with smooth transitions.
@@ -3124,49 +3671,51 @@ class Vehicle:
             opponent: Opponent vehicle
             ghost_mode: If True, can pass through traffic
             fuzzy_controller: FuzzyLogicController instance
+            traffic_by_lane: Optional per-frame traffic split by lane (see group_by_lane)
+            lane_distances: Optional per-frame sorted distances by lane (see build_lane_distances)
         """
+        # Road boundaries as locals (avoid repeated global lookups in the hot path)
+        left_bound = ROAD_X + 35
+        right_bound = ROAD_X + ROAD_WIDTH - 35
+        lane_positions = fuzzy_controller.lane_positions  # Tuple indexed by lane
+        
         if self.crashed:
             return
         
         # ======================================================================
         # PRIORITY 1: RUN PREDICTIVE SAFETY LAYER FIRST
         # ======================================================================
-        safety_check = self.predictive_safety_check(traffic_cars, fuzzy_controller)
+        safety_check = self._scheduled_safety_check(traffic_cars, fuzzy_controller)
         
         # Get current lane
         current_lane = fuzzy_controller.get_lane_from_x(self.x)
         
         # If CRITICAL or HIGH danger detected, OVERRIDE fuzzy logic with safety actions
-        if safety_check['recommended_action']['urgency'] in ['critical', 'high']:
+        if safety_check['recommended_action']['urgency'] >= Urgency.HIGH:
             # EMERGENCY MODE: Safety takes absolute priority
             
             # Apply emergency braking
             brake_intensity = safety_check['recommended_action']['brake_intensity']
-            if brake_intensity > 0.8:
-                # Critical braking
-                self.speed = max(self.speed - self.brake_rate * 2.0, self.max_speed * 0.25)
-            elif brake_intensity > 0.5:
-                # Strong braking
-                self.speed = max(self.speed - self.brake_rate * 1.5, self.max_speed * 0.40)
-            else:
-                # Moderate braking
-                self.speed = max(self.speed - self.brake_rate * 1.0, self.max_speed * 0.55)
+            # Tier 0 = critical (> 0.8), 1 = strong (> 0.5), 2 = moderate
+            tier = (brake_intensity <= 0.8) + (brake_intensity <= 0.5)
+            brake_mult, floor_ratio = EMERGENCY_BRAKE_TIERS[tier]
+            self._adjust_speed(-self.brake_rate * brake_mult, floor_ratio)
             
             # Execute emergency lane change if recommended
             if safety_check['recommended_action']['should_change_lane']:
                 safe_lanes = safety_check['safe_lanes']
                 
                 # Choose the closest safe lane
-                target_lane = min(safe_lanes, key=lambda lane: abs(lane - current_lane))
-                target_x = fuzzy_controller.lane_positions[target_lane]
+                target_lane = closest_lane(safe_lanes, current_lane)
+                target_x = lane_positions[target_lane]
                 
                 # AGGRESSIVE emergency steering
                 if abs(target_x - self.x) > 5:
                     steering_speed = 14  # Maximum emergency speed
                     if target_x < self.x:
-                        self.x = max(ROAD_X + 35, self.x - steering_speed)
+                        self.x = max(left_bound, self.x - steering_speed)
                     else:
-                        self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                        self.x = min(right_bound, self.x + steering_speed)
             
             # Skip normal fuzzy logic - safety handled the situation
             self.enforce_speed_limit()
@@ -3176,17 +3725,24 @@ class Vehicle:
         # PRIORITY 2: CONTINUE WITH NORMAL FUZZY LOGIC (if no emergency)
         # ======================================================================
         
+        # Relative offset of every traffic car grouped by lane (index = lane),
+        # computed once and reused by all scans below
+        if traffic_by_lane is None:
+            traffic_by_lane = group_by_lane(traffic_cars)
+        my_distance = self.distance
+        lane_offsets = [[car.distance - my_distance for car in lane_cars] for lane_cars in traffic_by_lane]
+        
         # ===== SMART OBSTACLE ANALYSIS =====
         # Check what obstacles are ahead and if lane change is possible
-        nearest_obstacle_dist = 10000
         can_safely_change_lane = False
         best_escape_lane = current_lane
         
-        for car in traffic_cars:
-            if car.lane == current_lane:
-                dist = car.distance - self.distance
-                if 0 < dist:
-                    nearest_obstacle_dist = min(nearest_obstacle_dist, dist)
+        if lane_distances is None:
+            lane_distances = build_lane_distances(traffic_by_lane)
+        nearest_obstacle_dist = min(10000, nearest_ahead_gap(lane_distances[current_lane], my_distance))
+        
+        # Need clear space (speed-aware safety margin)
+        escape_margin = 220 + (self.speed * 30)
         
         # Intelligently check if lane change is a GOOD option
         for check_lane in range(3):
@@ -3194,16 +3750,14 @@ class Vehicle:
                 lane_is_safe = True
                 min_clearance_in_lane = 10000
                 
-                for car in traffic_cars:
-                    if car.lane == check_lane:
-                        dist = car.distance - self.distance
-                        min_clearance_in_lane = min(min_clearance_in_lane, abs(dist))
-                        
-                        # Need clear space (speed-aware safety margin)
-                        safety_margin = 220 + (self.speed * 30)
-                        if abs(dist) < safety_margin:
-                            lane_is_safe = False
-                            break
+                for dist in lane_offsets[check_lane]:
+                    clearance = abs(dist)
+                    if clearance < min_clearance_in_lane:
+                        min_clearance_in_lane = clearance
+                    
+                    if clearance < escape_margin:
+                        lane_is_safe = False
+                        break
                 
                 # Found a safe escape route
                 if lane_is_safe and min_clearance_in_lane > nearest_obstacle_dist:
@@ -3242,190 +3796,160 @@ class Vehicle:
             # ===== SPECIAL ESCAPE MODE for THIEF when police is close =====
             if opponent and not self.is_police:
                 distance_to_police = abs(opponent.distance - self.distance)
-                
-                if distance_to_police < 200:
-                    # PANIC ESCAPE: Police very close - override all logic!
-                    if acceleration >= 0:
-                        # Accelerate AGGRESSIVELY
-                        self.speed = min(self.speed + self.acceleration_rate * 1.8, self.max_speed)
-                    else:
-                        # Minimal braking only
-                        self.speed = max(self.speed - self.brake_rate * 0.5, self.max_speed * 0.75)
-                    
-                elif distance_to_police < 400:
-                    # HIGH ALERT: Boost all acceleration, reduce braking
-                    if acceleration > 0.3:
-                        accel_multiplier = 1.6  # Extra boost when escaping
-                        self.speed = min(self.speed + self.acceleration_rate * accel_multiplier, self.max_speed)
-                    elif acceleration > 0.05:
-                        accel_multiplier = 1.2  # Increased from 0.8
-                        self.speed = min(self.speed + self.acceleration_rate * accel_multiplier, self.max_speed)
-                    elif acceleration < -0.5:
-                        # Reduce braking intensity when escaping
-                        self.speed = max(self.speed - self.brake_rate * 1.0, self.max_speed * 0.50)
-                    elif acceleration < -0.15:
-                        self.speed = max(self.speed - self.brake_rate * 0.5, self.max_speed * 0.65)
-                    else:
-                        # Push to max speed when escaping
-                        target_speed = self.max_speed
-                        if self.speed < target_speed - 0.1:
-                            self.speed = min(self.speed + self.acceleration_rate * 1.3, self.max_speed)
-                else:
-                    # Normal execution when police is far - standard Minimax logic
-                    if acceleration > 0.3:
-                        accel_multiplier = 1.4
-                        self.speed = min(self.speed + self.acceleration_rate * accel_multiplier, self.max_speed)
-                    elif acceleration > 0.05:
-                        accel_multiplier = 0.8
-                        self.speed = min(self.speed + self.acceleration_rate * accel_multiplier, self.max_speed)
-                    elif acceleration < -0.5:
-                        self.speed = max(self.speed - self.brake_rate * 1.5, self.max_speed * 0.35)
-                    elif acceleration < -0.15:
-                        self.speed = max(self.speed - self.brake_rate * 0.8, self.max_speed * 0.55)
-                    else:
-                        if nearest_obstacle_dist > 600:
-                            target_speed = self.max_speed
-                        elif nearest_obstacle_dist > 400:
-                            target_speed = self.max_speed * 0.95
-                        elif nearest_obstacle_dist > 250:
-                            target_speed = self.max_speed * 0.85
-                        else:
-                            target_speed = self.max_speed * 0.70
-                        
-                        if self.speed < target_speed - 0.3:
-                            self.speed = min(self.speed + self.acceleration_rate * 1.0, self.max_speed)
-                        elif self.speed > target_speed + 0.3:
-                            self.speed = max(self.speed - self.brake_rate * 0.4, target_speed)
             else:
-                # POLICE or no opponent - normal execution
-                if acceleration > 0.3:
-                    accel_multiplier = 1.4
-                    self.speed = min(self.speed + self.acceleration_rate * accel_multiplier, self.max_speed)
-                elif acceleration > 0.05:
-                    accel_multiplier = 0.8
-                    self.speed = min(self.speed + self.acceleration_rate * accel_multiplier, self.max_speed)
-                elif acceleration < -0.5:
-                    self.speed = max(self.speed - self.brake_rate * 1.5, self.max_speed * 0.35)
-                elif acceleration < -0.15:
-                    self.speed = max(self.speed - self.brake_rate * 0.8, self.max_speed * 0.55)
+                distance_to_police = INF  # POLICE or no opponent - normal execution
+            
+            if distance_to_police < 200:
+                # PANIC ESCAPE: Police very close - override all logic!
+                if acceleration >= 0:
+                    # Accelerate AGGRESSIVELY
+                    self._adjust_speed(self.acceleration_rate * 1.8)
                 else:
-                    if nearest_obstacle_dist > 600:
-                        target_speed = self.max_speed
-                    elif nearest_obstacle_dist > 400:
-                        target_speed = self.max_speed * 0.95
-                    elif nearest_obstacle_dist > 250:
-                        target_speed = self.max_speed * 0.85
+                    # Minimal braking only
+                    self._adjust_speed(-self.brake_rate * 0.5, 0.75)
+            else:
+                # HIGH ALERT (police within 400) boosts acceleration and reduces braking,
+                # otherwise police / far thief use the standard tiers
+                escaping = distance_to_police < 400
+                speed_tiers = FUZZY_ESCAPE_SPEED_TIERS if escaping else FUZZY_SPEED_TIERS
+                
+                # Tier from thresholds -0.5 / -0.15 / 0.05 / 0.3 (same edges as the old if/elif chain)
+                tier = ((acceleration >= -0.5) + (acceleration >= -0.15) +
+                        (acceleration > 0.05) + (acceleration > 0.3))
+                speed_action = speed_tiers[tier]
+                
+                if speed_action is not None:
+                    is_brake, multiplier, floor_ratio = speed_action
+                    if is_brake:
+                        self._adjust_speed(-self.brake_rate * multiplier, floor_ratio)
                     else:
-                        target_speed = self.max_speed * 0.70
+                        self._adjust_speed(self.acceleration_rate * multiplier)
+                elif escaping:
+                    # Push to max speed when escaping
+                    target_speed = self.max_speed
+                    if self.speed < target_speed - 0.1:
+                        self._adjust_speed(self.acceleration_rate * 1.3)
+                else:
+                    tier = ((nearest_obstacle_dist > 250) + (nearest_obstacle_dist > 400) +
+                            (nearest_obstacle_dist > 600))
+                    target_speed = self.max_speed * FUZZY_CRUISE_SPEED_RATIOS[tier]
                     
                     if self.speed < target_speed - 0.3:
-                        self.speed = min(self.speed + self.acceleration_rate * 1.0, self.max_speed)
+                        self._adjust_speed(self.acceleration_rate * 1.0)
                     elif self.speed > target_speed + 0.3:
                         self.speed = max(self.speed - self.brake_rate * 0.4, target_speed)
         
-        # ===== PRIORITY #1: INTELLIGENT LANE SAFETY ANALYSIS =====
-        # Analyze ALL lanes comprehensively to find the SAFEST one
-        
-        lane_safety_scores = {}
-        current_lane = fuzzy_controller.get_lane_from_x(self.x)        # Speed-based safety margin (faster = need more space)
-        safety_margin = 250 + (self.speed * 35)
-        emergency_distance = 200 + (self.speed * 25)
-        
-        for lane_idx in range(3):
-            lane_score = 1000  # Start with high safety score
-            obstacles_in_lane = []
-            min_obstacle_dist = 10000
-            has_immediate_danger = False
-            has_side_collision_risk = False
-            
-            # Analyze ALL obstacles in this lane
-            for car in traffic_cars:
-                if car.lane == lane_idx:
-                    dist = car.distance - self.distance
-                    
+        # ===== LANE + POWER-UP PLANNING (every 4th tick) =====
+        # Lane choices change on a ~10 frame scale, so the scoring below is reused
+        # for 3 ticks; the planned steering moves are still applied every frame
+        if self._fuzzy_plan is None or self._ai_tick - self._fuzzy_plan_tick >= 4:
+            steering_plan = []
+            
+            # ===== PRIORITY #1: INTELLIGENT LANE SAFETY ANALYSIS =====
+            # Analyze ALL lanes comprehensively to find the SAFEST one
+            
+            lane_safety_scores = {}
+            current_lane = fuzzy_controller.get_lane_from_x(self.x)        # Speed-based safety margin (faster = need more space)
+            safety_margin = 250 + (self.speed * 35)
+            emergency_distance = 200 + (self.speed * 25)
+            
+            # Analyze ALL obstacles in ONE pass, accumulating per-lane stats (index = lane)
+            lane_scores = [1000, 1000, 1000]  # Start with high safety score
+            lane_obstacle_counts = [0, 0, 0]
+            lane_min_dists = [10000, 10000, 10000]
+            lane_immediate_danger = [False, False, False]
+            lane_side_risk = [False, False, False]
+            
+            for car_lane, offsets in enumerate(lane_offsets):
+                for dist in offsets:
                     # Check obstacles ahead (0 to 1000 units)
                     if 0 < dist < 1000:
-                        obstacles_in_lane.append(dist)
-                        min_obstacle_dist = min(min_obstacle_dist, dist)
+                        lane_obstacle_counts[car_lane] += 1
+                        if dist < lane_min_dists[car_lane]:
+                            lane_min_dists[car_lane] = dist
                         
                         # CRITICAL: Immediate danger (very close obstacle)
                         if dist < emergency_distance:
-                            has_immediate_danger = True
-                            lane_score -= 500  # Massive penalty
+                            lane_immediate_danger[car_lane] = True
+                            lane_scores[car_lane] -= 500  # Massive penalty
                         
                         # Dangerous (close obstacle)
                         elif dist < safety_margin:
-                            lane_score -= 300  # Heavy penalty
+                            lane_scores[car_lane] -= 300  # Heavy penalty
                         
                         # Caution (moderate distance)
                         elif dist < 500:
-                            lane_score -= 100  # Moderate penalty
+                            lane_scores[car_lane] -= 100  # Moderate penalty
                         
                         # Visible (far but should consider)
                         elif dist < 800:
-                            lane_score -= 30  # Light penalty
+                            lane_scores[car_lane] -= 30  # Light penalty
                     
                     # CRITICAL: Check for side-by-side collision when changing lanes
-                    if lane_idx != current_lane:
+                    if car_lane != current_lane:
                         # Car is beside us or very close - CANNOT CHANGE TO THIS LANE
                         if -80 < dist < 80:
-                            has_side_collision_risk = True
-                            lane_score = -10000  # Absolutely forbidden!
-            
-            # Additional scoring factors
-            
-            # Bonus for fewer obstacles
-            lane_score -= len(obstacles_in_lane) * 50
-            
-            # Huge bonus for clear lane
-            if len(obstacles_in_lane) == 0:
-                lane_score += 500
-            elif len(obstacles_in_lane) == 1 and min_obstacle_dist > 400:
-                lane_score += 200
-            
-            # Prefer staying in current lane (stability bonus) - but not if dangerous
-            if lane_idx == current_lane and not has_immediate_danger:
-                lane_score += 150
-            
-            # Penalty for changing multiple lanes (risky)
-            lane_difference = abs(lane_idx - current_lane)
-            if lane_difference == 2:
-                lane_score -= 100  # Avoid 2-lane changes unless necessary
-            
-            lane_safety_scores[lane_idx] = {
-                'score': lane_score,
-                'min_obstacle_dist': min_obstacle_dist,
-                'obstacles_count': len(obstacles_in_lane),
-                'immediate_danger': has_immediate_danger,
-                'side_collision_risk': has_side_collision_risk
-            }
-        
-        # ===== CHOOSE THE ABSOLUTELY SAFEST LANE =====
-        safest_lane = max(lane_safety_scores, key=lambda x: lane_safety_scores[x]['score'])
-        safest_lane_info = lane_safety_scores[safest_lane]
-        current_lane_info = lane_safety_scores[current_lane]
-        
-        # Determine if lane change is NECESSARY and SAFE
-        should_change_lane = False
-        
-        # EMERGENCY: Current lane has immediate danger - MUST move if possible
-        if current_lane_info['immediate_danger'] and not safest_lane_info['side_collision_risk']:
-            if safest_lane != current_lane and safest_lane_info['score'] > -1000:
-                should_change_lane = True
-        
-        # PROACTIVE: Current lane worse than other lane - change if significantly better
-        elif safest_lane != current_lane:
-            score_difference = safest_lane_info['score'] - current_lane_info['score']
-            # Only change if new lane is SIGNIFICANTLY better (at least 200 points)
-            if score_difference > 200 and not safest_lane_info['side_collision_risk']:
-                should_change_lane = True
-        
-        # ===== EXECUTE SMART LANE CHANGE =====
-        if should_change_lane and safest_lane != current_lane:
-            target_x = fuzzy_controller.lane_positions[safest_lane]
-            distance_to_target = abs(target_x - self.x)
-            
-            if distance_to_target > 5:
+                            lane_side_risk[car_lane] = True
+                            lane_scores[car_lane] = -10000  # Absolutely forbidden!
+                            break  # Lane is out - rest of its cars can't change that
+            
+            for lane_idx in range(3):
+                lane_score = lane_scores[lane_idx]
+                obstacles_count = lane_obstacle_counts[lane_idx]
+                min_obstacle_dist = lane_min_dists[lane_idx]
+                has_immediate_danger = lane_immediate_danger[lane_idx]
+                
+                # Additional scoring factors (skipped for forbidden lanes)
+                if not lane_side_risk[lane_idx]:
+                    # Bonus for fewer obstacles
+                    lane_score -= obstacles_count * 50
+                    
+                    # Huge bonus for clear lane
+                    if obstacles_count == 0:
+                        lane_score += 500
+                    elif obstacles_count == 1 and min_obstacle_dist > 400:
+                        lane_score += 200
+                    
+                    # Prefer staying in current lane (stability bonus) - but not if dangerous
+                    if lane_idx == current_lane and not has_immediate_danger:
+                        lane_score += 150
+                    
+                    # Penalty for changing multiple lanes (risky)
+                    lane_difference = abs(lane_idx - current_lane)
+                    if lane_difference == 2:
+                        lane_score -= 100  # Avoid 2-lane changes unless necessary
+                
+                lane_scores[lane_idx] = lane_score  # Final score, used to pick the safest lane
+                lane_safety_scores[lane_idx] = {
+                    'score': lane_score,
+                    'min_obstacle_dist': min_obstacle_dist,
+                    'obstacles_count': obstacles_count,
+                    'immediate_danger': has_immediate_danger,
+                    'side_collision_risk': lane_side_risk[lane_idx]
+                }
+            
+            # ===== CHOOSE THE ABSOLUTELY SAFEST LANE =====
+            safest_lane = lane_scores.index(max(lane_scores))  # First lane wins ties
+            safest_lane_info = lane_safety_scores[safest_lane]
+            current_lane_info = lane_safety_scores[current_lane]
+            
+            # Determine if lane change is NECESSARY and SAFE
+            should_change_lane = False
+            
+            # EMERGENCY: Current lane has immediate danger - MUST move if possible
+            if current_lane_info['immediate_danger'] and not safest_lane_info['side_collision_risk']:
+                if safest_lane != current_lane and safest_lane_info['score'] > -1000:
+                    should_change_lane = True
+            
+            # PROACTIVE: Current lane worse than other lane - change if significantly better
+            elif safest_lane != current_lane:
+                score_difference = safest_lane_info['score'] - current_lane_info['score']
+                # Only change if new lane is SIGNIFICANTLY better (at least 200 points)
+                if score_difference > 200 and not safest_lane_info['side_collision_risk']:
+                    should_change_lane = True
+            
+            # ===== PLAN SMART LANE CHANGE =====
+            if should_change_lane and safest_lane != current_lane:
                 # Determine steering speed based on urgency
                 if current_lane_info['immediate_danger']:
                     steering_speed = 14  # EMERGENCY: Move NOW!
@@ -3436,160 +3960,175 @@ class Vehicle:
                 else:
                     steering_speed = 7  # CAUTIOUS: Move gently
                 
-                # Apply smooth steering with boundary checks
-                if target_x < self.x:
-                    self.x = max(ROAD_X + 35, self.x - steering_speed)
-                else:
-                    self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
-        
-        # ===== AGGRESSIVE POWER-UP COLLECTION - KEY TO WINNING! =====
-        if not self.crashed:
-            best_powerup = None
-            best_powerup_score = 0
+                steering_plan.append((lane_positions[safest_lane], steering_speed))
             
-            for powerup in powerups:
-                if powerup.collected:
-                    continue
+            # ===== AGGRESSIVE POWER-UP COLLECTION - KEY TO WINNING! =====
+            if not self.crashed:
+                best_powerup = None
+                best_powerup_score = 0
                 
-                # Check if power-up is for this vehicle
-                if self.is_police and not powerup.for_police:
-                    continue
-                if not self.is_police and powerup.for_police:
-                    continue
+                # Per-lane traffic picture, built once and shared by every candidate
+                # lane_ahead: traffic offsets 0-400 ahead, lane_safe: nothing 0-250 ahead
+                # (same test as is_lane_safe_for_powerup with lookahead=250)
+                lane_ahead = []
+                lane_min_ahead = []
+                lane_safe = []
+                for offsets in lane_offsets:
+                    ahead = []
+                    nearest = 10000
+                    for car_dist in offsets:
+                        if 0 < car_dist < 400:  # Check ahead
+                            ahead.append(car_dist)
+                            if car_dist < nearest:
+                                nearest = car_dist
+                    lane_ahead.append(ahead)
+                    lane_min_ahead.append(nearest)
+                    lane_safe.append(nearest >= 250)
                 
-                # Check if power-up is nearby and reachable - EXTENDED RANGE!
-                powerup_lane = powerup.lane
-                distance_to_powerup = powerup.distance - self.distance
+                # Gap to the opponent is the same for every candidate
+                if opponent:
+                    opponent_dist = opponent.distance - my_distance
                 
-                # INCREASED from 400 to 600 - look further ahead for power-ups!
-                if 0 < distance_to_powerup < 600:
-                    # Strategic risk assessment for power-up collection
-                    lane_diff = abs(powerup_lane - current_lane)
-                    
-                    # Calculate collection risk
-                    traffic_in_powerup_lane = 0
-                    min_traffic_dist = 10000
-                    immediate_danger = False
-                    
-                    for car in traffic_cars:
-                        if car.lane == powerup_lane:
-                            car_dist = car.distance - self.distance
-                            if 0 < car_dist < 400:  # Check ahead
-                                traffic_in_powerup_lane += 1
-                                min_traffic_dist = min(min_traffic_dist, car_dist)
-                                # Check if obstacle is right at power-up location
-                                if abs(car.distance - powerup.distance) < 80:
-                                    immediate_danger = True
-                    
-                    # ENHANCED: Fuzzy decision with power priority and lane safety
-                    collection_score = 0
-                    
-                    # NEW: Base score from power priority system (balanced values)
-                    power_priority = powerup.get_priority_value()
-                    collection_score += power_priority * 30  # Scale priority to meaningful score
-                    
-                    # Factor 1: Distance to power-up (closer = better) - INCREASED VALUES!
-                    if distance_to_powerup < 150:
-                        collection_score += 60  # INCREASED from 40
-                    elif distance_to_powerup < 300:
-                        collection_score += 40  # INCREASED from 25
-                    elif distance_to_powerup < 450:
-                        collection_score += 25  # NEW tier
-                    else:
-                        collection_score += 15  # INCREASED from 10
-                    
-                    # Factor 2: Lane difference with SAFETY CHECK
-                    if lane_diff == 0:
-                        collection_score += 70  # INCREASED from 50 - already in lane
-                    elif lane_diff == 1:
-                        # Check if target lane is safe before adding score
-                        if self.is_lane_safe_for_powerup(powerup_lane, traffic_cars, lookahead=250):
-                            collection_score += 35  # Safe to switch
-                        else:
-                            collection_score -= 20  # Unsafe lane - heavy penalty
-                    else:  # lane_diff == 2
-                        # Two lanes away - must check intermediate safety
-                        if self.is_lane_safe_for_powerup(powerup_lane, traffic_cars, lookahead=250):
-                            collection_score += 15  # Safe but far
-                        else:
-                            collection_score -= 30  # Very unsafe - heavy penalty
+                for powerup in powerups:
+                    if powerup.collected:
+                        continue
                     
-                    # Factor 3: Traffic risk (clear = better) - MORE LENIENT!
-                    if immediate_danger:
-                        collection_score -= 50  # Dangerous obstacle at power-up
-                    elif traffic_in_powerup_lane == 0:
-                        collection_score += 40  # INCREASED from 30
-                    elif traffic_in_powerup_lane == 1 and min_traffic_dist > 150:
-                        collection_score += 25  # INCREASED from 15
-                    elif traffic_in_powerup_lane <= 2 and min_traffic_dist > 100:
-                        collection_score += 10  # NEW: Still worth it!
-                    else:
-                        collection_score -= 10  # REDUCED penalty from -20
+                    # Check if power-up is for this vehicle
+                    if self.is_police and not powerup.for_police:
+                        continue
+                    if not self.is_police and powerup.for_police:
+                        continue
                     
-                    # Factor 4: Power-up value using PRIORITY SYSTEM (no longer hardcoded)
-                    # Priority already added above, but add situational bonuses
-                    # High-value defensive powers get extra boost
-                    if powerup.power_type in ['ghost', 'shield', 'emp', 'magnet']:
-                        collection_score += 20  # Bonus for high-priority powers
+                    # Check if power-up is nearby and reachable - EXTENDED RANGE!
+                    powerup_lane = powerup.lane
+                    distance_to_powerup = powerup.distance - my_distance
                     
-                    # Factor 5: Opponent proximity - STRATEGIC NEED!
-                    if opponent:
-                        opponent_dist = opponent.distance - self.distance
-                        if not self.is_police:
-                            # THIEF: Defensive powers when police close - MASSIVELY INCREASED!
-                            if opponent_dist < 200:  # Police VERY close - CRITICAL!
-                                if powerup.power_type in ['freeze', 'shield', 'ghost']:
-                                    collection_score += 100  # CRITICAL SURVIVAL!
-                                elif powerup.power_type == 'boost':
-                                    collection_score += 80  # Escape boost!
-                            elif opponent_dist < 400:  # Police approaching
-                                if powerup.power_type in ['freeze', 'shield', 'ghost']:
-                                    collection_score += 60  # INCREASED from 50
-                                elif powerup.power_type in ['boost', 'turbo']:
-                                    collection_score += 50  # Speed escape!
+                    # INCREASED from 400 to 600 - look further ahead for power-ups!
+                    if 0 < distance_to_powerup < 600:
+                        # Strategic risk assessment for power-up collection
+                        lane_diff = abs(powerup_lane - current_lane)
+                        
+                        # Calculate collection risk
+                        ahead = lane_ahead[powerup_lane]
+                        traffic_in_powerup_lane = len(ahead)
+                        min_traffic_dist = lane_min_ahead[powerup_lane]
+                        immediate_danger = False
+                        
+                        for car_dist in ahead:
+                            # Check if obstacle is right at power-up location
+                            if -80 < car_dist - distance_to_powerup < 80:
+                                immediate_danger = True
+                                break
+                        
+                        # ENHANCED: Fuzzy decision with power priority and lane safety
+                        collection_score = 0
+                        
+                        # NEW: Base score from power priority system (balanced values)
+                        power_priority = powerup.priority_value
+                        collection_score += power_priority * 30  # Scale priority to meaningful score
+                        
+                        # Factor 1: Distance to power-up (closer = better) - INCREASED VALUES!
+                        distance_tier = ((distance_to_powerup >= 150) + (distance_to_powerup >= 300) +
+                                         (distance_to_powerup >= 450))
+                        collection_score += POWERUP_DISTANCE_BONUS[distance_tier]
+                        
+                        # Factor 2: Lane difference with SAFETY CHECK
+                        if lane_diff == 0:
+                            collection_score += 70  # INCREASED from 50 - already in lane
+                        elif lane_diff == 1:
+                            # Check if target lane is safe before adding score
+                            if lane_safe[powerup_lane]:
+                                collection_score += 35  # Safe to switch
+                            else:
+                                collection_score -= 20  # Unsafe lane - heavy penalty
+                        else:  # lane_diff == 2
+                            # Two lanes away - must check intermediate safety
+                            if lane_safe[powerup_lane]:
+                                collection_score += 15  # Safe but far
+                            else:
+                                collection_score -= 30  # Very unsafe - heavy penalty
+                        
+                        # Factor 3: Traffic risk (clear = better) - MORE LENIENT!
+                        if immediate_danger:
+                            collection_score -= 50  # Dangerous obstacle at power-up
+                        elif traffic_in_powerup_lane == 0:
+                            collection_score += 40  # INCREASED from 30
+                        elif traffic_in_powerup_lane == 1 and min_traffic_dist > 150:
+                            collection_score += 25  # INCREASED from 15
+                        elif traffic_in_powerup_lane <= 2 and min_traffic_dist > 100:
+                            collection_score += 10  # NEW: Still worth it!
                         else:
-                            # POLICE: Offensive powers to catch thief
-                            if opponent_dist < 300:  # Thief very close
-                                if powerup.power_type in ['emp', 'spike', 'magnet']:
-                                    collection_score += 70  # Catch opportunity!
-                            elif opponent_dist < 500:  # Thief in range
-                                if powerup.power_type in ['emp', 'turbo', 'magnet']:
-                                    collection_score += 45  # INCREASED from 30 - ESSENTIAL!
-                                elif powerup.power_type == 'roadblock':
-                                    collection_score += 40  # Block thief's path!
-                    
-                    # Track best power-up
-                    if collection_score > best_powerup_score:
-                        best_powerup_score = collection_score
-                        best_powerup = (powerup, powerup_lane)
-            
-            # EXECUTE: Go for best power-up if worth it
-            # Dynamic threshold based on opponent proximity
-            collection_threshold = 60  # Default threshold
-            if opponent and not self.is_police:
-                opponent_dist = opponent.distance - self.distance
-                if opponent_dist < 200:
-                    collection_threshold = 40  # Very aggressive when police close!
-                elif opponent_dist < 400:
-                    collection_threshold = 50  # Aggressive when police approaching
-            
-            if best_powerup and best_powerup_score > collection_threshold:
-                powerup_lane = best_powerup[1]
-                if powerup_lane != current_lane:
-                    # AGGRESSIVE steering toward power-up
-                    target_x = fuzzy_controller.lane_positions[powerup_lane]
-                    if abs(target_x - self.x) > 5:
+                            collection_score -= 10  # REDUCED penalty from -20
+                        
+                        # Factor 4: Power-up value using PRIORITY SYSTEM (no longer hardcoded)
+                        # Priority already added above, but add situational bonuses
+                        # High-value defensive powers get extra boost
+                        power_type = powerup.power_type
+                        if power_type in HIGH_VALUE_POWERS:
+                            collection_score += 20  # Bonus for high-priority powers
+                        
+                        # Factor 5: Opponent proximity - STRATEGIC NEED!
+                        if opponent:
+                            if not self.is_police:
+                                # THIEF: Defensive powers when police close - MASSIVELY INCREASED!
+                                if opponent_dist < 200:  # Police VERY close - CRITICAL!
+                                    if power_type in DEFENSIVE_POWERS:
+                                        collection_score += 100  # CRITICAL SURVIVAL!
+                                    elif power_type == 'boost':
+                                        collection_score += 80  # Escape boost!
+                                elif opponent_dist < 400:  # Police approaching
+                                    if power_type in DEFENSIVE_POWERS:
+                                        collection_score += 60  # INCREASED from 50
+                                    elif power_type in ESCAPE_POWERS:
+                                        collection_score += 50  # Speed escape!
+                            else:
+                                # POLICE: Offensive powers to catch thief
+                                if opponent_dist < 300:  # Thief very close
+                                    if power_type in CATCH_POWERS:
+                                        collection_score += 70  # Catch opportunity!
+                                elif opponent_dist < 500:  # Thief in range
+                                    if power_type in PURSUIT_POWERS:
+                                        collection_score += 45  # INCREASED from 30 - ESSENTIAL!
+                                    elif power_type == 'roadblock':
+                                        collection_score += 40  # Block thief's path!
+                        
+                        # Track best power-up
+                        if collection_score > best_powerup_score:
+                            best_powerup_score = collection_score
+                            best_powerup = (powerup, powerup_lane)
+                
+                # EXECUTE: Go for best power-up if worth it
+                # Dynamic threshold based on opponent proximity
+                collection_threshold = 60  # Default threshold
+                if opponent and not self.is_police:
+                    if opponent_dist < 200:
+                        collection_threshold = 40  # Very aggressive when police close!
+                    elif opponent_dist < 400:
+                        collection_threshold = 50  # Aggressive when police approaching
+                
+                if best_powerup and best_powerup_score > collection_threshold:
+                    powerup_lane = best_powerup[1]
+                    if powerup_lane != current_lane:
+                        # AGGRESSIVE steering toward power-up
                         # FASTER steering for power-ups - they're important!
-                        steering_speed = 9  # INCREASED from 6
-                        if target_x < self.x:
-                            self.x = max(ROAD_X + 35, self.x - steering_speed)
-                        else:
-                            self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                        steering_plan.append((lane_positions[powerup_lane], 9))  # INCREASED from 6
+            
+            self._fuzzy_plan = steering_plan
+            self._fuzzy_plan_tick = self._ai_tick
+        
+        # Apply planned steering in order (lane change, then power-up) with boundary checks
+        for target_x, steering_speed in self._fuzzy_plan:
+            if abs(target_x - self.x) > 5:
+                if target_x < self.x:
+                    self.x = max(left_bound, self.x - steering_speed)
+                else:
+                    self.x = min(right_bound, self.x + steering_speed)
         
         # ENFORCE 200 km/h SPEED LIMIT
         self.enforce_speed_limit()
     
-    def ai_decision_astar(self, traffic_cars, powerups, opponent, ghost_mode, astar_pathfinder):
+    def ai_decision_astar(self, traffic_cars, powerups, opponent, ghost_mode, astar_pathfinder,
+                          traffic_by_lane=None, lane_distances=None):
         """
         Advanced AI decision making using A* pathfinding algorithm.
         Finds optimal path considering obstacles, opponent, and objectives.
@@ -3600,46 +4139,50 @@ class Vehicle:
             opponent: Opponent vehicle
             ghost_mode: If True, can pass through traffic
             astar_pathfinder: AStarPathfinder instance with appropriate heuristic
+            traffic_by_lane: Optional per-frame traffic split by lane (see group_by_lane)
+            lane_distances: Optional per-frame sorted distances by lane (see build_lane_distances)
         """
+        # Road boundaries as locals (avoid repeated global lookups in the hot path)
+        left_bound = ROAD_X + 35
+        right_bound = ROAD_X + ROAD_WIDTH - 35
+        lane_positions = astar_pathfinder.lane_positions  # Tuple indexed by lane
+        
         if self.crashed:
             return
         
         # ======================================================================
         # PRIORITY 1: RUN PREDICTIVE SAFETY LAYER FIRST
         # ======================================================================
-        from game import FuzzyLogicController
-        fuzzy_temp = FuzzyLogicController() if not hasattr(self, '_fuzzy_temp') else self._fuzzy_temp
-        if not hasattr(self, '_fuzzy_temp'):
-            self._fuzzy_temp = fuzzy_temp
+        if Vehicle._shared_fuzzy is None:
+            Vehicle._shared_fuzzy = FuzzyLogicController()
+        fuzzy_temp = Vehicle._shared_fuzzy
         
-        safety_check = self.predictive_safety_check(traffic_cars, fuzzy_temp)
+        safety_check = self._scheduled_safety_check(traffic_cars, fuzzy_temp)
         current_lane = astar_pathfinder.get_lane_from_x(self.x)
         
         # If CRITICAL or HIGH danger detected, OVERRIDE A* with safety actions
-        if safety_check['recommended_action']['urgency'] in ['critical', 'high']:
+        if safety_check['recommended_action']['urgency'] >= Urgency.HIGH:
             # EMERGENCY MODE: Safety takes absolute priority
             
             # Apply emergency braking
             brake_intensity = safety_check['recommended_action']['brake_intensity']
-            if brake_intensity > 0.8:
-                self.speed = max(self.speed - self.brake_rate * 2.0, self.max_speed * 0.25)
-            elif brake_intensity > 0.5:
-                self.speed = max(self.speed - self.brake_rate * 1.5, self.max_speed * 0.40)
-            else:
-                self.speed = max(self.speed - self.brake_rate * 1.0, self.max_speed * 0.55)
+            # Tier 0 = critical (> 0.8), 1 = strong (> 0.5), 2 = moderate
+            tier = (brake_intensity <= 0.8) + (brake_intensity <= 0.5)
+            brake_mult, floor_ratio = EMERGENCY_BRAKE_TIERS[tier]
+            self._adjust_speed(-self.brake_rate * brake_mult, floor_ratio)
             
             # Execute emergency lane change if recommended
             if safety_check['recommended_action']['should_change_lane']:
                 safe_lanes = safety_check['safe_lanes']
-                target_lane = min(safe_lanes, key=lambda lane: abs(lane - current_lane))
-                target_x = astar_pathfinder.lane_positions[target_lane]
+                target_lane = closest_lane(safe_lanes, current_lane)
+                target_x = lane_positions[target_lane]
                 
                 if abs(target_x - self.x) > 5:
                     steering_speed = 14
                     if target_x < self.x:
-                        self.x = max(ROAD_X + 35, self.x - steering_speed)
+                        self.x = max(left_bound, self.x - steering_speed)
                     else:
-                        self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                        self.x = min(right_bound, self.x + steering_speed)
             
             self.enforce_speed_limit()
             return
@@ -3651,6 +4194,10 @@ class Vehicle:
         # Determine current position
         current_distance = self.distance
         
+        # Per-lane traffic lists so lane-specific scans skip the other lanes' cars
+        if traffic_by_lane is None:
+            traffic_by_lane = group_by_lane(traffic_cars)
+        
         # Determine goal based on vehicle type and situation
         goal_lane = current_lane
         goal_distance = current_distance + 500  # Default: look ahead 500 units
@@ -3664,7 +4211,7 @@ class Vehicle:
                 if distance_to_thief > 400:
                     # FAR BEHIND: Move forward aggressively, find clearest path
                     clearest_lane_info = astar_pathfinder.find_clearest_lane(
-                        current_distance, traffic_cars, look_ahead=800
+                        current_distance, traffic_cars, look_ahead=800, traffic_by_lane=traffic_by_lane
                     )
                     goal_lane = clearest_lane_info[0]  # Use clearest lane
                     goal_distance = current_distance + 900  # Move forward fast
@@ -3673,14 +4220,14 @@ class Vehicle:
                     # MEDIUM DISTANCE: STRATEGIC power-up collection with priority system
                     # Look for police power-ups - CRITICAL FOR CATCHING THIEF!
                     closest_police_powerup = None
-                    min_powerup_dist = float('inf')
+                    min_powerup_dist = INF
                     
                     for powerup in powerups:
                         if not powerup.collected and powerup.for_police:
                             dist_to_powerup = powerup.distance - current_distance
                             if 0 < dist_to_powerup < 900:  # INCREASED from 600 - Look further!
                                 # Use PRIORITY SYSTEM instead of hardcoded values
-                                power_priority = powerup.get_priority_value()
+                                power_priority = powerup.priority_value
                                 
                                 # Convert priority to distance reduction (higher priority = "closer" in decision)
                                 priority_bonus = -(power_priority * 200)  # Scale: 1.0-1.5 → -200 to -300
@@ -3696,47 +4243,31 @@ class Vehicle:
                         goal_distance = closest_police_powerup.distance
                         goal_lane = closest_police_powerup.lane
                         
-                        # Use new lane safety method
-                        is_lane_safe = self.is_lane_safe_for_powerup(goal_lane, traffic_cars, lookahead=300)
-                        
-                        # Additional immediate danger check
-                        immediate_danger = False
-                        for car in traffic_cars:
-                            if car.lane == goal_lane:
-                                if abs(car.distance - closest_police_powerup.distance) < 80:
-                                    immediate_danger = True
-                                    break
-                        
                         # Only pursue if safe OR power-up is extremely valuable
-                        if immediate_danger or not is_lane_safe:
-                            # Too dangerous unless it's a critical power-up
-                            if closest_police_powerup.get_priority_value() < 1.3:  # Not high priority
-                                # Use clear lane instead
+                        # (critical power-ups are worth the risk - powers are essential!)
+                        if closest_police_powerup.priority_value < 1.3:  # Not high priority
+                            lane_cars = traffic_by_lane[goal_lane]
+                            if (not self.is_lane_safe_for_powerup(goal_lane, lane_cars, lookahead=300) or
+                                    danger_at(lane_cars, goal_distance)):
+                                # Too dangerous - use clear lane instead
                                 clearest_lane_info = astar_pathfinder.find_clearest_lane(
-                                    current_distance, traffic_cars, look_ahead=700
+                                    current_distance, traffic_cars, look_ahead=700, traffic_by_lane=traffic_by_lane
                                 )
                                 goal_lane = clearest_lane_info[0]
                                 goal_distance = current_distance + 700
-                        # Else: GO FOR IT! Powers are essential!
-                        # Go for police power-up
-                        goal_distance = closest_police_powerup.distance
-                        goal_lane = closest_police_powerup.lane
                     else:
                         # Move toward thief's general direction but use clear lanes
                         thief_lane = astar_pathfinder.get_lane_from_x(opponent.x)
                         
                         # Check if thief's lane is clear
-                        lane_traffic_count = 0
-                        for car in traffic_cars:
-                            if car.lane == thief_lane:
-                                dist_to_car = car.distance - current_distance
-                                if 0 < dist_to_car < 500:
-                                    lane_traffic_count += 1
+                        if lane_distances is None:
+                            lane_distances = build_lane_distances(traffic_by_lane)
+                        lane_traffic_count = count_ahead(lane_distances[thief_lane], current_distance, 500)
                         
                         if lane_traffic_count > 2:
                             # Thief's lane is crowded, find better route
                             clearest_lane_info = astar_pathfinder.find_clearest_lane(
-                                current_distance, traffic_cars, look_ahead=700
+                                current_distance, traffic_cars, look_ahead=700, traffic_by_lane=traffic_by_lane
                             )
                             goal_lane = clearest_lane_info[0]
                         else:
@@ -3753,15 +4284,16 @@ class Vehicle:
                     
                     # Check adjacent lanes for better positioning
                     best_intercept_lane = thief_lane
-                    min_obstacles = float('inf')
+                    min_obstacles = INF
+                    
+                    # Count cars near the goal per lane in ONE pass (index = lane)
+                    lane_obstacle_counts = [0, 0, 0]
+                    for car in traffic_cars:
+                        if -300 < car.distance - goal_distance < 300:
+                            lane_obstacle_counts[car.lane] += 1
                     
-                    for check_lane in [max(0, thief_lane - 1), thief_lane, min(2, thief_lane + 1)]:
-                        obstacle_count = 0
-                        for car in traffic_cars:
-                            if car.lane == check_lane:
-                                dist_to_car = abs(car.distance - goal_distance)
-                                if dist_to_car < 300:
-                                    obstacle_count += 1
+                    for check_lane in (max(0, thief_lane - 1), thief_lane, min(2, thief_lane + 1)):
+                        obstacle_count = lane_obstacle_counts[check_lane]
                         if obstacle_count < min_obstacles:
                             min_obstacles = obstacle_count
                             best_intercept_lane = check_lane
@@ -3775,7 +4307,7 @@ class Vehicle:
             else:
                 # No opponent visible, move forward using clearest lane
                 clearest_lane_info = astar_pathfinder.find_clearest_lane(
-                    current_distance, traffic_cars, look_ahead=800
+                    current_distance, traffic_cars, look_ahead=800, traffic_by_lane=traffic_by_lane
                 )
                 goal_lane = clearest_lane_info[0]
                 goal_distance = current_distance + 800
@@ -3783,7 +4315,14 @@ class Vehicle:
             # Thief goal: AGGRESSIVE power-up collection for survival!
             # Priority 1: Look for valuable power-ups - CRITICAL FOR WINNING!
             closest_powerup = None
-            min_powerup_dist = float('inf')
+            min_powerup_dist = INF
+            
+            # Check police proximity for context (same for every power-up)
+            police_close = False
+            if opponent:
+                police_dist = opponent.distance - current_distance
+                if police_dist > -400:  # Police within 400m
+                    police_close = True
             
             for powerup in powerups:
                 if not powerup.collected and not powerup.for_police:
@@ -3791,30 +4330,23 @@ class Vehicle:
                     dist_to_powerup = powerup.distance - current_distance
                     if 0 < dist_to_powerup < 1500:  # INCREASED from 1200 - Look further!
                         # STRATEGIC: Prioritize based on power-up type and situation
-                        priority_bonus = 0
-                        
-                        # Check police proximity for context
-                        police_close = False
-                        if opponent:
-                            police_dist = opponent.distance - current_distance
-                            if police_dist > -400:  # Police within 400m
-                                police_close = True
+                        power_type = powerup.power_type
                         
                         # GAME-CHANGING POWERS - TOP PRIORITY!
-                        if powerup.power_type == 'freeze':
+                        if power_type == 'freeze':
                             priority_bonus = -300  # INCREASED - Can freeze police!
-                        elif powerup.power_type == 'ghost':
+                        elif power_type == 'ghost':
                             priority_bonus = -250  # INCREASED - Pass through obstacles!
-                        elif powerup.power_type == 'shield':
+                        elif power_type == 'shield':
                             priority_bonus = -250  # INCREASED - Prevents crashes!
-                        elif powerup.power_type == 'turbo' or powerup.power_type == 'boost':
+                        elif power_type in ESCAPE_POWERS:
                             priority_bonus = -200  # INCREASED - Speed advantage!
                         else:
                             priority_bonus = -100  # All powers are valuable!
                         
                         # EXTRA BONUS if police is close - DESPERATE NEED!
                         if police_close:
-                            if powerup.power_type in ['freeze', 'shield', 'ghost']:
+                            if power_type in DEFENSIVE_POWERS:
                                 priority_bonus -= 150  # CRITICAL when police near!
                         
                         effective_distance = dist_to_powerup + priority_bonus
@@ -3831,19 +4363,19 @@ class Vehicle:
                 # Verify lane safety - MORE TOLERANT!
                 traffic_in_lane = 0
                 immediate_danger = False
-                for car in traffic_cars:
-                    if car.lane == goal_lane:
-                        dist_to_car = car.distance - current_distance
-                        if 0 < dist_to_car < 500:
-                            traffic_in_lane += 1
-                            # Check if obstacle right at power-up
-                            if abs(car.distance - closest_powerup.distance) < 80:
-                                immediate_danger = True
+                powerup_distance = closest_powerup.distance
+                for car in traffic_by_lane[goal_lane]:
+                    dist_to_car = car.distance - current_distance
+                    if 0 < dist_to_car < 500:
+                        traffic_in_lane += 1
+                        # Check if obstacle right at power-up
+                        if -80 < car.distance - powerup_distance < 80:
+                            immediate_danger = True
                 
                 # Only abandon power-up if VERY dangerous
                 if immediate_danger or traffic_in_lane > 5:  # INCREASED from 3 - More willing to take risks!
                     clearest_lane_info = astar_pathfinder.find_clearest_lane(
-                        current_distance, traffic_cars, look_ahead=800
+                        current_distance, traffic_cars, look_ahead=800, traffic_by_lane=traffic_by_lane
                     )
                     goal_lane = clearest_lane_info[0]
                     goal_distance = current_distance + 800
@@ -3852,7 +4384,7 @@ class Vehicle:
                 # Priority 2: No power-ups nearby - focus on maintaining lead
                 # Always use clearest lane for fastest progress
                 clearest_lane_info = astar_pathfinder.find_clearest_lane(
-                    current_distance, traffic_cars, look_ahead=1000
+                    current_distance, traffic_cars, look_ahead=1000, traffic_by_lane=traffic_by_lane
                 )
                 goal_lane = clearest_lane_info[0]  # Use clearest lane
                 
@@ -3894,21 +4426,17 @@ class Vehicle:
             target_distance = next_waypoint[1]
             
             # Convert lane to x position
-            target_x = astar_pathfinder.lane_positions[target_lane]
+            target_x = lane_positions[target_lane]
+            
+            # Nearest car ahead in current lane - ONE lookup shared by steering and speed control
+            if lane_distances is None:
+                lane_distances = build_lane_distances(traffic_by_lane)
+            nearest_ahead_dist = nearest_ahead_gap(lane_distances[current_lane], current_distance)
             
             # IMPROVED: Faster steering for better obstacle avoidance
             if abs(target_x - self.x) > 5:
-                # Check for obstacles to determine urgency
-                obstacle_very_close = False
-                for car in traffic_cars:
-                    if car.lane == current_lane:
-                        dist = car.distance - self.distance
-                        if 0 < dist < 200:  # Very close obstacle
-                            obstacle_very_close = True
-                            break
-                
                 # BOTH police and thief need fast steering to avoid crashes!
-                if obstacle_very_close:
+                if nearest_ahead_dist < 200:  # Very close obstacle
                     steering_speed = 10  # Emergency steering
                 elif self.speed > 6:
                     steering_speed = 8  # Fast steering at high speed
@@ -3916,83 +4444,55 @@ class Vehicle:
                     steering_speed = 7  # Normal steering
                 
                 if target_x < self.x:
-                    self.x = max(ROAD_X + 35, self.x - steering_speed)
+                    self.x = max(left_bound, self.x - steering_speed)
                 else:
-                    self.x = min(ROAD_X + ROAD_WIDTH - 35, self.x + steering_speed)
+                    self.x = min(right_bound, self.x + steering_speed)
             
             # Speed control based on path and situation with INDEPENDENT rates
             if not self.crashed:
                 # IMPROVED: Check obstacles ahead with better detection - MORE AGGRESSIVE!
-                obstacle_ahead = False
-                closest_obstacle_distance = float('inf')
-                
-                for car in traffic_cars:
-                    if car.lane == current_lane:
-                        distance_to_car = car.distance - self.distance
-                        # Look MUCH further ahead for better reaction time
-                        look_ahead = 500 + (self.speed * 60)  # Speed-based look-ahead
-                        if 0 < distance_to_car < look_ahead and not ghost_mode:
-                            obstacle_ahead = True
-                            closest_obstacle_distance = min(closest_obstacle_distance, distance_to_car)
+                # Look MUCH further ahead for better reaction time
+                look_ahead = 500 + (self.speed * 60)  # Speed-based look-ahead
+                obstacle_ahead = not ghost_mode and nearest_ahead_dist < look_ahead
+                closest_obstacle_distance = nearest_ahead_dist
                 
                 # CRITICAL: Police speed control to prevent overtaking
                 if self.is_police and opponent:
                     distance_to_thief = opponent.distance - self.distance
                     
-                    # ZONE 1: Very close - extremely careful (CATCH zone)
-                    if distance_to_thief < 50:
-                        # At catch distance - move slowly to avoid overtaking
-                        target_speed = min(opponent.speed * 0.7, self.max_speed * 0.5)
-                        self.speed = max(self.speed - self.brake_rate * 1.5, target_speed)
-                        return  # Stop here, don't process further
-                    
-                    # ZONE 2: Close - match speed carefully
-                    elif distance_to_thief < 100:
-                        # Getting close - match thief's speed exactly
-                        target_speed = min(opponent.speed, self.max_speed * 0.85)
-                        if self.speed > target_speed:
-                            self.speed = max(self.speed - self.brake_rate, target_speed)
-                        else:
-                            self.speed = min(self.speed + self.acceleration_rate * 0.5, target_speed)
-                        return  # Don't accelerate further
-                    
-                    # ZONE 3: Medium close - start slowing approach
-                    elif distance_to_thief < 150:
-                        # Approaching - slow down gradually
-                        target_speed = min(opponent.speed * 1.1, self.max_speed * 0.9)
-                        if self.speed > target_speed:
-                            self.speed = max(self.speed - self.brake_rate * 0.7, target_speed)
+                    # Catch zones (see POLICE_CATCH_ZONES) - police level with or ahead
+                    # of the thief lands in the < 50 catch zone too
+                    if distance_to_thief < 150:
+                        zone = (distance_to_thief >= 50) + (distance_to_thief >= 100)
+                        thief_mult, cap_ratio, brake_mult, accel_mult = POLICE_CATCH_ZONES[zone]
+                        target_speed = opponent.speed * thief_mult
+                        speed_cap = self.max_speed * cap_ratio
+                        if speed_cap < target_speed:
+                            target_speed = speed_cap
+                        
+                        speed = self.speed
+                        if accel_mult is None or speed > target_speed:
+                            speed -= self.brake_rate * brake_mult
+                            if speed < target_speed:
+                                speed = target_speed
                         else:
-                            self.speed = min(self.speed + self.acceleration_rate * 0.8, target_speed)
-                        return
-                    
-                    # ZONE 4: If somehow ahead (shouldn't happen) - STOP IMMEDIATELY
-                    elif distance_to_thief <= 0:
-                        # Police is ahead or equal - STOP to catch
-                        self.speed = max(self.speed - self.brake_rate * 2, 2)  # Minimum speed to maintain
-                        return
+                            speed += self.acceleration_rate * accel_mult
+                            if speed > target_speed:
+                                speed = target_speed
+                        self.speed = speed
+                        return  # Stop here, don't process further
                 
                 # IMPROVED: Adaptive speed control based on obstacle distance - MORE AGGRESSIVE!
                 if obstacle_ahead:
                     # CRITICAL: Much more aggressive braking for crash prevention
-                    if closest_obstacle_distance < 120:
-                        # EMERGENCY: Very close - MAXIMUM BRAKE!
-                        self.speed = max(self.speed - self.brake_rate * 2.5, self.max_speed * 0.3)
-                    elif closest_obstacle_distance < 200:
-                        # CRITICAL: Close obstacle - very strong brake
-                        self.speed = max(self.speed - self.brake_rate * 1.8, self.max_speed * 0.5)
-                    elif closest_obstacle_distance < 300:
-                        # Close - significant brake
-                        self.speed = max(self.speed - self.brake_rate * 1.2, self.max_speed * 0.65)
-                    elif closest_obstacle_distance < 450:
-                        # Approaching - moderate brake
-                        self.speed = max(self.speed - self.brake_rate * 0.7, self.max_speed * 0.80)
-                    else:
-                        # Far obstacle - slight reduction
-                        self.speed = max(self.speed - self.brake_rate * 0.3, self.max_speed * 0.90)
+                    # Closer obstacle = harder brake (see ASTAR_OBSTACLE_BRAKE_TIERS)
+                    tier = ((closest_obstacle_distance >= 120) + (closest_obstacle_distance >= 200) +
+                            (closest_obstacle_distance >= 300) + (closest_obstacle_distance >= 450))
+                    brake_mult, floor_ratio = ASTAR_OBSTACLE_BRAKE_TIERS[tier]
+                    self._adjust_speed(-self.brake_rate * brake_mult, floor_ratio)
                 else:
                     # No obstacles - BOTH accelerate aggressively when clear!
-                    self.speed = min(self.speed + self.acceleration_rate * 1.2, self.max_speed)
+                    self._adjust_speed(self.acceleration_rate * 1.2)
         
         # ENFORCE 200 km/h SPEED LIMIT
         self.enforce_speed_limit()
@@ -4020,32 +4520,35 @@ class Vehicle:
         # Calculate y position based on distance from camera
         y_pos = self.distance - camera_offset + SCREEN_HEIGHT // 2
         
+        # Frame time and body edges, computed once for every layer below
+        now = pygame.time.get_ticks()
+        left = self.x - self.half_width
+        right = self.x + self.half_width
+        top = y_pos - self.half_height
+        bottom = y_pos + self.half_height
+        
         # Shadow
-        shadow_surface = pygame.Surface((self.width + 10, self.height + 10), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surface, (0, 0, 0, 80), shadow_surface.get_rect())
-        screen.blit(shadow_surface, (self.x - self.width//2 - 5, y_pos + self.height//2))
+        screen.blit(get_shadow_surface(self.width + 10, self.height + 10, (0, 0, 0, 80)), (left - 5, bottom))
         
         # Shield effect (if active)
         if self.shield_active:
-            pulse = abs(math.sin(pygame.time.get_ticks() / 200))
+            pulse = abs(math.sin(now / 200))
             shield_radius = int(self.width * 0.9 + pulse * 10)
             for i in range(3):
                 alpha = int(80 - i * 20)
                 shield_color = (150, 255, 150, alpha)
-                shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(shield_surface, shield_color, (shield_radius, shield_radius), shield_radius - i * 5, 3)
+                shield_surface = get_glow_surface(shield_radius * 2, shield_color, shield_radius - i * 5, 3)
                 screen.blit(shield_surface, (self.x - shield_radius, y_pos - shield_radius))
         
         # Ghost mode effect (if active)
         if self.ghost_mode:
             # Make vehicle semi-transparent with ghostly aura
-            ghost_pulse = abs(math.sin(pygame.time.get_ticks() / 150))
+            ghost_pulse = abs(math.sin(now / 150))
             for i in range(3):
                 ghost_radius = int(self.width * 0.8 + ghost_pulse * 8 + i * 8)
                 alpha = int(50 - i * 15)
                 ghost_color = (200, 150, 255, alpha)
-                ghost_surface = pygame.Surface((ghost_radius * 2, ghost_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(ghost_surface, ghost_color, (ghost_radius, ghost_radius), ghost_radius)
+                ghost_surface = get_glow_surface(ghost_radius * 2, ghost_color, ghost_radius)
                 screen.blit(ghost_surface, (self.x - ghost_radius, y_pos - ghost_radius))
         
         # Determine vehicle color (gray if crashed)
@@ -4053,70 +4556,53 @@ class Vehicle:
         
         # Flash effect when crashed
         if self.crashed and (self.crash_timer // 5) % 2 == 0:
-            vehicle_color = tuple(min(c + 100, 255) for c in vehicle_color)
+            vehicle_color = lighten(vehicle_color, 100)
         
         # Main body with gradient effect
-        body_rect = pygame.Rect(self.x - self.width//2, y_pos - self.height//2, self.width, self.height)
+        body_rect = pygame.Rect(left, top, self.width, self.height)
         
         # Apply rotation if crashed
         if self.crashed and self.crash_timer > 0:
-            # Create surface for rotation
-            temp_surface = pygame.Surface((self.width + 40, self.height + 40), pygame.SRCALPHA)
-            temp_rect = temp_surface.get_rect(center=(self.width // 2 + 20, self.height // 2 + 20))
-            
-            # Draw vehicle on temp surface
-            draw_x = 20
-            draw_y = 20
-            pygame.draw.rect(temp_surface, vehicle_color, 
-                           (draw_x, draw_y, self.width, self.height), border_radius=10)
-            
-            # Rotate the surface
+            # Rotated body (pre-rendered per color and angle, see get_crash_frame)
             rotation_angle = self.crash_spin * (1 - self.crash_timer / 60)
-            rotated_surface = pygame.transform.rotate(temp_surface, rotation_angle)
+            rotated_surface = get_crash_frame(vehicle_color, self.width, self.height, rotation_angle)
             rotated_rect = rotated_surface.get_rect(center=(self.x, y_pos))
             screen.blit(rotated_surface, rotated_rect)
             
             # Crash particles/sparks
             if self.crash_timer > 40:
                 for i in range(3):
-                    spark_x = self.x + random.randint(-20, 20)
-                    spark_y = y_pos + random.randint(-20, 20)
-                    pygame.draw.circle(screen, ORANGE, (int(spark_x), int(spark_y)), 
-                                     random.randint(2, 5))
+                    index = (self.spark_index + i) % SPARK_POOL_SIZE
+                    offset_x, offset_y = SPARK_OFFSETS[index]
+                    pygame.draw.circle(screen, ORANGE, (int(self.x + offset_x), int(y_pos + offset_y)), 
+                                     SPARK_RADII[index])
+                self.spark_index = (self.spark_index + 3) % SPARK_POOL_SIZE
         else:
             # Normal drawing (no crash)
             # Draw body with multiple layers for depth
             pygame.draw.rect(screen, vehicle_color, body_rect, border_radius=10)
             
             # Highlight on top
-            highlight_color = tuple(min(c + 50, 255) for c in vehicle_color)
-            highlight_rect = pygame.Rect(self.x - self.width//2 + 5, y_pos - self.height//2 + 5, 
-                                          self.width - 10, 15)
+            highlight_color = lighten(vehicle_color, 50)
+            highlight_rect = pygame.Rect(left + 5, top + 5, self.width - 10, 15)
             pygame.draw.rect(screen, highlight_color, highlight_rect, border_radius=5)
             
             # Windshield with reflection
-            windshield_color = (100, 200, 255, 200)
-            windshield_surface = pygame.Surface((self.width - 12, 30), pygame.SRCALPHA)
-            pygame.draw.rect(windshield_surface, windshield_color, windshield_surface.get_rect(), border_radius=5)
-            screen.blit(windshield_surface, (self.x - self.width//2 + 6, y_pos - self.height//2 + 12))
+            windshield_surface = get_rounded_panel(self.width - 12, 30, (100, 200, 255, 200), 5)
+            screen.blit(windshield_surface, (left + 6, top + 12))
             
             # Windows on sides
-            pygame.draw.rect(screen, (80, 160, 220), (self.x - self.width//2 + 3, y_pos - self.height//2 + 20, 8, 15))
-            pygame.draw.rect(screen, (80, 160, 220), (self.x + self.width//2 - 11, y_pos - self.height//2 + 20, 8, 15))
-            
-            # Wheels with rotation effect
-            wheel_color = (40, 40, 40)
-            wheel_highlight = (80, 80, 80)
-            
-            # Front wheels
-            for wheel_x in [self.x - self.width//2 + 8, self.x + self.width//2 - 8]:
-                pygame.draw.circle(screen, wheel_color, (int(wheel_x), int(y_pos - self.height//2 + 15)), 8)
-                pygame.draw.circle(screen, wheel_highlight, (int(wheel_x), int(y_pos - self.height//2 + 15)), 4)
-                
-            # Back wheels
-            for wheel_x in [self.x - self.width//2 + 8, self.x + self.width//2 - 8]:
-                pygame.draw.circle(screen, wheel_color, (int(wheel_x), int(y_pos + self.height//2 - 15)), 8)
-                pygame.draw.circle(screen, wheel_highlight, (int(wheel_x), int(y_pos + self.height//2 - 15)), 4)
+            pygame.draw.rect(screen, (80, 160, 220), (left + 3, top + 20, 8, 15))
+            pygame.draw.rect(screen, (80, 160, 220), (right - 11, top + 20, 8, 15))
+            
+            # Wheels: front pair then back pair, one pre-rendered sprite in a single blits call
+            wheel = get_wheel_sprite(8, 4)
+            wheel_left = int(left + 8) - 8
+            wheel_right = int(right - 8) - 8
+            front_y = int(top + 15) - 8
+            back_y = int(bottom - 15) - 8
+            screen.blits(((wheel, (wheel_left, front_y)), (wheel, (wheel_right, front_y)),
+                          (wheel, (wheel_left, back_y)), (wheel, (wheel_right, back_y))), False)
             
             # Headlights with glow
             if not self.is_police:
@@ -4124,59 +4610,62 @@ class Vehicle:
                 for radius in [8, 6, 4]:
                     alpha = 80 - radius * 8
                     glow_color = (*YELLOW, alpha)
-                    glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surface, glow_color, (radius * 2, radius * 2), radius)
-                    screen.blit(glow_surface, (int(self.x - self.width//2 + 10 - radius * 2), 
-                                               int(y_pos - self.height//2 + 5 - radius * 2)))
-                    screen.blit(glow_surface, (int(self.x + self.width//2 - 10 - radius * 2), 
-                                               int(y_pos - self.height//2 + 5 - radius * 2)))
+                    glow_surface = get_glow_surface(radius * 4, glow_color, radius)
+                    screen.blit(glow_surface, (int(left + 10 - radius * 2), 
+                                               int(top + 5 - radius * 2)))
+                    screen.blit(glow_surface, (int(right - 10 - radius * 2), 
+                                               int(top + 5 - radius * 2)))
                 
-                pygame.draw.circle(screen, YELLOW, (int(self.x - self.width//2 + 10), int(y_pos - self.height//2 + 5)), 5)
-                pygame.draw.circle(screen, YELLOW, (int(self.x + self.width//2 - 10), int(y_pos - self.height//2 + 5)), 5)
+                pygame.draw.circle(screen, YELLOW, (int(left + 10), int(top + 5)), 5)
+                pygame.draw.circle(screen, YELLOW, (int(right - 10), int(top + 5)), 5)
             
             # Police lights with enhanced animation
             if self.is_police:
-                light_offset = (pygame.time.get_ticks() // 150) % 2
+                light_offset = (now // 150) % 2
                 
                 # Siren bar
-                pygame.draw.rect(screen, (20, 20, 20), (self.x - 20, y_pos - self.height//2 + 2, 40, 8), border_radius=2)
+                pygame.draw.rect(screen, (20, 20, 20), (self.x - 20, top + 2, 40, 8), border_radius=2)
                 
                 if light_offset == 0:
                     # Red light with glow
                     for radius in [10, 7, 5]:
                         alpha = 100 - radius * 8
-                        glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
-                        pygame.draw.circle(glow_surface, (*RED, alpha), (radius * 2, radius * 2), radius)
-                        screen.blit(glow_surface, (int(self.x - 12 - radius * 2), int(y_pos - self.height//2 + 6 - radius * 2)))
+                        glow_surface = get_glow_surface(radius * 4, (*RED, alpha), radius)
+                        screen.blit(glow_surface, (int(self.x - 12 - radius * 2), int(top + 6 - radius * 2)))
                     
-                    pygame.draw.circle(screen, RED, (int(self.x - 12), int(y_pos - self.height//2 + 6)), 6)
-                    pygame.draw.circle(screen, BLUE, (int(self.x + 12), int(y_pos - self.height//2 + 6)), 4)
+                    pygame.draw.circle(screen, RED, (int(self.x - 12), int(top + 6)), 6)
+                    pygame.draw.circle(screen, BLUE, (int(self.x + 12), int(top + 6)), 4)
                 else:
                     # Blue light with glow
                     for radius in [10, 7, 5]:
                         alpha = 100 - radius * 8
-                        glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
-                        pygame.draw.circle(glow_surface, (*BLUE, alpha), (radius * 2, radius * 2), radius)
-                        screen.blit(glow_surface, (int(self.x + 12 - radius * 2), int(y_pos - self.height//2 + 6 - radius * 2)))
+                        glow_surface = get_glow_surface(radius * 4, (*BLUE, alpha), radius)
+                        screen.blit(glow_surface, (int(self.x + 12 - radius * 2), int(top + 6 - radius * 2)))
                     
-                    pygame.draw.circle(screen, BLUE, (int(self.x + 12), int(y_pos - self.height//2 + 6)), 6)
-                    pygame.draw.circle(screen, RED, (int(self.x - 12), int(y_pos - self.height//2 + 6)), 4)
+                    pygame.draw.circle(screen, BLUE, (int(self.x + 12), int(top + 6)), 6)
+                    pygame.draw.circle(screen, RED, (int(self.x - 12), int(top + 6)), 4)
             
             # Tail lights
-            pygame.draw.circle(screen, (180, 0, 0), (int(self.x - self.width//2 + 10), int(y_pos + self.height//2 - 8)), 4)
-            pygame.draw.circle(screen, (180, 0, 0), (int(self.x + self.width//2 - 10), int(y_pos + self.height//2 - 8)), 4)
+            pygame.draw.circle(screen, (180, 0, 0), (int(left + 10), int(bottom - 8)), 4)
+            pygame.draw.circle(screen, (180, 0, 0), (int(right - 10), int(bottom - 8)), 4)
             
             # Side mirrors
-            pygame.draw.rect(screen, DARK_GRAY, (self.x - self.width//2 - 5, y_pos - 5, 5, 8))
-            pygame.draw.rect(screen, DARK_GRAY, (self.x + self.width//2, y_pos - 5, 5, 8))
+            pygame.draw.rect(screen, DARK_GRAY, (left - 5, y_pos - 5, 5, 8))
+            pygame.draw.rect(screen, DARK_GRAY, (right, y_pos - 5, 5, 8))
 
 class TrafficCar:
+    # Fixed attribute layout: the AI scans every traffic car several times per frame
+    __slots__ = ('lane', 'x', 'distance', 'width', 'height', 'half_width', 'half_height',
+                 'colors', 'color', 'speed')
+    
     def __init__(self, lane, distance):
         self.lane = lane
         self.x = ROAD_X + lane * LANE_WIDTH + LANE_WIDTH // 2
         self.distance = distance
         self.width = 48
         self.height = 75
+        self.half_width = self.width // 2  # Size never changes, so halve once for draw()
+        self.half_height = self.height // 2
         self.colors = [(220, 20, 60), (30, 144, 255), (34, 139, 34), (255, 140, 0), 
                        (138, 43, 226), (255, 215, 0), (220, 220, 220)]
         self.color = random.choice(self.colors)
@@ -4189,290 +4678,256 @@ class TrafficCar:
         y_pos = self.distance - camera_offset + SCREEN_HEIGHT // 2
         
         if -100 < y_pos < SCREEN_HEIGHT + 100:
+            # Body edges, computed once for every part below
+            left = self.x - self.half_width
+            right = self.x + self.half_width
+            top = y_pos - self.half_height
+            bottom = y_pos + self.half_height
+            
             # Shadow
-            shadow_surface = pygame.Surface((self.width + 8, self.height + 8), pygame.SRCALPHA)
-            pygame.draw.ellipse(shadow_surface, (0, 0, 0, 60), shadow_surface.get_rect())
-            screen.blit(shadow_surface, (self.x - self.width//2 - 4, y_pos + self.height//2))
+            screen.blit(get_shadow_surface(self.width + 8, self.height + 8, (0, 0, 0, 60)), (left - 4, bottom))
             
             # Car body
             pygame.draw.rect(screen, self.color, 
-                           (self.x - self.width//2, y_pos - self.height//2, self.width, self.height), 
+                           (left, top, self.width, self.height), 
                            border_radius=8)
             
             # Highlight
-            highlight_color = tuple(min(c + 40, 255) for c in self.color)
+            highlight_color = lighten(self.color, 40)
             pygame.draw.rect(screen, highlight_color, 
-                           (self.x - self.width//2 + 4, y_pos - self.height//2 + 4, self.width - 8, 12), 
+                           (left + 4, top + 4, self.width - 8, 12), 
                            border_radius=4)
             
             # Windshield
-            windshield_surface = pygame.Surface((self.width - 10, 20), pygame.SRCALPHA)
-            pygame.draw.rect(windshield_surface, (100, 180, 255, 180), windshield_surface.get_rect(), border_radius=4)
-            screen.blit(windshield_surface, (self.x - self.width//2 + 5, y_pos + self.height//2 - 28))
-            
-            # Wheels
-            wheel_color = (40, 40, 40)
-            for wx in [self.x - self.width//2 + 7, self.x + self.width//2 - 7]:
-                for wy in [y_pos - self.height//2 + 12, y_pos + self.height//2 - 12]:
-                    pygame.draw.circle(screen, wheel_color, (int(wx), int(wy)), 6)
-                    pygame.draw.circle(screen, (80, 80, 80), (int(wx), int(wy)), 3)
+            windshield_surface = get_rounded_panel(self.width - 10, 20, (100, 180, 255, 180), 4)
+            screen.blit(windshield_surface, (left + 5, bottom - 28))
+            
+            # Wheels (pre-rendered sprite, all four in a single blits call)
+            wheel = get_wheel_sprite(6, 3)
+            wheel_left = int(left + 7) - 6
+            wheel_right = int(right - 7) - 6
+            front_y = int(top + 12) - 6
+            back_y = int(bottom - 12) - 6
+            screen.blits(((wheel, (wheel_left, front_y)), (wheel, (wheel_left, back_y)),
+                          (wheel, (wheel_right, front_y)), (wheel, (wheel_right, back_y))), False)
             
             # Tail lights
-            pygame.draw.circle(screen, (180, 0, 0), (int(self.x - self.width//2 + 8), int(y_pos + self.height//2 - 6)), 3)
-            pygame.draw.circle(screen, (180, 0, 0), (int(self.x + self.width//2 - 8), int(y_pos + self.height//2 - 6)), 3)
+            pygame.draw.circle(screen, (180, 0, 0), (int(left + 8), int(bottom - 6)), 3)
+            pygame.draw.circle(screen, (180, 0, 0), (int(right - 8), int(bottom - 6)), 3)
+
+# Background building tiles: 8 building types, each pre-rendered once into its own
+# transparent Surface and blitted every frame instead of redrawn primitive by primitive
+BUILDING_TILE_SIZE = (230, 220)  # Widest (230) and tallest (blue tower, 220) building
+building_tiles = {}
+
+# Per-row colors of the building window/panel gradients, (rows, 3) uint8 ramps
+BRICK_WINDOW_RAMP = np.array([(250 - j * 4, 240 - j * 4, min(255, 270 - j * 4)) for j in range(18)], dtype=np.uint8)
+GLASS_PANEL_RAMP = np.array([(110 + abs(17 - j) * 2, 130 + abs(17 - j) * 2, 160 + abs(17 - j) * 2)
+                             for j in range(35)], dtype=np.uint8)
+CYAN_WINDOW_RAMP = np.array([(180 - j * 3, 210 - j * 3, 220 - j * 3) for j in range(20)], dtype=np.uint8)
+
+def fill_row_gradient(surface, x, y, width, ramp):
+    """Paint rows y.. (one per ramp entry) across columns x..x+width-1 in one array store"""
+    pixels = pygame.surfarray.pixels3d(surface)
+    pixels[x:x + width, y:y + len(ramp)] = ramp
+    del pixels  # Unlock the surface before any further drawing
+
+def draw_building_with_shadow(surface, x, y, w, h, color):
+    """Building body with right-hand shadow, top highlight and border"""
+    # Shadow
+    shadow = darken(color, 40)
+    pygame.draw.rect(surface, shadow, (x + w - 12, y, 12, h))
+    # Main body
+    pygame.draw.rect(surface, color, (x, y, w - 12, h))
+    # Highlight on top
+    highlight = lighten(color, 25)
+    pygame.draw.rect(surface, highlight, (x, y, w - 12, 6))
+    # Border
+    border = darken(color, 50)
+    pygame.draw.rect(surface, border, (x, y, w, h), 2)
+
+def draw_building_tile(surface, building_type, x, y_base):
+    """Draw background building type 0-7 with its top-left corner at (x, y_base)"""
+    if building_type == 0:
+        # Red brick building with detailed windows
+        draw_building_with_shadow(surface, x, y_base, 230, 180, (195, 75, 65))
+        for wx in range(x + 12, x + 200, 24):
+            for wy in range(y_base + 15, y_base + 165, 28):
+                if wy + 20 < y_base + 180:
+                    # Gradient windows
+                    fill_row_gradient(surface, wx, wy, 19, BRICK_WINDOW_RAMP)
+                    pygame.draw.rect(surface, (40, 40, 50), (wx, wy, 18, 18), 1)
+        
+    elif building_type == 1:
+        # Blue glass tower with reflective panels
+        draw_building_with_shadow(surface, x, y_base, 230, 220, (55, 95, 175))
+        for panel_y in range(y_base + 10, y_base + 210, 40):
+            if panel_y + 35 < y_base + 220:
+                fill_row_gradient(surface, x + 5, panel_y, 206, GLASS_PANEL_RAMP)
+                pygame.draw.line(surface, (35, 65, 135), (x + 5, panel_y), (x + 210, panel_y), 2)
+        
+    elif building_type == 2:
+        # Yellow office with grid windows
+        draw_building_with_shadow(surface, x, y_base, 230, 190, (210, 190, 95))
+        for wx in range(x + 15, x + 200, 26):
+            for wy in range(y_base + 20, y_base + 175, 30):
+                if wy + 22 < y_base + 190:
+                    pygame.draw.rect(surface, (255, 255, 200), (wx, wy, 20, 22))
+                    pygame.draw.rect(surface, (60, 60, 70), (wx, wy, 20, 22), 2)
+                    pygame.draw.line(surface, (60, 60, 70), (wx + 10, wy), (wx + 10, wy + 22), 1)
+        
+    elif building_type == 3:
+        # Purple apartment with balconies
+        draw_building_with_shadow(surface, x, y_base, 230, 200, (135, 95, 155))
+        floor_h = 33
+        for floor in range(6):
+            floor_y = y_base + 15 + floor * floor_h
+            if floor_y + 25 < y_base + 200:
+                # Balcony
+                pygame.draw.rect(surface, (115, 75, 135), (x + 5, floor_y + 20, 210, 4))
+                # Windows
+                for window_x in [x + 20, x + 100, x + 180]:
+                    pygame.draw.rect(surface, (255, 245, 180), (window_x, floor_y, 22, 18))
+                    pygame.draw.rect(surface, (55, 55, 65), (window_x, floor_y, 22, 18), 2)
+        
+    elif building_type == 4:
+        # Orange modern building
+        draw_building_with_shadow(surface, x, y_base, 230, 210, (230, 135, 65))
+        for band in range(0, 210, 42):
+            pygame.draw.rect(surface, (200, 110, 50), (x, y_base + band, 218, 5))
+        for wx in range(x + 12, x + 200, 24):
+            for wy in range(y_base + 18, y_base + 195, 28):
+                if wy + 20 < y_base + 210:
+                    pygame.draw.rect(surface, (255, 255, 180), (wx, wy, 19, 20))
+                    pygame.draw.rect(surface, (180, 100, 50), (wx, wy, 19, 20), 1)
+        
+    elif building_type == 5:
+        # Green eco building
+        draw_building_with_shadow(surface, x, y_base, 230, 185, (95, 175, 115))
+        for wx in range(x + 18, x + 200, 28):
+            for wy in range(y_base + 18, y_base + 170, 30):
+                if wy + 22 < y_base + 185:
+                    pygame.draw.rect(surface, (235, 255, 200), (wx, wy, 22, 22))
+                    pygame.draw.rect(surface, (65, 145, 85), (wx, wy, 22, 22), 2)
+        
+    elif building_type == 6:
+        # Detailed house with pitched roof
+        house_x, house_y = x + 15, y_base + 35
+        draw_building_with_shadow(surface, house_x, house_y, 200, 115, (235, 195, 175))
+        # Roof with shingles
+        roof_pts = [(house_x - 8, house_y), (house_x + 94, y_base + 8), (house_x + 196, house_y)]
+        pygame.draw.polygon(surface, (170, 65, 55), roof_pts)
+        for j in range(0, 200, 10):
+            pygame.draw.line(surface, (145, 50, 45), (house_x - 8 + j, house_y), 
+                           (house_x - 8 + j//2, y_base + 8 + j//4), 1)
+        # Chimney
+        pygame.draw.rect(surface, (125, 55, 45), (house_x + 150, y_base + 15, 14, 25))
+        # Door
+        pygame.draw.rect(surface, (85, 55, 35), (house_x + 20, house_y + 75, 25, 40))
+        pygame.draw.circle(surface, (200, 170, 0), (house_x + 40, house_y + 95), 3)
+        # Windows
+        for wx, wy in [(house_x + 60, house_y + 20), (house_x + 130, house_y + 20)]:
+            pygame.draw.rect(surface, (150, 200, 250), (wx, wy, 30, 28))
+            pygame.draw.rect(surface, (75, 60, 50), (wx, wy, 30, 28), 2)
+            pygame.draw.line(surface, (75, 60, 50), (wx + 15, wy), (wx + 15, wy + 28), 2)
+            pygame.draw.line(surface, (75, 60, 50), (wx, wy + 14), (wx + 30, wy + 14), 2)
+    
+    else:
+        # Cyan modern tower
+        draw_building_with_shadow(surface, x, y_base, 230, 195, (65, 175, 195))
+        for wx in range(x + 10, x + 200, 22):
+            for wy in range(y_base + 14, y_base + 180, 25):
+                if wy + 20 < y_base + 195:
+                    fill_row_gradient(surface, wx, wy, 19, CYAN_WINDOW_RAMP)
+                    pygame.draw.rect(surface, (45, 135, 155), (wx, wy, 18, 20), 1)
+
+# Sky + grass gradient behind the scenery, rendered once (never changes)
+background_gradient = None
+
+# Per-row colors of that gradient: sky over the top half, grass over the bottom half
+BACKGROUND_RAMP = np.array(
+    [(int(135 + (i / (SCREEN_HEIGHT // 2)) * 50), int(206 - (i / (SCREEN_HEIGHT // 2)) * 30), 250)
+     for i in range(SCREEN_HEIGHT // 2)] +
+    [(int(60 + (i / (SCREEN_HEIGHT // 2)) * 40), int(160 + (i / (SCREEN_HEIGHT // 2)) * 20),
+      int(60 + (i / (SCREEN_HEIGHT // 2)) * 40))
+     for i in range(SCREEN_HEIGHT - SCREEN_HEIGHT // 2)],
+    dtype=np.uint8)
+
+def get_background_gradient():
+    """Full-screen sky/ground gradient Surface (built on first use)"""
+    global background_gradient
+    if background_gradient is None:
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Every column gets the same rows, so it's one array store instead of a line per row
+        fill_row_gradient(surface, 0, 0, SCREEN_WIDTH, BACKGROUND_RAMP)
+        background_gradient = surface.convert()
+    return background_gradient
+
+def get_building_tile(building_type):
+    """Pre-rendered Surface of a background building type (built on first use)"""
+    tile = building_tiles.get(building_type)
+    if tile is None:
+        tile = pygame.Surface(BUILDING_TILE_SIZE, pygame.SRCALPHA)
+        draw_building_tile(tile, building_type, 0, 0)
+        tile = tile.convert_alpha()
+        building_tiles[building_type] = tile
+    return tile
+
+# Whole scenery columns: every building slot of one side stacked into a single Surface,
+# keyed by the type of the first (topmost) building - the type cycle repeats every 8
+BUILDING_SPACING = 160
+BUILDING_SLOTS = SCREEN_HEIGHT // BUILDING_SPACING + 5  # Slots i = -2 .. SCREEN_HEIGHT // 160 + 2
+building_strips = {}
+
+def get_building_strip(first_type):
+    """Pre-composed column of BUILDING_SLOTS building tiles, 160px apart (built on first use)"""
+    strip = building_strips.get(first_type)
+    if strip is None:
+        strip = pygame.Surface((BUILDING_TILE_SIZE[0],
+                                (BUILDING_SLOTS - 1) * BUILDING_SPACING + BUILDING_TILE_SIZE[1]),
+                               pygame.SRCALPHA)
+        # Later (lower) buildings overlap the one above, same order as drawing them one by one
+        for slot in range(BUILDING_SLOTS):
+            strip.blit(get_building_tile((first_type + slot) % 8), (0, slot * BUILDING_SPACING))
+        strip = strip.convert_alpha()
+        building_strips[first_type] = strip
+    return strip
 
 def draw_background_scenery(screen, camera_offset):
     """Draw vibrant city background with colorful buildings"""
     
-    # Sky with smooth gradient 
-    for i in range(SCREEN_HEIGHT // 2):
-        ratio = i / (SCREEN_HEIGHT // 2)
-        r = int(135 + ratio * 50)
-        g = int(206 - ratio * 30)
-        b = 250
-        pygame.draw.line(screen, (r, g, b), (0, i), (SCREEN_WIDTH, i))
-    
-    # Ground - smooth grass gradient  
-    for i in range(SCREEN_HEIGHT // 2, SCREEN_HEIGHT):
-        ratio = (i - SCREEN_HEIGHT // 2) / (SCREEN_HEIGHT // 2)
-        shade = int(60 + ratio * 40)
-        pygame.draw.line(screen, (shade, int(160 + ratio * 20), shade), (0, i), (SCREEN_WIDTH, i))
+    # Sky and ground gradient (pre-rendered, see get_background_gradient)
+    screen.blit(get_background_gradient(), (0, 0))
     
     # Calculate scroll offset with smoother parallax
     scroll_offset = int(camera_offset * 0.3) % 200
     
-    # Helper to draw building with shadow
-    def draw_building_with_shadow(x, y, w, h, color):
-        if y > SCREEN_HEIGHT or y + h < 0:
-            return
-        # Shadow
-        shadow = tuple(max(0, c - 40) for c in color)
-        pygame.draw.rect(screen, shadow, (x + w - 12, y, 12, h))
-        # Main body
-        pygame.draw.rect(screen, color, (x, y, w - 12, h))
-        # Highlight on top
-        highlight = tuple(min(255, c + 25) for c in color)
-        pygame.draw.rect(screen, highlight, (x, y, w - 12, 6))
-        # Border
-        border = tuple(max(0, c - 50) for c in color)
-        pygame.draw.rect(screen, border, (x, y, w, h), 2)
-    
-    # LEFT SIDE - Colorful buildings with scrolling
-    left_x = 5
-    building_spacing = 160
-    
-    for i in range(-2, (SCREEN_HEIGHT // building_spacing) + 3):
-        y_base = i * building_spacing - scroll_offset
-        building_type = (i + int(camera_offset // building_spacing)) % 8
-        
-        if building_type == 0:
-            # Red brick building with detailed windows
-            draw_building_with_shadow(left_x, y_base, 230, 180, (195, 75, 65))
-            for wx in range(left_x + 12, left_x + 200, 24):
-                for wy in range(y_base + 15, y_base + 165, 28):
-                    if wy + 20 < y_base + 180:
-                        # Gradient windows
-                        for j in range(18):
-                            bright = 250 - j * 4
-                            pygame.draw.line(screen, (bright, bright - 10, min(255, bright + 20)), 
-                                           (wx, wy + j), (wx + 18, wy + j))
-                        pygame.draw.rect(screen, (40, 40, 50), (wx, wy, 18, 18), 1)
-            
-        elif building_type == 1:
-            # Blue glass tower with reflective panels
-            draw_building_with_shadow(left_x, y_base, 230, 220, (55, 95, 175))
-            for panel_y in range(y_base + 10, y_base + 210, 40):
-                if panel_y + 35 < y_base + 220:
-                    for j in range(35):
-                        bright = 110 + abs(17 - j) * 2
-                        pygame.draw.line(screen, (bright, bright + 20, bright + 50), 
-                                       (left_x + 5, panel_y + j), (left_x + 210, panel_y + j))
-                    pygame.draw.line(screen, (35, 65, 135), (left_x + 5, panel_y), (left_x + 210, panel_y), 2)
-            
-        elif building_type == 2:
-            # Yellow office with grid windows
-            draw_building_with_shadow(left_x, y_base, 230, 190, (210, 190, 95))
-            for wx in range(left_x + 15, left_x + 200, 26):
-                for wy in range(y_base + 20, y_base + 175, 30):
-                    if wy + 22 < y_base + 190:
-                        pygame.draw.rect(screen, (255, 255, 200), (wx, wy, 20, 22))
-                        pygame.draw.rect(screen, (60, 60, 70), (wx, wy, 20, 22), 2)
-                        pygame.draw.line(screen, (60, 60, 70), (wx + 10, wy), (wx + 10, wy + 22), 1)
-            
-        elif building_type == 3:
-            # Purple apartment with balconies
-            draw_building_with_shadow(left_x, y_base, 230, 200, (135, 95, 155))
-            floor_h = 33
-            for floor in range(6):
-                floor_y = y_base + 15 + floor * floor_h
-                if floor_y + 25 < y_base + 200:
-                    # Balcony
-                    pygame.draw.rect(screen, (115, 75, 135), (left_x + 5, floor_y + 20, 210, 4))
-                    # Windows
-                    for window_x in [left_x + 20, left_x + 100, left_x + 180]:
-                        pygame.draw.rect(screen, (255, 245, 180), (window_x, floor_y, 22, 18))
-                        pygame.draw.rect(screen, (55, 55, 65), (window_x, floor_y, 22, 18), 2)
-            
-        elif building_type == 4:
-            # Orange modern building
-            draw_building_with_shadow(left_x, y_base, 230, 210, (230, 135, 65))
-            for band in range(0, 210, 42):
-                pygame.draw.rect(screen, (200, 110, 50), (left_x, y_base + band, 218, 5))
-            for wx in range(left_x + 12, left_x + 200, 24):
-                for wy in range(y_base + 18, y_base + 195, 28):
-                    if wy + 20 < y_base + 210:
-                        pygame.draw.rect(screen, (255, 255, 180), (wx, wy, 19, 20))
-                        pygame.draw.rect(screen, (180, 100, 50), (wx, wy, 19, 20), 1)
-            
-        elif building_type == 5:
-            # Green eco building
-            draw_building_with_shadow(left_x, y_base, 230, 185, (95, 175, 115))
-            for wx in range(left_x + 18, left_x + 200, 28):
-                for wy in range(y_base + 18, y_base + 170, 30):
-                    if wy + 22 < y_base + 185:
-                        pygame.draw.rect(screen, (235, 255, 200), (wx, wy, 22, 22))
-                        pygame.draw.rect(screen, (65, 145, 85), (wx, wy, 22, 22), 2)
-            
-        elif building_type == 6:
-            # Detailed house with pitched roof
-            house_x, house_y = left_x + 15, y_base + 35
-            draw_building_with_shadow(house_x, house_y, 200, 115, (235, 195, 175))
-            # Roof with shingles
-            roof_pts = [(house_x - 8, house_y), (house_x + 94, y_base + 8), (house_x + 196, house_y)]
-            pygame.draw.polygon(screen, (170, 65, 55), roof_pts)
-            for j in range(0, 200, 10):
-                pygame.draw.line(screen, (145, 50, 45), (house_x - 8 + j, house_y), 
-                               (house_x - 8 + j//2, y_base + 8 + j//4), 1)
-            # Chimney
-            pygame.draw.rect(screen, (125, 55, 45), (house_x + 150, y_base + 15, 14, 25))
-            # Door
-            pygame.draw.rect(screen, (85, 55, 35), (house_x + 20, house_y + 75, 25, 40))
-            pygame.draw.circle(screen, (200, 170, 0), (house_x + 40, house_y + 95), 3)
-            # Windows
-            for wx, wy in [(house_x + 60, house_y + 20), (house_x + 130, house_y + 20)]:
-                pygame.draw.rect(screen, (150, 200, 250), (wx, wy, 30, 28))
-                pygame.draw.rect(screen, (75, 60, 50), (wx, wy, 30, 28), 2)
-                pygame.draw.line(screen, (75, 60, 50), (wx + 15, wy), (wx + 15, wy + 28), 2)
-                pygame.draw.line(screen, (75, 60, 50), (wx, wy + 14), (wx + 30, wy + 14), 2)
-        
-        else:
-            # Cyan modern tower
-            draw_building_with_shadow(left_x, y_base, 230, 195, (65, 175, 195))
-            for wx in range(left_x + 10, left_x + 200, 22):
-                for wy in range(y_base + 14, y_base + 180, 25):
-                    if wy + 20 < y_base + 195:
-                        for j in range(20):
-                            bright = 210 - j * 3
-                            pygame.draw.line(screen, (bright - 30, bright, bright + 10), 
-                                           (wx, wy + j), (wx + 18, wy + j))
-                        pygame.draw.rect(screen, (45, 135, 155), (wx, wy, 18, 20), 1)
-    
-    # RIGHT SIDE - Same buildings mirrored
-    right_x = SCREEN_WIDTH - 235
-    
-    for i in range(-2, (SCREEN_HEIGHT // building_spacing) + 3):
-        y_base = i * building_spacing - scroll_offset
-        building_type = (i + int(camera_offset // building_spacing) + 4) % 8
-        
-        if building_type == 0:
-            draw_building_with_shadow(right_x, y_base, 230, 180, (195, 75, 65))
-            for wx in range(right_x + 12, right_x + 200, 24):
-                for wy in range(y_base + 15, y_base + 165, 28):
-                    if wy + 20 < y_base + 180:
-                        for j in range(18):
-                            bright = 250 - j * 4
-                            pygame.draw.line(screen, (bright, bright - 10, min(255, bright + 20)), 
-                                           (wx, wy + j), (wx + 18, wy + j))
-                        pygame.draw.rect(screen, (40, 40, 50), (wx, wy, 18, 18), 1)
-            
-        elif building_type == 1:
-            draw_building_with_shadow(right_x, y_base, 230, 220, (55, 95, 175))
-            for panel_y in range(y_base + 10, y_base + 210, 40):
-                if panel_y + 35 < y_base + 220:
-                    for j in range(35):
-                        bright = 110 + abs(17 - j) * 2
-                        pygame.draw.line(screen, (bright, bright + 20, bright + 50), 
-                                       (right_x + 5, panel_y + j), (right_x + 210, panel_y + j))
-                    pygame.draw.line(screen, (35, 65, 135), (right_x + 5, panel_y), (right_x + 210, panel_y), 2)
-            
-        elif building_type == 2:
-            draw_building_with_shadow(right_x, y_base, 230, 190, (210, 190, 95))
-            for wx in range(right_x + 15, right_x + 200, 26):
-                for wy in range(y_base + 20, y_base + 175, 30):
-                    if wy + 22 < y_base + 190:
-                        pygame.draw.rect(screen, (255, 255, 200), (wx, wy, 20, 22))
-                        pygame.draw.rect(screen, (60, 60, 70), (wx, wy, 20, 22), 2)
-                        pygame.draw.line(screen, (60, 60, 70), (wx + 10, wy), (wx + 10, wy + 22), 1)
-            
-        elif building_type == 3:
-            draw_building_with_shadow(right_x, y_base, 230, 200, (135, 95, 155))
-            floor_h = 33
-            for floor in range(6):
-                floor_y = y_base + 15 + floor * floor_h
-                if floor_y + 25 < y_base + 200:
-                    pygame.draw.rect(screen, (115, 75, 135), (right_x + 5, floor_y + 20, 210, 4))
-                    for window_x in [right_x + 20, right_x + 100, right_x + 180]:
-                        pygame.draw.rect(screen, (255, 245, 180), (window_x, floor_y, 22, 18))
-                        pygame.draw.rect(screen, (55, 55, 65), (window_x, floor_y, 22, 18), 2)
-            
-        elif building_type == 4:
-            draw_building_with_shadow(right_x, y_base, 230, 210, (230, 135, 65))
-            for band in range(0, 210, 42):
-                pygame.draw.rect(screen, (200, 110, 50), (right_x, y_base + band, 218, 5))
-            for wx in range(right_x + 12, right_x + 200, 24):
-                for wy in range(y_base + 18, y_base + 195, 28):
-                    if wy + 20 < y_base + 210:
-                        pygame.draw.rect(screen, (255, 255, 180), (wx, wy, 19, 20))
-                        pygame.draw.rect(screen, (180, 100, 50), (wx, wy, 19, 20), 1)
-            
-        elif building_type == 5:
-            draw_building_with_shadow(right_x, y_base, 230, 185, (95, 175, 115))
-            for wx in range(right_x + 18, right_x + 200, 28):
-                for wy in range(y_base + 18, y_base + 170, 30):
-                    if wy + 22 < y_base + 185:
-                        pygame.draw.rect(screen, (235, 255, 200), (wx, wy, 22, 22))
-                        pygame.draw.rect(screen, (65, 145, 85), (wx, wy, 22, 22), 2)
-            
-        elif building_type == 6:
-            house_x, house_y = right_x + 15, y_base + 35
-            draw_building_with_shadow(house_x, house_y, 200, 115, (235, 195, 175))
-            roof_pts = [(house_x - 8, house_y), (house_x + 94, y_base + 8), (house_x + 196, house_y)]
-            pygame.draw.polygon(screen, (170, 65, 55), roof_pts)
-            for j in range(0, 200, 10):
-                pygame.draw.line(screen, (145, 50, 45), (house_x - 8 + j, house_y), 
-                               (house_x - 8 + j//2, y_base + 8 + j//4), 1)
-            pygame.draw.rect(screen, (125, 55, 45), (house_x + 150, y_base + 15, 14, 25))
-            pygame.draw.rect(screen, (85, 55, 35), (house_x + 20, house_y + 75, 25, 40))
-            pygame.draw.circle(screen, (200, 170, 0), (house_x + 40, house_y + 95), 3)
-            for wx, wy in [(house_x + 60, house_y + 20), (house_x + 130, house_y + 20)]:
-                pygame.draw.rect(screen, (150, 200, 250), (wx, wy, 30, 28))
-                pygame.draw.rect(screen, (75, 60, 50), (wx, wy, 30, 28), 2)
-                pygame.draw.line(screen, (75, 60, 50), (wx + 15, wy), (wx + 15, wy + 28), 2)
-                pygame.draw.line(screen, (75, 60, 50), (wx, wy + 14), (wx + 30, wy + 14), 2)
-        
-        else:
-            draw_building_with_shadow(right_x, y_base, 230, 195, (65, 175, 195))
-            for wx in range(right_x + 10, right_x + 200, 22):
-                for wy in range(y_base + 14, y_base + 180, 25):
-                    if wy + 20 < y_base + 195:
-                        for j in range(20):
-                            bright = 210 - j * 3
-                            pygame.draw.line(screen, (bright - 30, bright, bright + 10), 
-                                           (wx, wy + j), (wx + 18, wy + j))
-                        pygame.draw.rect(screen, (45, 135, 155), (wx, wy, 18, 20), 1)
+    # Buildings: one pre-composed column per side, starting at slot i = -2
+    # (building type of slot i is (i + camera_offset // 160) % 8, right side 4 types further on)
+    first_type = (int(camera_offset // BUILDING_SPACING) - 2) % 8
+    strip_y = -2 * BUILDING_SPACING - scroll_offset
     
-    # Draw curbs (edges between sidewalk and road)
-    pygame.draw.rect(screen, (100, 100, 100), (ROAD_X - 10, 0, 10, SCREEN_HEIGHT))
-    pygame.draw.rect(screen, (100, 100, 100), (ROAD_X + ROAD_WIDTH, 0, 10, SCREEN_HEIGHT))
+    # LEFT SIDE at x=5, RIGHT SIDE (same buildings mirrored) at the far edge
+    scenery_blits = [(get_building_strip(first_type), (5, strip_y)),
+                     (get_building_strip((first_type + 4) % 8), (SCREEN_WIDTH - 235, strip_y))]
+    
+    # (Curbs are drawn by draw_road, which always runs right after this - as plain fills,
+    # which beat blitting a curb Surface)
     
-    # Street lamps along the road edges
+    # Street lamps along the road edges (pole bases 25px outside the road) - every lamp is the
+    # same sprite, queued behind the buildings so the whole scenery goes out in one blits call
     lamp_spacing = 100
     lamp_offset = int(camera_offset % lamp_spacing)
+    lamp = get_street_lamp_sprite()
+    anchor_x, anchor_y = STREET_LAMP_ANCHOR
+    left_lamp_x = ROAD_X - 25 - anchor_x
+    right_lamp_x = ROAD_X + ROAD_WIDTH + 25 - anchor_x
     for i in range(-1, SCREEN_HEIGHT // lamp_spacing + 2):
         y = i * lamp_spacing - lamp_offset
         if 0 < y < SCREEN_HEIGHT:
-            draw_street_lamp(screen, ROAD_X - 25, y)
-            draw_street_lamp(screen, ROAD_X + ROAD_WIDTH + 25, y)
+            scenery_blits.append((lamp, (left_lamp_x, y - anchor_y)))
+            scenery_blits.append((lamp, (right_lamp_x, y - anchor_y)))
+    screen.blits(scenery_blits, False)
 
 def draw_simple_building(screen, x, y, width, height, base_color):
     """Draw a simple background building"""
@@ -4509,7 +4964,7 @@ def draw_skyscraper(screen, x, y, width, height):
         pygame.draw.rect(screen, building_color, (x, y, width, height))
         
         # Darker side for depth
-        shadow_color = tuple(max(0, c - 20) for c in building_color)
+        shadow_color = darken(building_color, 20)
         pygame.draw.rect(screen, shadow_color, (x + width - 15, y, 15, height))
         
         # Building edge outline
@@ -4550,7 +5005,7 @@ def draw_office_building(screen, x, y, width, height):
         pygame.draw.rect(screen, building_color, (x, y, width, height))
         
         # Side shadow
-        shadow_color = tuple(max(0, c - 25) for c in building_color)
+        shadow_color = darken(building_color, 25)
         pygame.draw.rect(screen, shadow_color, (x + width - 12, y, 12, height))
         
         # Horizontal bands
@@ -4592,7 +5047,7 @@ def draw_apartment(screen, x, y, width, height):
         pygame.draw.rect(screen, building_color, (x, y, width, height))
         
         # Side shadow
-        shadow_color = tuple(max(0, c - 30) for c in building_color)
+        shadow_color = darken(building_color, 30)
         pygame.draw.rect(screen, shadow_color, (x + width - 10, y, 10, height))
         
         # Balconies
@@ -4646,7 +5101,7 @@ def draw_shop(screen, x, y, width, height):
         pygame.draw.rect(screen, awning_color, (x, awning_y, width, awning_height))
         
         # Awning stripes
-        stripe_color = tuple(max(0, c - 60) for c in awning_color)
+        stripe_color = darken(awning_color, 60)
         for i in range(0, int(width), 15):
             if i % 30 == 0:
                 pygame.draw.rect(screen, stripe_color, (x + i, awning_y, 15, awning_height))
@@ -4672,23 +5127,28 @@ def draw_shop(screen, x, y, width, height):
         # Building outline
         pygame.draw.rect(screen, (55, 60, 65), (x, y, width, height), 3)
 
-def draw_street_lamp(screen, x, y):
-    """Draw a street lamp"""
-    if 0 < y < SCREEN_HEIGHT:
+# Street lamp sprite (pole, head, translucent glow, bright center), rendered once.
+# A lamp with its pole base at (x, y) is blitted at (x - anchor_x, y - anchor_y)
+STREET_LAMP_ANCHOR = (10, 40)
+street_lamp_sprite = None
+
+def get_street_lamp_sprite():
+    """Transparent street lamp Surface (built on first use)"""
+    global street_lamp_sprite
+    if street_lamp_sprite is None:
+        sprite = pygame.Surface((20, 45), pygame.SRCALPHA)
         # Pole
-        pygame.draw.rect(screen, (60, 60, 60), (x - 2, y - 30, 4, 35))
-        
+        pygame.draw.rect(sprite, (60, 60, 60), (8, 10, 4, 35))
         # Lamp head
-        pygame.draw.circle(screen, (80, 80, 80), (int(x), int(y - 30)), 6)
-        
-        # Light glow
-        glow_color = (255, 255, 150, 60)
+        pygame.draw.circle(sprite, (80, 80, 80), (10, 10), 6)
+        # Light glow (blended over the head like it used to be on screen)
         glow_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, glow_color, (10, 10), 10)
-        screen.blit(glow_surface, (x - 10, y - 40))
-        
+        pygame.draw.circle(glow_surface, (255, 255, 150, 60), (10, 10), 10)
+        sprite.blit(glow_surface, (0, 0))
         # Bright center
-        pygame.draw.circle(screen, (255, 255, 200), (int(x), int(y - 30)), 3)
+        pygame.draw.circle(sprite, (255, 255, 200), (10, 10), 3)
+        street_lamp_sprite = sprite.convert_alpha()
+    return street_lamp_sprite
 
 def draw_tree(screen, x, y, size):
     """Draw a simple tree"""
@@ -4704,74 +5164,148 @@ def draw_tree(screen, x, y, size):
         pygame.draw.circle(screen, leaf_color, (int(x - size//3), int(y + size//4)), int(size * 0.5))
         pygame.draw.circle(screen, leaf_color, (int(x + size//3), int(y + size//4)), int(size * 0.5))
 
+# Road surface darkening towards the bottom of the screen, rendered once
+# (ROAD_WIDTH + 1 wide - the per-row lines it replaces included both end points)
+road_gradient = None
+
+def get_road_gradient():
+    """Road-wide vertical gray gradient Surface (built on first use)"""
+    global road_gradient
+    if road_gradient is None:
+        darkness = np.array([int(50 - (y / SCREEN_HEIGHT) * 15) for y in range(SCREEN_HEIGHT)], dtype=np.uint8)
+        pixels = np.empty((ROAD_WIDTH + 1, SCREEN_HEIGHT, 3), dtype=np.uint8)
+        pixels[:] = darkness[None, :, None]
+        road_gradient = pygame.surfarray.make_surface(pixels).convert()
+    return road_gradient
+
+# Sidewalk paving: 20px slabs alternating two grays, one column shared by both sides.
+# The slab colors don't follow the scroll, so the column just moves up by camera_offset % 20
+sidewalk_strips = {}
+
+def get_sidewalk_strip(width):
+    """Sidewalk slab column Surface, SCREEN_HEIGHT tall (cached by width)"""
+    strip = sidewalk_strips.get(width)
+    if strip is None:
+        strip = pygame.Surface((width, SCREEN_HEIGHT))
+        for i in range(0, SCREEN_HEIGHT, 20):
+            color = (140, 140, 140) if (i // 20) % 2 == 0 else (150, 150, 150)
+            pygame.draw.rect(strip, color, (0, i, width, 20))
+        strip = strip.convert()
+        sidewalk_strips[width] = strip
+    return strip
+
+# Lane divider dashes for one scroll offset (0 .. 89), a transparent screen-height column
+# with each dash already at its perspective width (width depends on the dash's screen y,
+# so a single strip can't just be scrolled) - 90 small Surfaces at most
+LANE_DASH_HEIGHT = 50
+LANE_DASH_GAP = 40
+lane_dash_strips = {}
+
+def get_lane_dash_strip(offset):
+    """Dash column for scroll offset, blit at (divider x - 2, 0) (cached)"""
+    strip = lane_dash_strips.get(offset)
+    if strip is None:
+        strip = pygame.Surface((6, SCREEN_HEIGHT), pygame.SRCALPHA)
+        for y in range(-offset, SCREEN_HEIGHT, LANE_DASH_HEIGHT + LANE_DASH_GAP):
+            # Dashed lines with perspective
+            width = 4 + int((y / SCREEN_HEIGHT) * 2)
+            pygame.draw.rect(strip, WHITE, (2 - width//2, y, width, LANE_DASH_HEIGHT))
+        strip = strip.convert_alpha()
+        lane_dash_strips[offset] = strip
+    return strip
+
 def draw_road(screen, camera_offset):
     """Draw 3D perspective road with city elements"""
     # Draw narrow sidewalks only near the road (don't cover buildings)
     sidewalk_width = 40  # Much narrower sidewalk
     
-    # Left sidewalk with pattern (only near road edge)
-    for i in range(0, SCREEN_HEIGHT, 20):
-        y = i - int(camera_offset % 20)
-        color = (140, 140, 140) if (i // 20) % 2 == 0 else (150, 150, 150)
-        pygame.draw.rect(screen, color, (ROAD_X - sidewalk_width, y, sidewalk_width - 10, 20))
-    
-    # Right sidewalk with pattern (only near road edge)
-    for i in range(0, SCREEN_HEIGHT, 20):
-        y = i - int(camera_offset % 20)
-        color = (140, 140, 140) if (i // 20) % 2 == 0 else (150, 150, 150)
-        pygame.draw.rect(screen, color, (ROAD_X + ROAD_WIDTH + 10, y, sidewalk_width - 10, 20))
+    # Left and right sidewalks with pattern (only near road edge)
+    sidewalk = get_sidewalk_strip(sidewalk_width - 10)
+    sidewalk_y = -int(camera_offset % 20)
+    screen.blits(((sidewalk, (ROAD_X - sidewalk_width, sidewalk_y)),
+                  (sidewalk, (ROAD_X + ROAD_WIDTH + 10, sidewalk_y))), False)
     
     # Draw curbs (edges between sidewalk and road)
-    pygame.draw.rect(screen, (100, 100, 100), (ROAD_X - 10, 0, 10, SCREEN_HEIGHT))
-    pygame.draw.rect(screen, (100, 100, 100), (ROAD_X + ROAD_WIDTH, 0, 10, SCREEN_HEIGHT))
+    # Full-height opaque rects: Surface.fill is the cheaper path for these
+    fill = screen.fill
+    fill((100, 100, 100), (ROAD_X - 10, 0, 10, SCREEN_HEIGHT))
+    fill((100, 100, 100), (ROAD_X + ROAD_WIDTH, 0, 10, SCREEN_HEIGHT))
     
-    # Draw road with gradient for depth effect
-    for y in range(SCREEN_HEIGHT):
-        darkness = int(50 - (y / SCREEN_HEIGHT) * 15)
-        road_color = (darkness, darkness, darkness)
-        pygame.draw.line(screen, road_color, (ROAD_X, y), (ROAD_X + ROAD_WIDTH, y))
+    # Draw road with gradient for depth effect (pre-rendered, see get_road_gradient)
+    screen.blit(get_road_gradient(), (ROAD_X, 0))
     
     # Draw road edge white lines
-    pygame.draw.rect(screen, WHITE, (ROAD_X, 0, 4, SCREEN_HEIGHT))
-    pygame.draw.rect(screen, WHITE, (ROAD_X + ROAD_WIDTH - 4, 0, 4, SCREEN_HEIGHT))
-    
-    # Draw lane dividers with animation
-    dash_height = 50
-    dash_gap = 40
-    offset = int(camera_offset % (dash_height + dash_gap))
+    fill(WHITE, (ROAD_X, 0, 4, SCREEN_HEIGHT))
+    fill(WHITE, (ROAD_X + ROAD_WIDTH - 4, 0, 4, SCREEN_HEIGHT))
     
-    for lane in range(1, 3):
-        x = ROAD_X + lane * LANE_WIDTH
-        for y in range(-offset, SCREEN_HEIGHT, dash_height + dash_gap):
-            # Dashed lines with perspective
-            width = 4 + int((y / SCREEN_HEIGHT) * 2)
-            pygame.draw.rect(screen, WHITE, (x - width//2, y, width, dash_height))
+    # Draw lane dividers with animation (pre-rendered per scroll offset, see get_lane_dash_strip)
+    dashes = get_lane_dash_strip(int(camera_offset % (LANE_DASH_HEIGHT + LANE_DASH_GAP)))
+    screen.blits(((dashes, (ROAD_X + LANE_WIDTH - 2, 0)),
+                  (dashes, (ROAD_X + 2 * LANE_WIDTH - 2, 0))), False)
+
+# HUD top bar fade (140 rows, black 200 -> ~32 alpha), rendered once
+hud_top_bar = None
+
+def get_hud_top_bar():
+    """Translucent top-of-screen HUD backdrop Surface (built on first use)"""
+    global hud_top_bar
+    if hud_top_bar is None:
+        top_bar = pygame.Surface((SCREEN_WIDTH, 140), pygame.SRCALPHA)
+        top_bar.fill((0, 0, 0, 0))
+        alpha = pygame.surfarray.pixels_alpha(top_bar)
+        alpha[:] = np.array([int(200 - (i * 1.2)) for i in range(140)], dtype=np.uint8)[None, :]
+        del alpha  # Unlock the surface before converting
+        hud_top_bar = top_bar.convert_alpha()
+    return hud_top_bar
+
+# HUD title: black 4-way outline + orange text, composed once with a 2px margin
+hud_title = None
+
+def get_hud_title():
+    """Outlined "ROAD RUSH" title Surface, blit 2px up-left of the text origin (built on first use)"""
+    global hud_title
+    if hud_title is None:
+        title_text = "🏁 ROAD RUSH"
+        outline = get_text(48, title_text, BLACK)
+        title = pygame.Surface((outline.get_width() + 4, outline.get_height() + 4), pygame.SRCALPHA)
+        for offset in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
+            title.blit(outline, (2 + offset[0], 2 + offset[1]))
+        title.blit(get_text(48, title_text, ORANGE), (2, 2))
+        hud_title = title.convert_alpha()
+    return hud_title
+
+# Full-width speed bar fills keyed by tier color (left 70% -> right 100% brightness),
+# blitted cropped to the current fill width
+SPEED_BAR_SIZE = (200, 24)
+speed_bar_strips = {}
+
+def get_speed_bar_strip(bar_color):
+    """Speed bar gradient Surface for one tier color (cached)"""
+    strip = speed_bar_strips.get(bar_color)
+    if strip is None:
+        bar_width, bar_height = SPEED_BAR_SIZE
+        fades = 0.7 + (np.arange(bar_width) / bar_width) * 0.3
+        column_colors = (np.array(bar_color, dtype=float)[None, :] * fades[:, None]).astype(np.uint8)
+        pixels = np.empty((bar_width, bar_height, 3), dtype=np.uint8)
+        pixels[:] = column_colors[:, None, :]
+        strip = pygame.surfarray.make_surface(pixels).convert()
+        speed_bar_strips[bar_color] = strip
+    return strip
 
 def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0, shield_timer=0, ghost_timer=0, emp_timer=0, powerups_collected=0):
     """Enhanced HUD with TWO separate speed meters for Police and Thief"""
-    # Top bar with gradient
-    top_bar = pygame.Surface((SCREEN_WIDTH, 140), pygame.SRCALPHA)
-    for i in range(140):
-        alpha = int(200 - (i * 1.2))
-        pygame.draw.line(top_bar, (0, 0, 0, alpha), (0, i), (SCREEN_WIDTH, i))
-    screen.blit(top_bar, (0, 0))
-    
-    # Title with glow effect
-    font_title = pygame.font.Font(None, 48)
-    font_medium = pygame.font.Font(None, 32)
-    font_small = pygame.font.Font(None, 26)
-    font_tiny = pygame.font.Font(None, 22)
-    
-    # Title with outline
-    title_text = "🏁 ROAD RUSH"
-    for offset in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
-        title = font_title.render(title_text, True, BLACK)
-        screen.blit(title, (SCREEN_WIDTH // 2 - 130 + offset[0], 15 + offset[1]))
-    title = font_title.render(title_text, True, ORANGE)
-    screen.blit(title, (SCREEN_WIDTH // 2 - 130, 15))
+    # Top bar with gradient (pre-rendered, see get_hud_top_bar)
+    screen.blit(get_hud_top_bar(), (0, 0))
+    
+    # Fonts for the live (per-frame changing) readouts
+    font_medium = get_font(32)
+    font_small = get_font(26)
+    
+    # Title with outline (pre-composed, see get_hud_title)
+    screen.blit(get_hud_title(), (SCREEN_WIDTH // 2 - 132, 13))
     
     # Subtitle
-    subtitle = font_small.render("🤖 AI vs AI Mode", True, YELLOW)
+    subtitle = get_text(26, "🤖 AI vs AI Mode", YELLOW)
     screen.blit(subtitle, (SCREEN_WIDTH // 2 - 75, 58))
     
     # ========== THIEF SPEED METER (LEFT SIDE) ==========
@@ -4779,17 +5313,16 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
     thief_y = 85
     
     # Thief label with icon
-    thief_label = font_small.render("🏃 THIEF", True, RED)
+    thief_label = get_text(26, "🏃 THIEF", RED)
     screen.blit(thief_label, (thief_x, thief_y))
     
     # Thief speed value
     thief_speed_value = player.get_speed_kmh()
-    thief_speed_text = font_medium.render(f"{thief_speed_value} km/h", True, RED)
+    thief_speed_text = get_text(32, f"{thief_speed_value} km/h", RED)
     screen.blit(thief_speed_text, (thief_x + 85, thief_y - 3))
     
     # Thief speed bar (horizontal)
-    bar_width = 200
-    bar_height = 24
+    bar_width, bar_height = SPEED_BAR_SIZE
     bar_y = thief_y + 30
     
     # Background bar
@@ -4809,18 +5342,15 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
         thief_bar_color = (100, 255, 100)  # Green
     
     if thief_filled > 0:
-        # Gradient effect
-        for i in range(thief_filled):
-            fade = 0.7 + (i / bar_width) * 0.3
-            color = tuple(int(c * fade) for c in thief_bar_color)
-            pygame.draw.rect(screen, color, (thief_x + i, bar_y, 1, bar_height))
+        # Gradient effect (cached strip cropped to the filled width)
+        screen.blit(get_speed_bar_strip(thief_bar_color), (thief_x, bar_y), (0, 0, thief_filled, bar_height))
         
         # Border around filled portion
         pygame.draw.rect(screen, thief_bar_color, (thief_x, bar_y, thief_filled, bar_height), 2, border_radius=12)
     
-    # Speed limit marker at 200 km/h
-    pygame.draw.line(screen, WHITE, (thief_x + bar_width, bar_y), (thief_x + bar_width, bar_y + bar_height), 3)
-    limit_text = font_tiny.render("200", True, WHITE)
+    # Speed limit marker at 200 km/h (3px vertical bar: plain fill, same pixels as a width-3 line)
+    screen.fill(WHITE, (thief_x + bar_width - 1, bar_y, 3, bar_height + 1))
+    limit_text = get_text(22, "200", WHITE)
     screen.blit(limit_text, (thief_x + bar_width - 15, bar_y + bar_height + 2))
     
     # ========== POLICE SPEED METER (LEFT SIDE, BELOW THIEF) ==========
@@ -4828,12 +5358,12 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
     police_y = thief_y + 80  # Below thief speed meter
     
     # Police label with icon
-    police_label = font_small.render("🚓 POLICE", True, BLUE)
+    police_label = get_text(26, "🚓 POLICE", BLUE)
     screen.blit(police_label, (police_x, police_y))
     
     # Police speed value
     police_speed_value = police.get_speed_kmh()
-    police_speed_text = font_medium.render(f"{police_speed_value} km/h", True, BLUE)
+    police_speed_text = get_text(32, f"{police_speed_value} km/h", BLUE)
     screen.blit(police_speed_text, (police_x + 100, police_y - 3))
     
     # Police speed bar (horizontal)
@@ -4856,18 +5386,15 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
         police_bar_color = (150, 200, 255)  # Very pale blue
     
     if police_filled > 0:
-        # Gradient effect
-        for i in range(police_filled):
-            fade = 0.7 + (i / bar_width) * 0.3
-            color = tuple(int(c * fade) for c in police_bar_color)
-            pygame.draw.rect(screen, color, (police_x + i, bar_y_police, 1, bar_height))
+        # Gradient effect (cached strip cropped to the filled width)
+        screen.blit(get_speed_bar_strip(police_bar_color), (police_x, bar_y_police), (0, 0, police_filled, bar_height))
         
         # Border around filled portion
         pygame.draw.rect(screen, police_bar_color, (police_x, bar_y_police, police_filled, bar_height), 2, border_radius=12)
     
     # Speed limit marker at 200 km/h
-    pygame.draw.line(screen, WHITE, (police_x + bar_width, bar_y_police), (police_x + bar_width, bar_y_police + bar_height), 3)
-    limit_text = font_tiny.render("200", True, WHITE)
+    screen.fill(WHITE, (police_x + bar_width - 1, bar_y_police, 3, bar_height + 1))
+    limit_text = get_text(22, "200", WHITE)
     screen.blit(limit_text, (police_x + bar_width - 15, bar_y_police + bar_height + 2))
     
     # ========== DISTANCE TO FINISH (TOP RIGHT) ==========
@@ -4884,9 +5411,7 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
     # Mark the 1000m preparation zone on progress bar
     prep_zone_marker = int((1000 / FINISH_LINE_DISTANCE) * progress_width)
     if prep_zone_marker < progress_width:
-        pygame.draw.line(screen, YELLOW, 
-                        (SCREEN_WIDTH - 220 + prep_zone_marker, 110), 
-                        (SCREEN_WIDTH - 220 + prep_zone_marker, 110 + progress_height), 3)
+        screen.fill(YELLOW, (SCREEN_WIDTH - 220 + prep_zone_marker - 1, 110, 3, progress_height + 1))
     
     filled_progress = int(progress * progress_width)
     if filled_progress > 0:
@@ -4902,12 +5427,9 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
     
     if freeze_timer > 0:
         # Stagger Slow power-up indicator
-        powerup_bg = pygame.Surface((70, 70), pygame.SRCALPHA)
-        pygame.draw.rect(powerup_bg, (100, 200, 255, 200), powerup_bg.get_rect(), border_radius=10)
-        screen.blit(powerup_bg, (powerup_x - 10, active_powerup_y - 10))
+        screen.blit(get_rounded_panel(70, 70, (100, 200, 255, 200), 10), (powerup_x - 10, active_powerup_y - 10))
         
-        freeze_font = pygame.font.Font(None, 48)
-        freeze_icon = freeze_font.render("🌀", True, WHITE)
+        freeze_icon = get_text(48, "🌀", WHITE)
         screen.blit(freeze_icon, (powerup_x, active_powerup_y))
         
         # Timer bar
@@ -4920,12 +5442,9 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
     
     if boost_timer > 0:
         # Boost power-up indicator
-        powerup_bg = pygame.Surface((70, 70), pygame.SRCALPHA)
-        pygame.draw.rect(powerup_bg, (255, 200, 0, 200), powerup_bg.get_rect(), border_radius=10)
-        screen.blit(powerup_bg, (powerup_x - 10, active_powerup_y - 10))
+        screen.blit(get_rounded_panel(70, 70, (255, 200, 0, 200), 10), (powerup_x - 10, active_powerup_y - 10))
         
-        boost_font = pygame.font.Font(None, 48)
-        boost_icon = boost_font.render("⚡", True, WHITE)
+        boost_icon = get_text(48, "⚡", WHITE)
         screen.blit(boost_icon, (powerup_x, active_powerup_y))
         
         # Timer bar
@@ -4938,12 +5457,9 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
     
     if shield_timer > 0:
         # Shield power-up indicator
-        powerup_bg = pygame.Surface((70, 70), pygame.SRCALPHA)
-        pygame.draw.rect(powerup_bg, (150, 255, 150, 200), powerup_bg.get_rect(), border_radius=10)
-        screen.blit(powerup_bg, (powerup_x - 10, active_powerup_y - 10))
+        screen.blit(get_rounded_panel(70, 70, (150, 255, 150, 200), 10), (powerup_x - 10, active_powerup_y - 10))
         
-        shield_font = pygame.font.Font(None, 48)
-        shield_icon = shield_font.render("🛡️", True, WHITE)
+        shield_icon = get_text(48, "🛡️", WHITE)
         screen.blit(shield_icon, (powerup_x, active_powerup_y))
         
         # Timer bar
@@ -4956,17 +5472,13 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
     
     if ghost_timer > 0:
         # Ghost power-up indicator (now a counter, not a timer)
-        powerup_bg = pygame.Surface((70, 70), pygame.SRCALPHA)
-        pygame.draw.rect(powerup_bg, (200, 150, 255, 200), powerup_bg.get_rect(), border_radius=10)
-        screen.blit(powerup_bg, (powerup_x - 10, active_powerup_y - 10))
+        screen.blit(get_rounded_panel(70, 70, (200, 150, 255, 200), 10), (powerup_x - 10, active_powerup_y - 10))
         
-        ghost_font = pygame.font.Font(None, 48)
-        ghost_icon = ghost_font.render("👻", True, WHITE)
+        ghost_icon = get_text(48, "👻", WHITE)
         screen.blit(ghost_icon, (powerup_x, active_powerup_y))
         
         # Show "1 USE" text instead of timer bar
-        use_font = pygame.font.Font(None, 20)
-        use_text = use_font.render("1 USE", True, WHITE)
+        use_text = get_text(20, "1 USE", WHITE)
         screen.blit(use_text, (powerup_x - 5, active_powerup_y + 55))
         
         active_powerup_y += 80
@@ -4980,9 +5492,7 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
     panel_x = (SCREEN_WIDTH - panel_width) // 2
     panel_y = SCREEN_HEIGHT - panel_height - 20
     
-    panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-    pygame.draw.rect(panel_surface, (0, 0, 0, 160), panel_surface.get_rect(), border_radius=15)
-    screen.blit(panel_surface, (panel_x, panel_y))
+    screen.blit(get_rounded_panel(panel_width, panel_height, (0, 0, 0, 160), 15), (panel_x, panel_y))
     
     # Police status with icon
     if player.distance > police.distance:
@@ -4999,114 +5509,347 @@ def draw_hud(screen, player, police, traffic_cars, freeze_timer=0, boost_timer=0
     
     # Mini-map or warning
     if distance_diff < 200:
-        warning_font = pygame.font.Font(None, 28)
-        warning = warning_font.render("⚠ POLICE NEARBY!", True, RED)
+        warning = get_text(28, "⚠ POLICE NEARBY!", RED)
         flash = (pygame.time.get_ticks() // 300) % 2
         if flash:
             screen.blit(warning, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 120))
     
     # Crash status indicator
     if player.crashed:
-        crash_font = pygame.font.Font(None, 36)
-        crash_text = crash_font.render("💥 CRASHED! RECOVERING...", True, RED)
-        crash_bg = pygame.Surface((crash_text.get_width() + 20, crash_text.get_height() + 10), pygame.SRCALPHA)
-        pygame.draw.rect(crash_bg, (0, 0, 0, 180), crash_bg.get_rect(), border_radius=10)
+        crash_text = get_text(36, "💥 CRASHED! RECOVERING...", RED)
+        crash_bg = get_rounded_panel(crash_text.get_width() + 20, crash_text.get_height() + 10, (0, 0, 0, 180), 10)
         screen.blit(crash_bg, (SCREEN_WIDTH // 2 - crash_text.get_width() // 2 - 10, 150))
         screen.blit(crash_text, (SCREEN_WIDTH // 2 - crash_text.get_width() // 2, 155))
     
     if police.crashed:
-        police_crash_font = pygame.font.Font(None, 28)
-        police_crash = police_crash_font.render("✓ Police Crashed!", True, GREEN)
+        police_crash = get_text(28, "✓ Police Crashed!", GREEN)
         screen.blit(police_crash, (SCREEN_WIDTH // 2 - 80, 190))
     
     # Stagger Slow effect notification
     if freeze_timer > 0:
-        freeze_notif_font = pygame.font.Font(None, 32)
-        freeze_notif = freeze_notif_font.render("🌀 POLICE STAGGERED!", True, (100, 200, 255))
+        freeze_notif = get_text(32, "🌀 POLICE STAGGERED!", (100, 200, 255))
         screen.blit(freeze_notif, (SCREEN_WIDTH // 2 - 120, 220))
     
     # EMP Stagger Slow effect notification
     if emp_timer > 0:
-        emp_notif_font = pygame.font.Font(None, 32)
-        emp_notif = emp_notif_font.render("💫 THIEF STAGGERED!", True, (255, 100, 255))
+        emp_notif = get_text(32, "💫 THIEF STAGGERED!", (255, 100, 255))
         screen.blit(emp_notif, (SCREEN_WIDTH // 2 - 120, 250))
 
+# Finish line checker block, banner gradient and flash overlay, rendered once
+FINISH_SQUARE_SIZE = 35
+finish_line_surfaces = None
+
+def get_finish_line_surfaces():
+    """(checker block, banner, flash glow) Surfaces for draw_finish_line (built on first use)"""
+    global finish_line_surfaces
+    if finish_line_surfaces is None:
+        # Checkered pattern with 3D effect (4 rows, one square past the road edge)
+        square_size = FINISH_SQUARE_SIZE
+        columns = ROAD_WIDTH // square_size + 1
+        checker = pygame.Surface((columns * square_size, 4 * square_size))
+        for i in range(columns):
+            for j in range(4):
+                color = WHITE if (i + j) % 2 == 0 else BLACK
+                pygame.draw.rect(checker, color, (i * square_size, j * square_size, square_size, square_size))
+        
+        # Finish banner gradient (one-pixel-tall fills - a plain store, no line rasterizing)
+        banner_height = 80
+        banner = pygame.Surface((ROAD_WIDTH, banner_height), pygame.SRCALPHA)
+        for i in range(banner_height):
+            alpha = int(180 - (abs(i - banner_height//2) * 2))
+            banner.fill((255, 215, 0, alpha), (0, i, ROAD_WIDTH, 1))
+        
+        # Flash overlay
+        glow = pygame.Surface((ROAD_WIDTH + 100, 200), pygame.SRCALPHA)
+        glow.fill((255, 255, 0, 30))
+        
+        finish_line_surfaces = (checker.convert(), banner.convert_alpha(), glow.convert_alpha())
+    return finish_line_surfaces
+
 def draw_finish_line(screen, camera_offset, finish_distance):
     """Enhanced finish line with celebration effect"""
     y_pos = finish_distance - camera_offset + SCREEN_HEIGHT // 2
     
     if -300 < y_pos < SCREEN_HEIGHT + 300:
+        checker, banner, glow = get_finish_line_surfaces()
+        
         # Checkered pattern with 3D effect
-        square_size = 35
-        for i in range(ROAD_WIDTH // square_size + 1):
-            for j in range(4):
-                color = WHITE if (i + j) % 2 == 0 else BLACK
-                pygame.draw.rect(screen, color, 
-                               (ROAD_X + i * square_size, y_pos - 60 + j * square_size, 
-                                square_size, square_size))
+        screen.blit(checker, (ROAD_X, y_pos - 60))
         
         # Finish banner
-        banner_height = 80
-        banner_surface = pygame.Surface((ROAD_WIDTH, banner_height), pygame.SRCALPHA)
-        
-        # Banner gradient
-        for i in range(banner_height):
-            alpha = int(180 - (abs(i - banner_height//2) * 2))
-            pygame.draw.line(banner_surface, (255, 215, 0, alpha), 
-                           (0, i), (ROAD_WIDTH, i))
-        
-        screen.blit(banner_surface, (ROAD_X, y_pos - 120))
+        screen.blit(banner, (ROAD_X, y_pos - 120))
         
         # Finish text with multiple styles
-        font_huge = pygame.font.Font(None, 64)
-        font_medium = pygame.font.Font(None, 36)
-        
         # Shadow
-        finish_shadow = font_huge.render("★ FINISH LINE ★", True, BLACK)
+        finish_shadow = get_text(64, "★ FINISH LINE ★", BLACK)
         screen.blit(finish_shadow, (SCREEN_WIDTH // 2 - 195, y_pos - 95))
         
         # Main text
-        finish_text = font_huge.render("★ FINISH LINE ★", True, YELLOW)
+        finish_text = get_text(64, "★ FINISH LINE ★", YELLOW)
         screen.blit(finish_text, (SCREEN_WIDTH // 2 - 197, y_pos - 97))
         
         # Flashing effect
         if (pygame.time.get_ticks() // 200) % 2:
-            glow_surface = pygame.Surface((ROAD_WIDTH + 100, 200), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (255, 255, 0, 30), glow_surface.get_rect())
-            screen.blit(glow_surface, (ROAD_X - 50, y_pos - 150))
+            screen.blit(glow, (ROAD_X - 50, y_pos - 150))
+
+# Roadblock warning sign: yellow triangle, orange outline and a black "!", rendered once.
+# The 3px outline spills 1px past the triangle, so the sprite has a 1px margin all round
+WARNING_SIGN_SIZE = 40
+warning_sign = None
+
+def get_warning_sign():
+    """Transparent warning sign Surface; blit at (x - WARNING_SIGN_SIZE // 2 - 1, y - WARNING_SIGN_SIZE // 2 - 1)
+    to centre it on (x, y) (built on first use)"""
+    global warning_sign
+    if warning_sign is None:
+        centre = WARNING_SIGN_SIZE // 2 + 1
+        sprite = pygame.Surface((WARNING_SIGN_SIZE + 3, WARNING_SIGN_SIZE + 3), pygame.SRCALPHA)
+        triangle = ((centre, 1), (1, WARNING_SIGN_SIZE + 1), (WARNING_SIGN_SIZE + 1, WARNING_SIGN_SIZE + 1))
+        pygame.draw.polygon(sprite, YELLOW, triangle)
+        pygame.draw.polygon(sprite, ORANGE, triangle, 3)
+        sprite.blit(get_text(32, "!", BLACK), (centre - 6, centre - 10))
+        warning_sign = sprite.convert_alpha()
+    return warning_sign
+
+# Speed line sprites keyed by (length, alpha), built on first use
+speed_line_sprites = {}
+
+def get_speed_line_sprite(length, alpha):
+    """3px wide transparent Surface with one white motion line of the given length (cached)"""
+    key = (length, alpha)
+    sprite = speed_line_sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((3, length), pygame.SRCALPHA)
+        pygame.draw.line(sprite, (255, 255, 255, alpha), (1, 0), (1, length), 2)
+        sprite = sprite.convert_alpha()
+        speed_line_sprites[key] = sprite
+    return sprite
 
 def draw_speed_lines(screen, player_speed):
     """Draw motion blur effect based on speed"""
     if player_speed > 3:
         line_count = int(player_speed * 3)
+        alpha = int((player_speed / 8) * 100)
+        lines = []
         for _ in range(line_count):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            length = random.randint(10, 30)
-            alpha = int((player_speed / 8) * 100)
-            
-            line_surface = pygame.Surface((3, length), pygame.SRCALPHA)
-            pygame.draw.line(line_surface, (255, 255, 255, alpha), (1, 0), (1, length), 2)
-            screen.blit(line_surface, (x, y))
+            x = rand_int(0, SCREEN_WIDTH)
+            y = rand_int(0, SCREEN_HEIGHT)
+            length = rand_int(10, 30)
+            lines.append((get_speed_line_sprite(length, alpha), (x, y)))
+        screen.blits(lines, False)
+
+# Full-screen menu backgrounds: per-row color as a function of ratio = row / SCREEN_HEIGHT
+MENU_BACKGROUND_ROWS = {
+    'start': lambda ratio: (int(20 + ratio * 40), int(20 + math.sin(ratio * math.pi) * 30), int(40 + ratio * 60)),
+    'victory': lambda ratio: (int(25 + ratio * 50), int(50 + ratio * 80), int(35 + ratio * 80)),
+    'busted': lambda ratio: (int(30 + ratio * 40), int(15 + ratio * 30), int(40 + ratio * 50))
+}
+menu_backgrounds = {}
+
+def get_menu_background(kind):
+    """Vertical gradient Surface for the start ('start') or end ('victory' / 'busted') screen (cached)"""
+    background = menu_backgrounds.get(kind)
+    if background is None:
+        row_color = MENU_BACKGROUND_ROWS[kind]
+        rows = np.array([row_color(i / SCREEN_HEIGHT) for i in range(SCREEN_HEIGHT)], dtype=np.uint8)
+        pixels = np.empty((SCREEN_WIDTH, SCREEN_HEIGHT, 3), dtype=np.uint8)
+        pixels[:] = rows[None, :, :]
+        background = pygame.surfarray.make_surface(pixels).convert()
+        menu_backgrounds[kind] = background
+    return background
+
+# Start screen divider under the subtitle: orange -> purple across 650px, 5 rows tall
+start_divider = None
+
+def get_start_divider():
+    """Horizontal gradient bar Surface for the start screen (built on first use)"""
+    global start_divider
+    if start_divider is None:
+        line_width = 650
+        columns = []
+        for i in range(line_width):
+            ratio = i / line_width
+            columns.append((int(255 * (1 - ratio) + 100 * ratio),
+                            int(150 * (1 - ratio) + 50 * ratio),
+                            int(0 * (1 - ratio) + 100 * ratio)))
+        pixels = np.empty((line_width, 5, 3), dtype=np.uint8)
+        pixels[:] = np.array(columns, dtype=np.uint8)[:, None, :]
+        start_divider = pygame.surfarray.make_surface(pixels).convert()
+    return start_divider
+
+# White highlight bands swept across titles: alpha peaks in the middle column, keyed by (width, height, peak alpha)
+shine_bands = {}
+
+def get_shine_band(width, height, peak_alpha):
+    """Transparent Surface with a soft vertical white band (cached)"""
+    key = (width, height, peak_alpha)
+    band = shine_bands.get(key)
+    if band is None:
+        band = pygame.Surface((width, height), pygame.SRCALPHA)
+        band.fill((255, 255, 255, 0))
+        half = width // 2
+        alpha = pygame.surfarray.pixels_alpha(band)
+        alpha[:] = (peak_alpha * (1 - np.abs(np.arange(width) - half) / half)).astype(np.uint8)[:, None]
+        del alpha  # Unlock the surface before converting
+        band = band.convert_alpha()
+        shine_bands[key] = band
+    return band
+
+# Small menu sprites (particle dots, side road lines, icon boxes and badges) keyed by kind + geometry + colors
+menu_sprites = {}
+
+def get_dot_sprite(radius, color):
+    """Filled circle on a black colorkey; blit at (x - radius - 1, y - radius - 1)"""
+    key = ('dot', radius, color)
+    sprite = menu_sprites.get(key)
+    if sprite is None:
+        size = radius * 2 + 2
+        sprite = pygame.Surface((size, size)).convert()
+        sprite.set_colorkey(BLACK)
+        pygame.draw.circle(sprite, color, (radius + 1, radius + 1), radius)
+        menu_sprites[key] = sprite
+    return sprite
+
+def get_side_line_strip(width, height, color):
+    """Column of dashes every 60px for the scrolling road lines at the menu screen edges
+    
+    Covers y = -60 .. SCREEN_HEIGHT + 60; blit at (x, line_offset - 60).
+    """
+    key = ('line', width, height, color)
+    strip = menu_sprites.get(key)
+    if strip is None:
+        strip = pygame.Surface((width, SCREEN_HEIGHT + 120)).convert()
+        strip.set_colorkey(BLACK)
+        for y in range(0, SCREEN_HEIGHT + 120, 60):
+            strip.fill(color, (0, y, width, height))
+        menu_sprites[key] = strip
+    return strip
+
+def get_icon_box(color):
+    """70x45 rounded box behind a start screen info icon"""
+    key = ('box', color)
+    box = menu_sprites.get(key)
+    if box is None:
+        box = pygame.Surface((70, 45), pygame.SRCALPHA)
+        pygame.draw.rect(box, (color[0]//3, color[1]//3, color[2]//3, 180), box.get_rect(), border_radius=8)
+        pygame.draw.rect(box, color, box.get_rect(), 2, border_radius=8)
+        box = box.convert_alpha()
+        menu_sprites[key] = box
+    return box
+
+def get_icon_badge(color, fill_alpha, border_color):
+    """45x45 round badge behind an end screen stat icon"""
+    key = ('badge', color, fill_alpha, border_color)
+    badge = menu_sprites.get(key)
+    if badge is None:
+        badge = pygame.Surface((45, 45), pygame.SRCALPHA)
+        pygame.draw.circle(badge, (*color, fill_alpha), (22, 22), 20)
+        pygame.draw.circle(badge, border_color, (22, 22), 20, 2)
+        badge = badge.convert_alpha()
+        menu_sprites[key] = badge
+    return badge
+
+def get_menu_button(width, height, fill_color, border_color, border_width):
+    """Pill-shaped menu button with an outline (cached)"""
+    key = ('button', width, height, fill_color, border_color, border_width)
+    button = menu_sprites.get(key)
+    if button is None:
+        button = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(button, fill_color, button.get_rect(), border_radius=height // 2)
+        pygame.draw.rect(button, border_color, button.get_rect(), border_width, border_radius=height // 2)
+        button = button.convert_alpha()
+        menu_sprites[key] = button
+    return button
+
+def get_scaled_button(button, size):
+    """button resampled to size, cached per (button, size) - pulsing buttons only hit ~30 distinct sizes"""
+    key = ('scaled', button, size)
+    scaled = menu_sprites.get(key)
+    if scaled is None:
+        scaled = pygame.transform.scale(button, size)
+        menu_sprites[key] = scaled
+    return scaled
+
+def get_result_panel(fill_color, glow_rgb, border_layers):
+    """800x480 end screen panel with border_layers nested glow outlines (cached per layer count)"""
+    key = ('result', fill_color, glow_rgb, border_layers)
+    panel = menu_sprites.get(key)
+    if panel is None:
+        panel_width, panel_height = 800, 480
+        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        pygame.draw.rect(panel, fill_color, panel.get_rect(), border_radius=35)
+        for i in range(border_layers):
+            alpha = int(150 - i * 30)
+            pygame.draw.rect(panel, (*glow_rgb, alpha),
+                             (i, i, panel_width - i*2, panel_height - i*2), 5 - i, border_radius=35)
+        
+        # Inner highlight
+        pygame.draw.rect(panel, (255, 255, 255, 40),
+                         (8, 8, panel_width - 16, panel_height - 16), 2, border_radius=30)
+        panel = panel.convert_alpha()
+        menu_sprites[key] = panel
+    return panel
+
+# Menu title layers: the 3D shadow stack flattened to one Surface, and the glow outline flattened
+# to one white ring that gets tinted with the pulsing glow color each frame
+title_layers = {}
+TITLE_GLOW_MARGIN = 6
+
+def get_title_layers(size, text, shadow_depths, glow_offsets):
+    """(shadow stack, white glow ring) for a menu title, both positioned from the text rect's topleft
+    
+    shadow_depths: ((depth, color), ...) in draw order - each layer is offset (+depth, +depth)
+    glow_offsets: ((dx, dy), ...) - the ring Surface is blit TITLE_GLOW_MARGIN px up-left of the text rect
+    """
+    key = (size, text, shadow_depths, glow_offsets)
+    layers = title_layers.get(key)
+    if layers is None:
+        width, height = get_text(size, text, WHITE).get_size()
+        max_depth = max(depth for depth, _ in shadow_depths)
+        shadows = pygame.Surface((width + max_depth, height + max_depth), pygame.SRCALPHA)
+        shadows.blits([(get_text(size, text, color), (depth, depth)) for depth, color in shadow_depths], False)
+        
+        margin = TITLE_GLOW_MARGIN
+        ring = pygame.Surface((width + margin * 2, height + margin * 2), pygame.SRCALPHA)
+        white_text = get_text(size, text, WHITE)
+        ring.blits([(white_text, (margin + dx, margin + dy)) for dx, dy in glow_offsets], False)
+        
+        layers = (shadows.convert_alpha(), ring.convert_alpha())
+        title_layers[key] = layers
+    return layers
+
+def blit_title_layers(screen, layers, text_rect, glow_color):
+    """Draw the shadow stack, then the glow ring tinted to glow_color"""
+    shadows, ring = layers
+    glow = ring.copy()
+    glow.fill((*glow_color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+    screen.blits(((shadows, text_rect.topleft),
+                  (glow, (text_rect.x - TITLE_GLOW_MARGIN, text_rect.y - TITLE_GLOW_MARGIN))), False)
 
 def show_start_screen(screen):
     """Ultra-attractive start screen with smooth animations"""
     clock = pygame.time.Clock()
     waiting = True
     start_time = pygame.time.get_ticks()
-    particles_bg = []
     
     # Start menu music
     audio_manager.play_menu_music()
     
     # Create background particles for animation
-    for _ in range(50):
-        particles_bg.append({
-            'x': random.randint(0, SCREEN_WIDTH),
-            'y': random.randint(0, SCREEN_HEIGHT),
-            'speed': random.uniform(0.5, 2),
-            'size': random.randint(1, 3)
-        })
+    # One numpy column per field (x, y, speed, size) - moved and faded with array ops each frame
+    particle_count = 50
+    particle_xs = np.random.randint(0, SCREEN_WIDTH + 1, particle_count)
+    particle_ys = np.random.randint(0, SCREEN_HEIGHT + 1, particle_count).astype(float)
+    particle_speeds = np.random.uniform(0.5, 2, particle_count)
+    particle_sizes = np.random.randint(1, 4, particle_count).tolist()
+    
+    panel_surface = None
+    panel_border_red = None  # Border red channel currently drawn on panel_surface
+    
+    title_layers_road_rush = get_title_layers(
+        120, "ROAD RUSH",
+        tuple((depth, (20 + depth * 5, 10 + depth * 3, 0)) for depth in range(8, 0, -1)),
+        ((-2, -2), (2, -2), (-2, 2), (2, 2), (-3, 0), (3, 0), (0, -3), (0, 3)))
     
     while waiting:
         elapsed = pygame.time.get_ticks() - start_time
@@ -5120,83 +5863,56 @@ def show_start_screen(screen):
                     return True
         
         # Smooth gradient background (dark blue to purple)
-        for i in range(SCREEN_HEIGHT):
-            ratio = i / SCREEN_HEIGHT
-            r = int(20 + ratio * 40)
-            g = int(20 + math.sin(ratio * math.pi) * 30)
-            b = int(40 + ratio * 60)
-            pygame.draw.line(screen, (r, g, b), (0, i), (SCREEN_WIDTH, i))
-        
-        # Animated particles
-        for particle in particles_bg:
-            particle['y'] += particle['speed']
-            if particle['y'] > SCREEN_HEIGHT:
-                particle['y'] = 0
-                particle['x'] = random.randint(0, SCREEN_WIDTH)
-            
-            alpha = int(150 + math.sin(elapsed / 500 + particle['x']) * 50)
-            color = (alpha, alpha, 255)
-            pygame.draw.circle(screen, color, (int(particle['x']), int(particle['y'])), particle['size'])
+        screen.blit(get_menu_background('start'), (0, 0))
+        
+        # Animated particles (fall, wrap to the top at a new x, shimmer)
+        particle_ys += particle_speeds
+        wrapped = particle_ys > SCREEN_HEIGHT
+        wrap_count = int(wrapped.sum())
+        if wrap_count:
+            particle_ys[wrapped] = 0
+            particle_xs[wrapped] = np.random.randint(0, SCREEN_WIDTH + 1, wrap_count)
+        alphas = (150 + np.sin(elapsed / 500 + particle_xs) * 50).astype(int)
+        
+        screen.blits([(get_dot_sprite(size, (alpha, alpha, 255)), (x - size - 1, y - size - 1))
+                      for x, y, size, alpha in zip(particle_xs.tolist(), particle_ys.astype(int).tolist(),
+                                                   particle_sizes, alphas.tolist())], False)
         
         # Animated road lines on sides
         line_offset = (elapsed // 20) % 60
-        for y in range(-60, SCREEN_HEIGHT + 60, 60):
-            y_pos = y + line_offset
-            # Left side
-            pygame.draw.rect(screen, (100, 100, 120), (50, y_pos, 15, 40))
-            # Right side  
-            pygame.draw.rect(screen, (100, 100, 120), (SCREEN_WIDTH - 65, y_pos, 15, 40))
-        
-        font_huge = pygame.font.Font(None, 120)
-        font_title = pygame.font.Font(None, 96)
-        font_subtitle = pygame.font.Font(None, 52)
-        font_text = pygame.font.Font(None, 36)
-        font_small = pygame.font.Font(None, 30)
+        road_strip = get_side_line_strip(15, 40, (100, 100, 120))
+        screen.blits(((road_strip, (50, line_offset - 60)),
+                      (road_strip, (SCREEN_WIDTH - 65, line_offset - 60))), False)
         
         # Main title with 3D effect and pulse
         pulse = math.sin(elapsed / 300) * 8
         title_y = 120 + pulse
         
-        # Shadow layers for 3D depth
-        for depth in range(8, 0, -1):
-            shadow_color = (20 + depth * 5, 10 + depth * 3, 0)
-            shadow_title = font_huge.render("ROAD RUSH", True, shadow_color)
-            shadow_rect = shadow_title.get_rect(center=(SCREEN_WIDTH // 2 + depth, title_y + depth))
-            screen.blit(shadow_title, shadow_rect)
-        
-        # Glowing outline
+        # Shadow layers for 3D depth, then the glowing outline
+        title_text = get_text(120, "ROAD RUSH", (255, 200, 0))
         glow_intensity = abs(math.sin(elapsed / 400)) * 100 + 100
-        for offset_x, offset_y in [(-2, -2), (2, -2), (-2, 2), (2, 2), (-3, 0), (3, 0), (0, -3), (0, 3)]:
-            glow_color = (255, int(glow_intensity), 0)
-            glow_title = font_huge.render("ROAD RUSH", True, glow_color)
-            glow_rect = glow_title.get_rect(center=(SCREEN_WIDTH // 2 + offset_x, title_y + offset_y))
-            screen.blit(glow_title, glow_rect)
+        blit_title_layers(screen, title_layers_road_rush, title_text.get_rect(center=(SCREEN_WIDTH // 2, title_y)),
+                          (255, int(glow_intensity), 0))
         
         # Main title
         gradient_y = int(title_y)
-        title_text = font_huge.render("ROAD RUSH", True, (255, 200, 0))
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, gradient_y))
         screen.blit(title_text, title_rect)
         
         # Shiny overlay effect
         shine_pos = (elapsed // 10) % (title_text.get_width() + 200) - 100
-        shine_surf = pygame.Surface((50, title_text.get_height()), pygame.SRCALPHA)
-        for i in range(50):
-            alpha = int(100 * (1 - abs(i - 25) / 25))
-            pygame.draw.line(shine_surf, (255, 255, 255, alpha), (i, 0), (i, title_text.get_height()))
+        shine_surf = get_shine_band(50, title_text.get_height(), 100)
         screen.blit(shine_surf, (title_rect.x + shine_pos, title_rect.y))
         
         # Subtitle with wave effect
         wave_offset = math.sin(elapsed / 800) * 6
-        subtitle = font_subtitle.render("🚔 Police Chase Edition 🚗", True, (255, 255, 100))
+        subtitle = get_text(52, "🚔 Police Chase Edition 🚗", (255, 255, 100))
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 220 + wave_offset))
         
         # Subtitle glow
-        for r in [8, 6, 4]:
-            s_glow = pygame.Surface((subtitle.get_width() + r*2, subtitle.get_height() + r*2), pygame.SRCALPHA)
-            alpha = 40 - r * 3
-            pygame.draw.rect(s_glow, (255, 215, 0, alpha), s_glow.get_rect(), border_radius=15)
-            screen.blit(s_glow, (subtitle_rect.x - r, subtitle_rect.y - r))
+        screen.blits([(get_rounded_panel(subtitle.get_width() + r*2, subtitle.get_height() + r*2,
+                                         (255, 215, 0, 40 - r * 3), 15),
+                       (subtitle_rect.x - r, subtitle_rect.y - r)) for r in (8, 6, 4)], False)
         
         screen.blit(subtitle, subtitle_rect)
         
@@ -5204,13 +5920,7 @@ def show_start_screen(screen):
         line_width = 650
         line_x = SCREEN_WIDTH // 2 - line_width // 2
         line_y = 285
-        
-        for i in range(line_width):
-            ratio = i / line_width
-            r = int(255 * (1 - ratio) + 100 * ratio)
-            g = int(150 * (1 - ratio) + 50 * ratio)
-            b = int(0 * (1 - ratio) + 100 * ratio)
-            pygame.draw.line(screen, (r, g, b), (line_x + i, line_y), (line_x + i, line_y + 4))
+        screen.blit(get_start_divider(), (line_x, line_y))
         
         # Modern glass-morphism panel for controls
         panel_y = 310
@@ -5219,15 +5929,20 @@ def show_start_screen(screen):
         panel_x = SCREEN_WIDTH // 2 - panel_width // 2
         
         # Panel with blur effect (simulated with semi-transparent layers)
-        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        pygame.draw.rect(panel_surface, (40, 40, 70, 160), panel_surface.get_rect(), border_radius=25)
+        # The border and highlight overwrite the same pixels, so the Surface is reused and
+        # only redrawn when the pulsing border color actually changes
+        if panel_surface is None:
+            panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+            pygame.draw.rect(panel_surface, (40, 40, 70, 160), panel_surface.get_rect(), border_radius=25)
         
         # Border with gradient glow
         border_glow = abs(math.sin(elapsed / 600)) * 50 + 150
-        pygame.draw.rect(panel_surface, (int(border_glow), 140, 255, 200), panel_surface.get_rect(), 3, border_radius=25)
-        
-        # Inner highlight
-        pygame.draw.rect(panel_surface, (255, 255, 255, 30), (5, 5, panel_width - 10, panel_height - 10), 2, border_radius=22)
+        if int(border_glow) != panel_border_red:
+            panel_border_red = int(border_glow)
+            pygame.draw.rect(panel_surface, (panel_border_red, 140, 255, 200), panel_surface.get_rect(), 3, border_radius=25)
+            
+            # Inner highlight
+            pygame.draw.rect(panel_surface, (255, 255, 255, 30), (5, 5, panel_width - 10, panel_height - 10), 2, border_radius=22)
         
         screen.blit(panel_surface, (panel_x, panel_y))
         
@@ -5236,7 +5951,7 @@ def show_start_screen(screen):
         
         # Game Mode section
         controls_y = panel_y + 35
-        mode_title = font_subtitle.render("🤖 AI vs AI MODE", True, (100, 255, 255))
+        mode_title = get_text(52, "🤖 AI vs AI MODE", (100, 255, 255))
         mode_rect = mode_title.get_rect(center=(SCREEN_WIDTH // 2, controls_y + icon_bounce))
         screen.blit(mode_title, mode_rect)
         
@@ -5248,25 +5963,22 @@ def show_start_screen(screen):
         ]
         
         info_y = controls_y + 70
+        info_blits = []
         for icon, text, color in info_data:
             # Icon box
             icon_x = SCREEN_WIDTH // 2 - 250
-            icon_surf = pygame.Surface((70, 45), pygame.SRCALPHA)
-            pygame.draw.rect(icon_surf, (color[0]//3, color[1]//3, color[2]//3, 180), icon_surf.get_rect(), border_radius=8)
-            pygame.draw.rect(icon_surf, color, icon_surf.get_rect(), 2, border_radius=8)
-            screen.blit(icon_surf, (icon_x, info_y - 5))
+            info_blits.append((get_icon_box(color), (icon_x, info_y - 5)))
             
             # Icon text
-            icon_text = font_text.render(icon, True, color)
-            icon_rect = icon_text.get_rect(center=(icon_x + 35, info_y + 17))
-            screen.blit(icon_text, icon_rect)
+            icon_text = get_text(36, icon, color)
+            info_blits.append((icon_text, icon_text.get_rect(center=(icon_x + 35, info_y + 17))))
             
             # Description
-            desc_text = font_text.render(text, True, (230, 230, 255))
-            desc_rect = desc_text.get_rect(midleft=(icon_x + 85, info_y + 17))
-            screen.blit(desc_text, desc_rect)
+            desc_text = get_text(36, text, (230, 230, 255))
+            info_blits.append((desc_text, desc_text.get_rect(midleft=(icon_x + 85, info_y + 17))))
             
             info_y += 58
+        screen.blits(info_blits, False)
         
         # Press Space to Start button inside panel
         start_button_y = info_y + 5
@@ -5275,30 +5987,21 @@ def show_start_screen(screen):
         if flash_cycle < 2:
             button_scale = 1 + math.sin(elapsed / 150) * 0.03
             
-            # Button background with glow
-            button_surf = pygame.Surface((520, 50), pygame.SRCALPHA)
-            pygame.draw.rect(button_surf, (0, 255, 100, 200), button_surf.get_rect(), border_radius=25)
-            
-            # Animated border
+            # Button background with animated border
             border_color = (100, 255, 150) if flash_cycle == 0 else (150, 255, 100)
-            pygame.draw.rect(button_surf, border_color, button_surf.get_rect(), 3, border_radius=25)
+            button_surf = get_menu_button(520, 50, (0, 255, 100, 200), border_color, 3)
             
             # Glow layers (smaller)
-            for r in range(12, 0, -3):
-                glow_surf = pygame.Surface((520 + r*2, 50 + r*2), pygame.SRCALPHA)
-                alpha = 12 - r // 2
-                pygame.draw.rect(glow_surf, (100, 255, 150, alpha), glow_surf.get_rect(), border_radius=25 + r)
-                screen.blit(glow_surf, (SCREEN_WIDTH // 2 - 260 - r, start_button_y - r))
+            screen.blits([(get_rounded_panel(520 + r*2, 50 + r*2, (100, 255, 150, 12 - r // 2), 25 + r),
+                           (SCREEN_WIDTH // 2 - 260 - r, start_button_y - r)) for r in range(12, 0, -3)], False)
             
             # Scale button
-            scaled_surf = pygame.transform.scale(button_surf, 
-                                                (int(520 * button_scale), int(50 * button_scale)))
+            scaled_surf = get_scaled_button(button_surf, (int(520 * button_scale), int(50 * button_scale)))
             scaled_rect = scaled_surf.get_rect(center=(SCREEN_WIDTH // 2, start_button_y + 25))
             screen.blit(scaled_surf, scaled_rect)
             
             # Button text (smaller font)
-            font_button = pygame.font.Font(None, 42)
-            start_text = font_button.render("▶  PRESS SPACE TO START  ◀", True, (0, 50, 0))
+            start_text = get_text(42, "▶  PRESS SPACE TO START  ◀", (0, 50, 0))
             start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, start_button_y + 25))
             screen.blit(start_text, start_rect)
         
@@ -5313,26 +6016,27 @@ def show_end_screen(screen, winner):
     waiting = True
     start_time = pygame.time.get_ticks()
     
-    # Create celebration particles
-    celebration_particles = []
+    # Create background particles (numpy columns like the start screen; only 30 are ever drawn)
+    particle_count = 30
+    particle_xs = np.random.randint(0, SCREEN_WIDTH + 1, particle_count)
+    if winner == "thief":
+        # Falling celebration particles
+        particle_ys = np.random.randint(-200, 1, particle_count).astype(float)
+        particle_speeds = np.random.uniform(2, 6, particle_count) * 0.5  # Slower movement
+    else:
+        # Police lights particles (static)
+        particle_ys = np.random.randint(0, SCREEN_HEIGHT + 1, particle_count)
+    
     if winner == "thief":
-        for _ in range(100):
-            celebration_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(-200, 0),
-                'speed': random.uniform(2, 6),
-                'size': random.randint(3, 8),
-                'color': random.choice([(255, 215, 0), (255, 255, 0), (0, 255, 0), (0, 255, 255)])
-            })
+        title_layers_result = get_title_layers(
+            130, "VICTORY!",
+            tuple((depth, (10 + depth * 3, 40 + depth * 5, 10 + depth * 2)) for depth in range(10, 0, -1)),
+            ((-4, -4), (4, -4), (-4, 4), (4, 4), (-5, 0), (5, 0), (0, -5), (0, 5)))
     else:
-        # Police lights particles
-        for _ in range(60):
-            celebration_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'size': random.randint(20, 40),
-                'flash': random.randint(0, 10)
-            })
+        title_layers_result = get_title_layers(
+            130, "BUSTED!",
+            tuple((depth, (60 + depth * 2, 10, 10)) for depth in range(10, 0, -1)),
+            ((-4, -4), (4, -4), (-4, 4), (4, 4), (-6, 0), (6, 0), (0, -6), (0, 6)))
     
     while waiting:
         elapsed = pygame.time.get_ticks() - start_time
@@ -5350,55 +6054,36 @@ def show_end_screen(screen, winner):
         # Professional racing game background - similar to landing page
         if winner == "thief":
             # Victory - Calm professional gradient with subtle animation
-            for i in range(SCREEN_HEIGHT):
-                ratio = i / SCREEN_HEIGHT
-                r = int(25 + ratio * 50)
-                g = int(50 + ratio * 80)
-                b = int(35 + ratio * 80)
-                pygame.draw.line(screen, (r, g, b), (0, i), (SCREEN_WIDTH, i))
+            screen.blit(get_menu_background('victory'), (0, 0))
             
             # Subtle floating particles (less noisy)
-            for particle in celebration_particles[:30]:  # Reduce particle count
-                particle['y'] += particle['speed'] * 0.5  # Slower movement
-                if particle['y'] > SCREEN_HEIGHT:
-                    particle['y'] = random.randint(-50, -10)
-                    particle['x'] = random.randint(0, SCREEN_WIDTH)
-                
-                # Draw subtle particles
-                alpha = int(100 + math.sin(elapsed / 500 + particle['x']) * 50)
-                color = (alpha, alpha, min(255, alpha + 50))
-                pygame.draw.circle(screen, color, (int(particle['x']), int(particle['y'])), 2)
+            particle_ys += particle_speeds
+            wrapped = particle_ys > SCREEN_HEIGHT
+            wrap_count = int(wrapped.sum())
+            if wrap_count:
+                particle_ys[wrapped] = np.random.randint(-50, -9, wrap_count)
+                particle_xs[wrapped] = np.random.randint(0, SCREEN_WIDTH + 1, wrap_count)
+            
+            # Draw subtle particles
+            alphas = (100 + np.sin(elapsed / 500 + particle_xs) * 50).astype(int)
+            screen.blits([(get_dot_sprite(2, (alpha, alpha, min(255, alpha + 50))), (x - 3, y - 3))
+                          for x, y, alpha in zip(particle_xs.tolist(), particle_ys.astype(int).tolist(),
+                                                 alphas.tolist())], False)
         
         else:
             # Game Over - Professional dark gradient
-            for i in range(SCREEN_HEIGHT):
-                ratio = i / SCREEN_HEIGHT
-                r = int(30 + ratio * 40)
-                g = int(15 + ratio * 30)
-                b = int(40 + ratio * 50)
-                pygame.draw.line(screen, (r, g, b), (0, i), (SCREEN_WIDTH, i))
+            screen.blit(get_menu_background('busted'), (0, 0))
             
             # Subtle particles for atmosphere
-            for particle in celebration_particles[:30]:  # Reduce particle count
-                alpha = int(80 + math.sin(elapsed / 400 + particle['x']) * 40)
-                color = (alpha, alpha // 2, alpha)
-                pygame.draw.circle(screen, color, (int(particle['x']), int(particle['y'])), 2)
+            alphas = (80 + np.sin(elapsed / 400 + particle_xs) * 40).astype(int)
+            screen.blits([(get_dot_sprite(2, (alpha, alpha // 2, alpha)), (x - 3, y - 3))
+                          for x, y, alpha in zip(particle_xs.tolist(), particle_ys.tolist(), alphas.tolist())], False)
         
         # Animated road lines on sides (like landing page)
         line_offset = (elapsed // 20) % 60
-        for y in range(-60, SCREEN_HEIGHT + 60, 60):
-            y_pos = y + line_offset
-            # Left side
-            pygame.draw.rect(screen, (80, 80, 100), (50, y_pos, 12, 35))
-            # Right side  
-            pygame.draw.rect(screen, (80, 80, 100), (SCREEN_WIDTH - 62, y_pos, 12, 35))
-        
-        # Fonts
-        font_mega = pygame.font.Font(None, 130)
-        font_title = pygame.font.Font(None, 96)
-        font_subtitle = pygame.font.Font(None, 56)
-        font_text = pygame.font.Font(None, 40)
-        font_small = pygame.font.Font(None, 34)
+        road_strip = get_side_line_strip(12, 35, (80, 80, 100))
+        screen.blits(((road_strip, (50, line_offset - 60)),
+                      (road_strip, (SCREEN_WIDTH - 62, line_offset - 60))), False)
         
         # Main result panel with glassmorphism
         panel_width = 800
@@ -5407,34 +6092,14 @@ def show_end_screen(screen, winner):
         panel_y = SCREEN_HEIGHT // 2 - panel_height // 2 - 20
         
         # Panel layers for depth
-        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        
         if winner == "thief":
-            # Victory panel - green/gold theme
-            pygame.draw.rect(panel_surface, (30, 60, 30, 200), panel_surface.get_rect(), border_radius=35)
-            glow_color = (100, 255, 100, 180)
-            
-            # Animated border
+            # Victory panel - green/gold theme, animated border
             border_pulse = abs(math.sin(elapsed / 400)) * 3 + 2
-            for i in range(int(border_pulse)):
-                alpha = int(150 - i * 30)
-                pygame.draw.rect(panel_surface, (*glow_color[:3], alpha), 
-                               (i, i, panel_width - i*2, panel_height - i*2), 5 - i, border_radius=35)
+            panel_surface = get_result_panel((30, 60, 30, 200), (100, 255, 100), int(border_pulse))
         else:
-            # Game Over panel - red theme
-            pygame.draw.rect(panel_surface, (60, 20, 20, 200), panel_surface.get_rect(), border_radius=35)
-            glow_color = (255, 50, 50, 180)
-            
-            # Flashing border
+            # Game Over panel - red theme, flashing border
             border_flash = abs(math.sin(elapsed / 200)) * 3 + 2
-            for i in range(int(border_flash)):
-                alpha = int(150 - i * 30)
-                pygame.draw.rect(panel_surface, (*glow_color[:3], alpha), 
-                               (i, i, panel_width - i*2, panel_height - i*2), 5 - i, border_radius=35)
-        
-        # Inner highlight
-        pygame.draw.rect(panel_surface, (255, 255, 255, 40), 
-                        (8, 8, panel_width - 16, panel_height - 16), 2, border_radius=30)
+            panel_surface = get_result_panel((60, 20, 20, 200), (255, 50, 50), int(border_flash))
         
         screen.blit(panel_surface, (panel_x, panel_y))
         
@@ -5446,43 +6111,28 @@ def show_end_screen(screen, winner):
             
             title_y = panel_y + 80 + bounce
             
-            # 3D shadow layers
-            for depth in range(10, 0, -1):
-                shadow_color = (10 + depth * 3, 40 + depth * 5, 10 + depth * 2)
-                shadow = font_mega.render("VICTORY!", True, shadow_color)
-                shadow_rect = shadow.get_rect(center=(SCREEN_WIDTH // 2 + depth, title_y + depth))
-                screen.blit(shadow, shadow_rect)
-            
-            # Glowing outline
+            # 3D shadow layers and glowing outline
+            title = get_text(130, "VICTORY!", (255, 255, 100))
+            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, title_y))
             glow_intensity = abs(math.sin(elapsed / 300)) * 100 + 150
-            for offset in [(-4, -4), (4, -4), (-4, 4), (4, 4), (-5, 0), (5, 0), (0, -5), (0, 5)]:
-                glow = font_mega.render("VICTORY!", True, (100, int(glow_intensity), 50))
-                glow_rect = glow.get_rect(center=(SCREEN_WIDTH // 2 + offset[0], title_y + offset[1]))
-                screen.blit(glow, glow_rect)
+            blit_title_layers(screen, title_layers_result, title_rect, (100, int(glow_intensity), 50))
             
             # Main title - gradient effect
-            title = font_mega.render("VICTORY!", True, (255, 255, 100))
-            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, title_y))
             screen.blit(title, title_rect)
             
             # Trophy icons with float
             trophy_bounce = abs(math.sin(elapsed / 200) * 8)
-            trophy_font = pygame.font.Font(None, 90)
-            trophy_left = trophy_font.render("🏆", True, (255, 215, 0))
-            trophy_right = trophy_font.render("🏆", True, (255, 215, 0))
+            trophy_left = trophy_right = get_text(90, "🏆", (255, 215, 0))
             screen.blit(trophy_left, (panel_x + 60, title_y - 20 + trophy_bounce))
             screen.blit(trophy_right, (panel_x + panel_width - 120, title_y - 20 - trophy_bounce))
             
             # Subtitle with shimmer
             subtitle_y = panel_y + 180
-            subtitle = font_subtitle.render("You Escaped the Police!", True, (200, 255, 200))
+            subtitle = get_text(56, "You Escaped the Police!", (200, 255, 200))
             
             # Shimmer effect
             shimmer_pos = (elapsed // 15) % (subtitle.get_width() + 150) - 75
-            shimmer_surf = pygame.Surface((60, subtitle.get_height()), pygame.SRCALPHA)
-            for i in range(60):
-                alpha = int(120 * (1 - abs(i - 30) / 30))
-                pygame.draw.line(shimmer_surf, (255, 255, 255, alpha), (i, 0), (i, subtitle.get_height()))
+            shimmer_surf = get_shine_band(60, subtitle.get_height(), 120)
             
             subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, subtitle_y))
             screen.blit(subtitle, subtitle_rect)
@@ -5496,6 +6146,7 @@ def show_end_screen(screen, winner):
                 ("✓", "Police Outrun Successfully", (100, 255, 255))
             ]
             
+            stat_blits = []
             for idx, (icon, text, color) in enumerate(stats_data):
                 stat_y = stats_y + idx * 50
                 delay = idx * 500
@@ -5507,19 +6158,15 @@ def show_end_screen(screen, winner):
                     
                     # Icon with glow
                     icon_x = panel_x + 120 + slide_x
-                    icon_surf = pygame.Surface((45, 45), pygame.SRCALPHA)
-                    pygame.draw.circle(icon_surf, (*color, 200), (22, 22), 20)
-                    pygame.draw.circle(icon_surf, (255, 255, 255), (22, 22), 20, 2)
-                    screen.blit(icon_surf, (icon_x, stat_y - 5))
+                    stat_blits.append((get_icon_badge(color, 200, (255, 255, 255)), (icon_x, stat_y - 5)))
                     
-                    icon_text = font_text.render(icon, True, (0, 100, 0))
-                    icon_rect = icon_text.get_rect(center=(icon_x + 22, stat_y + 15))
-                    screen.blit(icon_text, icon_rect)
+                    icon_text = get_text(40, icon, (0, 100, 0))
+                    stat_blits.append((icon_text, icon_text.get_rect(center=(icon_x + 22, stat_y + 15))))
                     
                     # Text
-                    stat_text = font_text.render(text, True, color)
-                    stat_rect = stat_text.get_rect(midleft=(icon_x + 55, stat_y + 15))
-                    screen.blit(stat_text, stat_rect)
+                    stat_text = get_text(40, text, color)
+                    stat_blits.append((stat_text, stat_text.get_rect(midleft=(icon_x + 55, stat_y + 15))))
+            screen.blits(stat_blits, False)
         
         else:
             # BUSTED with shake effect
@@ -5528,39 +6175,25 @@ def show_end_screen(screen, winner):
             
             title_y = panel_y + 80
             
-            # 3D shadow layers
-            for depth in range(10, 0, -1):
-                shadow_color = (60 + depth * 2, 10, 10)
-                shadow = font_mega.render("BUSTED!", True, shadow_color)
-                shadow_rect = shadow.get_rect(center=(SCREEN_WIDTH // 2 + depth + shake_x, 
-                                                      title_y + depth + shake_y))
-                screen.blit(shadow, shadow_rect)
-            
-            # Red pulsing glow
+            # 3D shadow layers and red pulsing glow
+            title = get_text(130, "BUSTED!", (255, 80, 80))
+            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2 + shake_x, title_y + shake_y))
             glow_intensity = abs(math.sin(elapsed / 200)) * 100 + 150
-            for offset in [(-4, -4), (4, -4), (-4, 4), (4, 4), (-6, 0), (6, 0), (0, -6), (0, 6)]:
-                glow = font_mega.render("BUSTED!", True, (int(glow_intensity), 50, 50))
-                glow_rect = glow.get_rect(center=(SCREEN_WIDTH // 2 + offset[0] + shake_x, 
-                                                  title_y + offset[1] + shake_y))
-                screen.blit(glow, glow_rect)
+            blit_title_layers(screen, title_layers_result, title_rect, (int(glow_intensity), 50, 50))
             
             # Main title
-            title = font_mega.render("BUSTED!", True, (255, 80, 80))
-            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2 + shake_x, title_y + shake_y))
             screen.blit(title, title_rect)
             
             # Police car icons with flash
             flash = (elapsed // 150) % 2
-            car_font = pygame.font.Font(None, 90)
             car_color = (255, 100, 100) if flash else (100, 150, 255)
-            police_left = car_font.render("🚔", True, car_color)
-            police_right = car_font.render("🚔", True, car_color)
+            police_left = police_right = get_text(90, "🚔", car_color)
             screen.blit(police_left, (panel_x + 60, title_y - 20))
             screen.blit(police_right, (panel_x + panel_width - 120, title_y - 20))
             
             # Subtitle
             subtitle_y = panel_y + 180
-            subtitle = font_subtitle.render("The Police Caught You!", True, (255, 200, 200))
+            subtitle = get_text(56, "The Police Caught You!", (255, 200, 200))
             subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, subtitle_y))
             screen.blit(subtitle, subtitle_rect)
             
@@ -5572,24 +6205,21 @@ def show_end_screen(screen, winner):
                 ("↻", "Try Again!", (255, 200, 100))
             ]
             
+            message_blits = []
             for idx, (icon, text, color) in enumerate(messages_data):
                 msg_y = messages_y + idx * 50
                 
                 # Icon
                 icon_x = panel_x + 150
-                icon_surf = pygame.Surface((45, 45), pygame.SRCALPHA)
-                pygame.draw.circle(icon_surf, (*color, 180), (22, 22), 20)
-                pygame.draw.circle(icon_surf, (200, 100, 100), (22, 22), 20, 2)
-                screen.blit(icon_surf, (icon_x, msg_y - 5))
+                message_blits.append((get_icon_badge(color, 180, (200, 100, 100)), (icon_x, msg_y - 5)))
                 
-                icon_text = font_text.render(icon, True, (100, 0, 0))
-                icon_rect = icon_text.get_rect(center=(icon_x + 22, msg_y + 15))
-                screen.blit(icon_text, icon_rect)
+                icon_text = get_text(40, icon, (100, 0, 0))
+                message_blits.append((icon_text, icon_text.get_rect(center=(icon_x + 22, msg_y + 15))))
                 
                 # Text
-                msg_text = font_text.render(text, True, color)
-                msg_rect = msg_text.get_rect(midleft=(icon_x + 55, msg_y + 15))
-                screen.blit(msg_text, msg_rect)
+                msg_text = get_text(40, text, color)
+                message_blits.append((msg_text, msg_text.get_rect(midleft=(icon_x + 55, msg_y + 15))))
+            screen.blits(message_blits, False)
         
         # Action buttons at bottom
         button_y = panel_y + panel_height + 40
@@ -5600,32 +6230,26 @@ def show_end_screen(screen, winner):
             button_scale = 1 + math.sin(elapsed / 180) * 0.04
             
             # Button surface
-            restart_btn = pygame.Surface((280, 60), pygame.SRCALPHA)
             if winner == "thief":
-                pygame.draw.rect(restart_btn, (100, 255, 100, 220), restart_btn.get_rect(), border_radius=30)
-                pygame.draw.rect(restart_btn, (150, 255, 150), restart_btn.get_rect(), 3, border_radius=30)
+                restart_btn = get_menu_button(280, 60, (100, 255, 100, 220), (150, 255, 150), 3)
             else:
-                pygame.draw.rect(restart_btn, (255, 150, 100, 220), restart_btn.get_rect(), border_radius=30)
-                pygame.draw.rect(restart_btn, (255, 200, 150), restart_btn.get_rect(), 3, border_radius=30)
+                restart_btn = get_menu_button(280, 60, (255, 150, 100, 220), (255, 200, 150), 3)
             
             # Scale and position
-            scaled_btn = pygame.transform.scale(restart_btn, 
-                                               (int(280 * button_scale), int(60 * button_scale)))
+            scaled_btn = get_scaled_button(restart_btn, (int(280 * button_scale), int(60 * button_scale)))
             btn_rect = scaled_btn.get_rect(center=(SCREEN_WIDTH // 2 - 180, button_y))
             screen.blit(scaled_btn, btn_rect)
             
             # Text
-            restart_text = font_text.render("SPACE - Restart", True, (0, 50, 0) if winner == "thief" else (100, 30, 0))
+            restart_text = get_text(40, "SPACE - Restart", (0, 50, 0) if winner == "thief" else (100, 30, 0))
             restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2 - 180, button_y))
             screen.blit(restart_text, restart_rect)
         
         # Exit button
-        exit_btn = pygame.Surface((280, 60), pygame.SRCALPHA)
-        pygame.draw.rect(exit_btn, (100, 100, 120, 180), exit_btn.get_rect(), border_radius=30)
-        pygame.draw.rect(exit_btn, (150, 150, 170), exit_btn.get_rect(), 2, border_radius=30)
+        exit_btn = get_menu_button(280, 60, (100, 100, 120, 180), (150, 150, 170), 2)
         screen.blit(exit_btn, (SCREEN_WIDTH // 2 - 140 + 180, button_y - 30))
         
-        exit_text = font_text.render("ESC - Exit", True, (200, 200, 220))
+        exit_text = get_text(40, "ESC - Exit", (200, 200, 220))
         exit_rect = exit_text.get_rect(center=(SCREEN_WIDTH // 2 + 180, button_y))
         screen.blit(exit_text, exit_rect)
         
@@ -5667,33 +6291,35 @@ def main():
         police.distance = -450  # Police starts 450m behind (9% of track - balanced for 50km race)
         
         # COMPETITIVE MODE: Traffic starts AFTER 1000m for preparation time!
-        traffic_cars = []
-        for i in range(50):  # 50 obstacle cars
-            lane = random.randint(0, 2)
-            # Obstacles start appearing AFTER 1000m (preparation zone)
-            distance = random.randint(1000, FINISH_LINE_DISTANCE - 500)
-            traffic_cars.append(TrafficCar(lane, distance))
+        # 50 obstacle cars; lanes and distances drawn in one batch each (plain ints for the per-frame math)
+        traffic_count = 50
+        traffic_lanes = np.random.randint(0, 3, traffic_count).tolist()
+        # Obstacles start appearing AFTER 1000m (preparation zone)
+        traffic_distances = np.random.randint(1000, FINISH_LINE_DISTANCE - 500 + 1, traffic_count).tolist()
+        traffic_cars = [TrafficCar(lane, distance) for lane, distance in zip(traffic_lanes, traffic_distances)]
         
         # Spawn power-ups along the track - Balanced for strategic gameplay
         powerups = []
         
         # Thief power-ups (defensive theme) - Strategic placement
+        # 12 per side across 50km (every ~4km): one random offset inside each 4km slot, drawn in a batch
+        powerup_slots = np.arange(12) * 4000
         thief_power_types = ['freeze', 'boost', 'shield', 'ghost']
-        for i in range(12):  # 12 thief power-ups across 50km (every ~4km)
-            lane = random.randint(0, 2)
-            # Spread them evenly across the track
-            distance = random.randint(2000 + i * 4000, 2000 + (i + 1) * 4000)
-            power_type = random.choice(thief_power_types)
-            powerups.append(PowerUp(lane, distance, power_type, for_police=False))
+        lanes = np.random.randint(0, 3, 12).tolist()
+        # Spread them evenly across the track
+        distances = (2000 + powerup_slots + np.random.randint(0, 4001, 12)).tolist()
+        type_picks = np.random.randint(0, len(thief_power_types), 12).tolist()
+        powerups.extend(PowerUp(lane, distance, thief_power_types[pick], for_police=False)
+                        for lane, distance, pick in zip(lanes, distances, type_picks))
         
         # Police power-ups (offensive theme) - Strategic placement
         police_power_types = ['spike', 'emp', 'turbo', 'roadblock', 'magnet']
-        for i in range(12):  # 12 police power-ups across 50km (every ~4km)
-            lane = random.randint(0, 2)
-            # Spread them evenly across the track (offset from thief powerups)
-            distance = random.randint(3000 + i * 4000, 3000 + (i + 1) * 4000)
-            power_type = random.choice(police_power_types)
-            powerups.append(PowerUp(lane, distance, power_type, for_police=True))
+        lanes = np.random.randint(0, 3, 12).tolist()
+        # Spread them evenly across the track (offset from thief powerups)
+        distances = (3000 + powerup_slots + np.random.randint(0, 4001, 12)).tolist()
+        type_picks = np.random.randint(0, len(police_power_types), 12).tolist()
+        powerups.extend(PowerUp(lane, distance, police_power_types[pick], for_police=True)
+                        for lane, distance, pick in zip(lanes, distances, type_picks))
         
         camera_offset = 0
         game_over = False
@@ -5715,11 +6341,16 @@ def main():
         emp_timer = 0  # Stagger Slow on thief (30% speed reduction + steering difficulty)
         turbo_timer = 0
         roadblock_timer = 0
+        # Roadblock warning phase: 0.7 seconds = 42 frames (warning shown while timer > 378,
+        # the barrier only exists - drawn and solid - from then on)
+        WARNING_FRAMES = 42
+        WARNING_THRESHOLD = 420 - WARNING_FRAMES
         magnet_timer = 0
         
         # Police power-up effects
         spike_active = False  # Slows down thief when hit
         roadblock_lane = -1  # Which lane has roadblock (-1 = none)
+        roadblock_distance = 0  # Track distance the roadblock was dropped at (fixed once placed)
         
         # Score and combo
         powerups_collected = 0
@@ -5785,6 +6416,15 @@ def main():
             # Apply multiplier to thief's BASE speed (8.0)
             player.max_speed = player.base_max_speed * speed_multiplier
             
+            # Spatial hash of traffic and power-ups for this frame (shared by both AIs)
+            # Traffic doesn't move until both AIs have decided, so build once here
+            traffic_buckets = build_distance_buckets(traffic_cars)
+            powerup_buckets = build_distance_buckets(powerups)
+            # Per-owner uncollected power-ups (AIs still skip ones collected later this frame)
+            powerup_table = build_powerup_table(powerups)
+            traffic_by_lane = group_by_lane(traffic_cars)
+            lane_distances = build_lane_distances(traffic_by_lane)
+            
             # ===== STEP 2: PRIORITY DECISION HIERARCHY =====
             # INTELLIGENT BLENDING of Fuzzy Logic, Minimax, and A* algorithms
             # NO MORE HARD SWITCHING - smooth transitions based on situation priority
@@ -5796,14 +6436,19 @@ def main():
                 ghost_mode=(ghost_timer > 0),
                 fuzzy_controller=fuzzy_controller,
                 minimax_solver=minimax_solver,
-                astar_pathfinder=thief_astar
+                astar_pathfinder=thief_astar,
+                traffic_buckets=traffic_buckets,
+                powerup_buckets=powerup_buckets,
+                powerup_table=powerup_table,
+                traffic_by_lane=traffic_by_lane,
+                lane_distances=lane_distances
             )
             
             # Apply EMP steering difficulty (Stagger Slow effect)
             if emp_timer > 0 and not player.crashed:
                 # Add random steering jitter to make control harder
                 if random.random() < 0.3:  # 30% chance each frame
-                    jitter_amount = random.randint(-3, 3)
+                    jitter_amount = rand_int(-3, 3)
                     player.x = max(ROAD_X + 35, min(ROAD_X + ROAD_WIDTH - 35, player.x + jitter_amount))
             
             # Add exhaust particles for thief
@@ -5811,7 +6456,7 @@ def main():
                 # Calculate screen position for particles
                 player_screen_y = player.distance - camera_offset + SCREEN_HEIGHT // 2
                 particles.append(Particle(
-                    player.x + random.randint(-15, 15),
+                    player.x + rand_int(-15, 15),
                     player_screen_y + 40,
                     (100, 100, 100)
                 ))
@@ -5826,106 +6471,62 @@ def main():
             
             # Update dynamic audio based on gameplay
             audio_manager.update_engine_sound(player.speed, player.ABSOLUTE_MAX_SPEED)
-            police_distance = abs(police.distance - player.distance)
+            police_distance = abs(police.distance - player.distance)  # Also reused by the magnet pull below
             audio_manager.update_police_siren(police_distance)
             
-            # Check power-up collisions for THIEF
+            # Power-up pass: each one can only be collected by its own side, then it animates
+            # (thief and police checks used to be separate walks over the list, plus one for update)
             player_screen_y = SCREEN_HEIGHT // 2
-            for powerup in powerups:
-                # Thief can only collect thief powerups
-                if not powerup.for_police and powerup.check_collision(player.x, player_screen_y, player.width, player.height, camera_offset):
-                    powerups_collected += 1
-                    
-                    # Play powerup sound
-                    audio_manager.play_powerup()
-                    
-                    # Apply thief power-up effect
-                    if powerup.power_type == 'freeze':
-                        freeze_timer = 150  # 2.5 seconds at 60 FPS (Stagger Slow - 40% speed reduction)
-                        # Create stagger particle effect
-                        for _ in range(30):
-                            particles.append(Particle(
-                                police.x + random.randint(-30, 30),
-                                SCREEN_HEIGHT // 2 + random.randint(-30, 30),
-                                (100, 200, 255)
-                            ))
-                    elif powerup.power_type == 'boost':
-                        boost_timer = 120  # 2 seconds (reduced from 4 for tactical use)
-                        audio_manager.play_boost()  # Play boost sound
-                        for _ in range(20):
-                            particles.append(Particle(
-                                player.x + random.randint(-25, 25),
-                                player_screen_y + random.randint(-25, 25),
-                                (255, 200, 0)
-                            ))
-                    elif powerup.power_type == 'shield':
-                        shield_timer = 360  # 6 seconds
-                        for _ in range(25):
-                            particles.append(Particle(
-                                player.x + random.randint(-30, 30),
-                                player_screen_y + random.randint(-30, 30),
-                                (150, 255, 150)
-                            ))
-                    elif powerup.power_type == 'ghost':
-                        ghost_timer = 1  # Ghost now provides 1 collision forgiveness (not a duration)
-                        for _ in range(25):
-                            particles.append(Particle(
-                                player.x + random.randint(-30, 30),
-                                player_screen_y + random.randint(-30, 30),
-                                (200, 150, 255)
-                            ))
-            
-            # Check power-up collisions for POLICE
             police_screen_y = police.distance - camera_offset + SCREEN_HEIGHT // 2
             for powerup in powerups:
+                if not powerup.for_police:
+                    # Thief can only collect thief powerups
+                    if powerup.check_collision(player.x, player_screen_y, player.width, player.height, camera_offset):
+                        powerups_collected += 1
+                        
+                        # Play powerup sound
+                        audio_manager.play_powerup()
+                        
+                        # Apply thief power-up effect
+                        if powerup.power_type == 'freeze':
+                            freeze_timer = 150  # 2.5 seconds at 60 FPS (Stagger Slow - 40% speed reduction)
+                            # Create stagger particle effect
+                            emit_burst(police.x, SCREEN_HEIGHT // 2, (100, 200, 255), 30, 30)
+                        elif powerup.power_type == 'boost':
+                            boost_timer = 120  # 2 seconds (reduced from 4 for tactical use)
+                            audio_manager.play_boost()  # Play boost sound
+                            emit_burst(player.x, player_screen_y, (255, 200, 0), 20, 25)
+                        elif powerup.power_type == 'shield':
+                            shield_timer = 360  # 6 seconds
+                            emit_burst(player.x, player_screen_y, (150, 255, 150), 25, 30)
+                        elif powerup.power_type == 'ghost':
+                            ghost_timer = 1  # Ghost now provides 1 collision forgiveness (not a duration)
+                            emit_burst(player.x, player_screen_y, (200, 150, 255), 25, 30)
                 # Police can only collect police powerups
-                if powerup.for_police and powerup.check_collision(police.x, police_screen_y, police.width, police.height, camera_offset):
+                elif powerup.check_collision(police.x, police_screen_y, police.width, police.height, camera_offset):
                     
                     # Apply police power-up effect
                     if powerup.power_type == 'spike':
                         spike_timer = 240  # 4 seconds - creates spikes that slow thief
-                        for _ in range(25):
-                            particles.append(Particle(
-                                police.x + random.randint(-30, 30),
-                                police_screen_y + random.randint(-30, 30),
-                                (255, 50, 50)
-                            ))
+                        emit_burst(police.x, police_screen_y, (255, 50, 50), 25, 30)
                     elif powerup.power_type == 'emp':
                         emp_timer = 150  # 2.5 seconds - Stagger Slow (30% speed reduction + steering difficulty)
-                        for _ in range(30):
-                            particles.append(Particle(
-                                player.x + random.randint(-40, 40),
-                                SCREEN_HEIGHT // 2 + random.randint(-40, 40),
-                                (255, 100, 255)
-                            ))
+                        emit_burst(player.x, SCREEN_HEIGHT // 2, (255, 100, 255), 30, 40)
                     elif powerup.power_type == 'turbo':
                         turbo_timer = 120  # 2 seconds - police speed boost (reduced from 5 for tactical use)
-                        for _ in range(20):
-                            particles.append(Particle(
-                                police.x + random.randint(-25, 25),
-                                police_screen_y + random.randint(-25, 25),
-                                (255, 150, 0)
-                            ))
+                        emit_burst(police.x, police_screen_y, (255, 150, 0), 20, 25)
                     elif powerup.power_type == 'roadblock':
                         roadblock_timer = 420  # 7 seconds - blocks a lane
                         roadblock_lane = powerup.lane
-                        for _ in range(30):
-                            particles.append(Particle(
-                                ROAD_X + roadblock_lane * LANE_WIDTH + LANE_WIDTH // 2 + random.randint(-40, 40),
-                                SCREEN_HEIGHT // 2 + 200 + random.randint(-30, 30),
-                                (200, 50, 50)
-                            ))
+                        # Dropped 300 ahead of where the thief will be when the warning ends
+                        roadblock_distance = player.distance + 300 + player.speed * WARNING_FRAMES
+                        emit_burst(ROAD_X + roadblock_lane * LANE_WIDTH + LANE_WIDTH // 2, SCREEN_HEIGHT // 2 + 200,
+                                   (200, 50, 50), 30, 40, 30)
                     elif powerup.power_type == 'magnet':
                         magnet_timer = 240  # 4 seconds - pulls thief toward police
-                        for _ in range(25):
-                            particles.append(Particle(
-                                (player.x + police.x) // 2 + random.randint(-30, 30),
-                                SCREEN_HEIGHT // 2 + random.randint(-30, 30),
-                                (150, 150, 255)
-                            ))
-            
-            # Update power-ups
-            for powerup in powerups:
+                        emit_burst((player.x + police.x) // 2, SCREEN_HEIGHT // 2, (150, 150, 255), 25, 30)
+                
+                # Update power-up
                 powerup.update(camera_offset)
             
             # Police AI using intelligent hybrid system with INDEPENDENT speed - affected by Stagger Slow power-up
@@ -5950,31 +6551,34 @@ def main():
                     ghost_mode=False,  # Police doesn't have ghost mode
                     fuzzy_controller=fuzzy_controller,
                     minimax_solver=minimax_solver,
-                    astar_pathfinder=police_astar
+                    astar_pathfinder=police_astar,
+                    traffic_buckets=traffic_buckets,
+                    powerup_buckets=powerup_buckets,
+                    powerup_table=powerup_table,
+                    traffic_by_lane=traffic_by_lane,
+                    lane_distances=lane_distances
                 )
             
             # Apply magnet effect - pull thief toward police with distance-based scaling
-            if magnet_timer > 0 and not player.crashed:
-                # Calculate distance between police and thief
-                distance_apart = abs(police.distance - player.distance)
-                
+            # Out of range (police_distance >= 350, taken at the siren update - neither car has moved since)
+            # there is no pull at all, so the range test gates the whole block
+            max_magnet_range = 350
+            if magnet_timer > 0 and police_distance < max_magnet_range and not player.crashed:
                 # Magnet strength scales with distance: strong when close, weak when far
-                # Formula: pull_force = clamp((350 - distance) / 350, 0, 1)
-                max_magnet_range = 350
-                if distance_apart < max_magnet_range:
-                    # Calculate normalized pull force (0.0 to 1.0)
-                    pull_force = max(0.0, min(1.0, (max_magnet_range - distance_apart) / max_magnet_range))
-                    
-                    # Base pull strength varies from 0.5 to 4.0 based on distance
-                    pull_strength = 0.5 + (pull_force * 3.5)
-                    
-                    # Gradually pull thief toward police's x position
-                    if abs(police.x - player.x) > 10:
-                        if police.x < player.x:
-                            player.x = max(ROAD_X + 35, player.x - pull_strength)
-                        else:
-                            player.x = min(ROAD_X + ROAD_WIDTH - 35, player.x + pull_strength)
-                # If distance > 350, no magnet effect (too far)
+                # pull_force = (350 - distance) / 350, already within (0, 1] inside the range
+                pull_force = (max_magnet_range - police_distance) / max_magnet_range
+                
+                # Base pull strength varies from 0.5 to 4.0 based on distance
+                pull_strength = 0.5 + (pull_force * 3.5)
+                
+                # Gradually pull thief toward police's x position
+                thief_x = player.x
+                police_x = police.x
+                if abs(police_x - thief_x) > 10:
+                    if police_x < thief_x:
+                        player.x = max(ROAD_X + 35, thief_x - pull_strength)
+                    else:
+                        player.x = min(ROAD_X + ROAD_WIDTH - 35, thief_x + pull_strength)
             
             # Apply spike effect - slow down thief
             if spike_timer > 0 and not player.crashed:
@@ -5984,20 +6588,21 @@ def main():
             police.update_crash()  # Update crash state
             
             # Add police exhaust (with stagger slow effect)
-            if freeze_timer > 0:
+            # Skipped while police is off camera - its particles would fall and die out of view
+            # (police_screen_y is final for this frame from here: the crash burst below reuses it)
+            police_screen_y = police.distance - camera_offset + SCREEN_HEIGHT // 2
+            police_on_camera = -PARTICLE_FALL_MARGIN < police_screen_y < SCREEN_HEIGHT + 40
+            if police_on_camera and freeze_timer > 0:
                 # Staggered police - show disorientation particles
                 if random.random() < 0.3:
-                    police_screen_y = police.distance - camera_offset + SCREEN_HEIGHT // 2
                     particles.append(Particle(
-                        police.x + random.randint(-20, 20),
-                        police_screen_y + random.randint(-20, 20),
+                        police.x + rand_int(-20, 20),
+                        police_screen_y + rand_int(-20, 20),
                         (100, 200, 255)
                     ))
-            elif random.random() < 0.2:
-                # Calculate screen position for particles
-                police_screen_y = police.distance - camera_offset + SCREEN_HEIGHT // 2
+            elif police_on_camera and random.random() < 0.2:
                 particles.append(Particle(
-                    police.x + random.randint(-15, 15),
+                    police.x + rand_int(-15, 15),
                     police_screen_y + 40,
                     (80, 80, 100)
                 ))
@@ -6007,84 +6612,86 @@ def main():
                 car.update()
             
             # Check roadblock collision with thief
-            if roadblock_timer > 0 and roadblock_lane >= 0:
-                thief_lane = csp_solver._get_current_lane(player.x)
-                # If thief is in blocked lane and near roadblock position
-                if thief_lane == roadblock_lane and not player.crashed:
-                    # Roadblock is placed ahead of thief
-                    roadblock_distance = player.distance + 300
-                    if abs(player.distance - roadblock_distance) < 100:
-                        # Hit the roadblock!
-                        player.crash()
-                        audio_manager.play_crash()  # Crash sound
-                        for _ in range(20):
-                            particles.append(Particle(
-                                player.x + random.randint(-30, 30),
-                                SCREEN_HEIGHT // 2 + random.randint(-30, 30),
-                                random.choice([RED, ORANGE, YELLOW])
-                            ))
+            if 0 < roadblock_timer <= WARNING_THRESHOLD and roadblock_lane >= 0 and not player.crashed:
+                # Roadblock stays where it was dropped - test the (cheap) distance first,
+                # then whether the thief is in the blocked lane
+                if (abs(player.distance - roadblock_distance) < 100 and
+                        csp_solver._get_current_lane(player.x) == roadblock_lane):
+                    # Hit the roadblock! It's knocked over, so it can't crash the thief twice
+                    player.crash()
+                    audio_manager.play_crash()  # Crash sound
+                    emit_burst(player.x, SCREEN_HEIGHT // 2, ROADBLOCK_HIT_COLORS, 20, 30)
+                    roadblock_timer = 0
+                    roadblock_lane = -1
             
             # Check collisions with traffic cars
-            for car in traffic_cars:
-                # Check player collision with traffic
-                if not player.crashed:
-                    player_dist = math.sqrt((player.x - car.x)**2 + (player.distance - car.distance)**2)
-                    if player_dist < 55:  # Collision threshold
+            # Almost every frame nothing is in reach, so bucket the (moved) traffic and only run the
+            # full in-order pass - which owns the ghost/shield/crash handling - when something is
+            # Crash state is read once here and kept in locals (a crash below clears its flag),
+            # and with both cars already crashed there's nothing to bucket at all
+            player_live = not player.crashed
+            police_live = not police.crashed
+            in_contact = False
+            if player_live or police_live:
+                contact_buckets = build_distance_buckets(traffic_cars, CONTACT_BUCKET_SIZE)
+                in_contact = ((player_live and touches_traffic(player, contact_buckets)) or
+                              (police_live and touches_traffic(police, contact_buckets)))
+            contact_radius_sq = TRAFFIC_CONTACT_RADIUS * TRAFFIC_CONTACT_RADIUS
+            for car in (traffic_cars if in_contact else ()):
+                # Check player collision with traffic (squared distances, no sqrt)
+                if player_live:
+                    dx = player.x - car.x
+                    dd = player.distance - car.distance
+                    if dx * dx + dd * dd < contact_radius_sq:  # Collision threshold
                         # Ghost mode forgives 1 collision
                         if ghost_timer > 0:
                             ghost_timer = 0  # Consume ghost forgiveness
                             # Create ghost effect particles
-                            for _ in range(20):
-                                particles.append(Particle(
-                                    player.x + random.randint(-30, 30),
-                                    SCREEN_HEIGHT // 2 + random.randint(-30, 30),
-                                    (200, 150, 255)
-                                ))
+                            emit_burst(player.x, SCREEN_HEIGHT // 2, (200, 150, 255), 20, 30)
                         # Shield protects from crashes
                         elif shield_timer > 0:
                             # Shield absorbed the hit - create shield spark effect
-                            for _ in range(10):
-                                particles.append(Particle(
-                                    player.x + random.randint(-25, 25),
-                                    SCREEN_HEIGHT // 2 + random.randint(-25, 25),
-                                    (150, 255, 150)
-                                ))
+                            emit_burst(player.x, SCREEN_HEIGHT // 2, (150, 255, 150), 10, 25)
                         else:
                             # No protection - crash!
                             player.crash()
+                            player_live = False
                             audio_manager.play_crash()  # Crash sound
                             # Create crash effect particles
-                            for _ in range(15):
-                                particles.append(Particle(
-                                    player.x + random.randint(-25, 25),
-                                    SCREEN_HEIGHT // 2 + random.randint(-25, 25),
-                                    random.choice([ORANGE, YELLOW, RED])
-                                ))
+                            emit_burst(player.x, SCREEN_HEIGHT // 2, CRASH_COLORS, 15, 25)
                 
                 # Check police collision with traffic
-                if not police.crashed:
-                    police_dist = math.sqrt((police.x - car.x)**2 + (police.distance - car.distance)**2)
-                    if police_dist < 55:  # Collision threshold
+                if police_live:
+                    dx = police.x - car.x
+                    dd = police.distance - car.distance
+                    if dx * dx + dd * dd < contact_radius_sq:  # Collision threshold
                         police.crash()
+                        police_live = False
                         audio_manager.play_crash()  # Crash sound
-                        # Create crash effect particles
-                        for _ in range(15):
-                            police_screen_y = police.distance - camera_offset + SCREEN_HEIGHT // 2
-                            particles.append(Particle(
-                                police.x + random.randint(-25, 25),
-                                police_screen_y + random.randint(-25, 25),
-                                random.choice([ORANGE, YELLOW, RED])
-                            ))
-            
-            # Update particles
-            for particle in particles[:]:
+                        # Create crash effect particles (police hasn't moved since police_screen_y was taken)
+                        emit_burst(police.x, police_screen_y, CRASH_COLORS, 15, 25)
+            
+            # Update particles and compact the live ones in place in the same pass
+            # (no per-particle list.remove, no copy of the list)
+            kept = 0
+            for particle in particles:
                 particle.update()
-                if particle.life <= 0:
-                    particles.remove(particle)
+                if particle.life > 0:
+                    particles[kept] = particle
+                    kept += 1
+            if kept < len(particles):
+                del particles[kept:]
             
             # COMPETITIVE MODE: Dynamically spawn traffic ONLY after 1000m
             # Remove off-screen traffic and add new ones (maintain 50 cars)
-            traffic_cars = [car for car in traffic_cars if car.distance > -500]
+            # Compact in place - no fresh list per frame, and only the dropped tail is freed
+            kept = 0
+            for car in traffic_cars:
+                if car.distance > -500:
+                    traffic_cars[kept] = car
+                    kept += 1
+            if kept < len(traffic_cars):
+                del traffic_cars[kept:]
             while len(traffic_cars) < 50:  # Maintain 50 cars
                 lane = random.randint(0, 2)
                 distance = player.distance + random.randint(1000, 2000)
@@ -6138,50 +6745,36 @@ def main():
             # Finish line
             draw_finish_line(screen, camera_offset, FINISH_LINE_DISTANCE)
             
-            # Particles
-            for particle in particles:
-                particle.draw(screen)
+            # Particles (radius <= 5, so anything more than 10px past the top or bottom edge is invisible)
+            particle_bottom = SCREEN_HEIGHT + 10
+            screen.blits([particle.sprite_blit() for particle in particles
+                          if -10 < particle.y < particle_bottom], False)
             
-            # Power-ups
+            # Power-ups and traffic, culled here with the same on-screen test their draw() uses
+            # so the off-screen majority never pays for the method call
+            half_height = SCREEN_HEIGHT // 2
+            cull_bottom = SCREEN_HEIGHT + 100
             for powerup in powerups:
-                powerup.draw(screen, camera_offset)
+                if not powerup.collected and -100 < half_height - (powerup.distance - camera_offset) < cull_bottom:
+                    powerup.draw(screen, camera_offset)
             
             # Traffic cars
             for car in traffic_cars:
-                car.draw(screen, camera_offset)
+                if -100 < car.distance - camera_offset + half_height < cull_bottom:
+                    car.draw(screen, camera_offset)
             
             # Draw roadblock with warning indicator
             if roadblock_timer > 0 and roadblock_lane >= 0:
                 roadblock_x = ROAD_X + roadblock_lane * LANE_WIDTH + LANE_WIDTH // 2
-                roadblock_distance = player.distance + 300
                 roadblock_screen_y = SCREEN_HEIGHT // 2 - (roadblock_distance - camera_offset)
                 
-                # Warning phase: 0.7 seconds = 42 frames (show warning if timer > 378)
-                WARNING_THRESHOLD = 420 - 42  # Show warning for first 42 frames
-                
                 if roadblock_timer > WARNING_THRESHOLD:
                     # Draw warning indicator (flashing)
                     if (roadblock_timer // 5) % 2 == 0:  # Flash effect
-                        # Warning triangle above roadblock position
-                        warning_size = 40
+                        # Warning triangle (with its "!") centred 100px above the roadblock position
                         warning_y = roadblock_screen_y - 100
-                        
-                        # Yellow warning triangle
-                        pygame.draw.polygon(screen, YELLOW, [
-                            (roadblock_x, warning_y - warning_size // 2),
-                            (roadblock_x - warning_size // 2, warning_y + warning_size // 2),
-                            (roadblock_x + warning_size // 2, warning_y + warning_size // 2)
-                        ])
-                        pygame.draw.polygon(screen, ORANGE, [
-                            (roadblock_x, warning_y - warning_size // 2),
-                            (roadblock_x - warning_size // 2, warning_y + warning_size // 2),
-                            (roadblock_x + warning_size // 2, warning_y + warning_size // 2)
-                        ], 3)
-                        
-                        # Exclamation mark
-                        warning_font = pygame.font.Font(None, 32)
-                        warning_text = warning_font.render("!", True, BLACK)
-                        screen.blit(warning_text, (roadblock_x - 6, warning_y - 10))
+                        sign_offset = WARNING_SIGN_SIZE // 2 + 1
+                        screen.blit(get_warning_sign(), (roadblock_x - sign_offset, int(warning_y) - sign_offset))
                 else:
                     # Draw actual roadblock
                     if -100 < roadblock_screen_y < SCREEN_HEIGHT + 100:
@@ -6196,8 +6789,7 @@ def main():
                                         barrier_width, barrier_height), 3, border_radius=10)
                         
                         # Roadblock icon
-                        roadblock_font = pygame.font.Font(None, 48)
-                        roadblock_icon = roadblock_font.render("🚧", True, WHITE)
+                        roadblock_icon = get_text(48, "🚧", WHITE)
                         screen.blit(roadblock_icon, (roadblock_x - 20, roadblock_screen_y - 20))
             
             # Police and player